@@ -0,0 +1 @@
+"""Performance benchmarks for rFactor Championship Creator"""
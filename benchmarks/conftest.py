@@ -0,0 +1,45 @@
+"""
+Shared fixtures of the benchmark suite.
+
+The benchmarks run against one synthetic installation per session (see
+synthetic_install.py). Set RFACTOR_BENCH_SCALE to change its size, e.g.
+RFACTOR_BENCH_SCALE=5 for 10,000 vehicles or 0.1 for a quick smoke run.
+"""
+
+import os
+
+import pytest
+
+from src.utils import config as config_module
+from src.utils.config import Config
+
+from .synthetic_install import InstallationSpec, build_installation
+
+
+@pytest.fixture(scope="session")
+def installation(tmp_path_factory):
+    """Synthetic installation, configured as the rFactor path of the app."""
+    scale = float(os.environ.get("RFACTOR_BENCH_SCALE", "1"))
+    root = tmp_path_factory.mktemp("rfactor")
+    install = build_installation(root / "rFactor", InstallationSpec().scaled(scale))
+
+    # The config (and the catalog indexes next to it) live in the temp dir
+    previous = config_module._config_instance
+    config_module._config_instance = Config(str(root / "config.json"))
+    config_module._config_instance.set_rfactor_path(str(install.root))
+    config_module._config_instance.set_current_player(install.player)
+    yield install
+    config_module._config_instance = previous
+
+
+@pytest.fixture(scope="session")
+def client(installation):
+    """Test client of the web app, with the catalogs warmed up."""
+    from fastapi.testclient import TestClient
+
+    from src.services.catalog_warmup import get_catalog_warmup
+    from src.web.app import app
+
+    with TestClient(app) as test_client:
+        assert get_catalog_warmup().wait(timeout=300), "catalog warm-up timed out"
+        yield test_client
@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+"""
+Generator of synthetic rFactor installations for benchmarks.
+
+Builds a complete installation tree at a realistic scale:
+
+- GameData/Vehicles: thousands of .veh files in both mod layouts
+    - vanilla:   Vehicles/<Mod>/<Season>/<Class>/<Team>/<car>.veh
+    - All_Teams: Vehicles/<Mod>/All_Teams/<Team>/<car>.veh
+  with the technical files they reference (HDV, TBC, engine/upgrade INI,
+  SFX, CAM), GEN files listing MAS archives, MAS files and liveries.
+- GameData/Locations: .gdb files (with their MAS/AIW) per venue and layout
+- GameData/Talent: .rcd files
+- UserData/<player>: .cch championship files
+- rFm: .rfm mod files
+
+Everything is deterministic for a given InstallationSpec (seeded RNG).
+
+Usage:
+    uv run python -m benchmarks.synthetic_install <output dir> [--scale 1.0]
+"""
+
+import argparse
+import random
+import time
+from dataclasses import dataclass, field, fields, replace
+from pathlib import Path
+from typing import List
+
+from src.generators.rfm_generator import generate_rfm
+from src.models.rfm import PitGroup, RFMod, Season
+from src.utils.file_utils import normalize_name_to_filename
+
+ROOT_DIR = Path(__file__).parent.parent
+
+# Real championship file used as the template of the synthetic ones
+CCH_TEMPLATE = ROOT_DIR / "tests" / "fixtures" / "SRGrandPrix05.cch"
+
+PLAYER = "BenchPlayer"
+
+NATIONALITIES = ["British", "French", "German", "Italian", "Brazilian", "American", "Finnish", "Japanese"]
+MANUFACTURERS = ["Ferrari", "McLaren", "Lotus", "Tyrrell", "Brabham", "March", "Ligier", "Williams"]
+CLASSES = ["GT1", "GT2", "Formula", "Touring"]
+
+VEH_TEMPLATE = """\
+DefaultLivery="{car}.dds"
+HDVehicle="{mod}.hdv"
+Graphics="{gen}"
+Spinner="{mod}_spinner.gen"
+GenString=""
+Upgrades="{mod}_upgrades.ini"
+Sounds="{mod}.sfx"
+Cameras="{mod}.cam"
+HeadPhysics="headphysics.ini"
+Cockpit="{mod}_cockpitinfo.ini"
+AIUpgradeClass="{mod}"
+Number={number}
+Team="{team}"
+FullTeamName="{team} Racing"
+PitGroup="Group{pit}"
+Driver="{driver}"
+Description="{team} #{number}"
+Engine="{manufacturer} V8"
+Manufacturer="{manufacturer}"
+Classes="{vclass} {mod}"
+Category="{category}"
+TeamFounded={founded}
+TeamHeadquarters="England"
+TeamStarts={starts}
+TeamPoles={poles}
+TeamWins={wins}
+TeamWorldChampionships={titles}
+"""
+
+HDV_TEMPLATE = """\
+[GENERAL]
+Rules=0
+GarageDepth=0.550
+TireBrands={mod}_tires
+[ENGINE]
+Normal={mod}_engine.ini
+[DRIVELINE]
+ClutchInertia=0.0100
+"""
+
+TBC_TEMPLATE = """\
+[SLIPCURVE]
+Name="Lat"
+Step=0.008
+[COMPOUND]
+Name="{mod} Soft"
+DryLatLong=(2.05, 2.10)
+"""
+
+GEN_TEMPLATE = """\
+SearchPath=<VEHDIR>
+SearchPath=<VEHDIR>{mod}
+MASFile={mod}.mas
+MASFile={team_mas}
+Instance=SLOT<ID>
+{{
+  MeshFile=<VEHDIR>{mod}_body.gmt CollTarget=True HATTarget=False
+}}
+"""
+
+GDB_TEMPLATE = """\
+{name}
+{{
+  Filter Properties = {filter} SRGrandPrix
+  Attrition = 30
+  TrackName = {name}
+  VenueName = {venue}
+  Layout = {layout}
+  Location = {venue}, Country
+  Length = {length:.3f} km
+  TrackType = Road Course
+  Track Record = Driver, {record:.3f}
+  RacePitKPH = 80
+  NormalPitKPH = 80
+  FormationSpeedKPH = 150
+  SettingsFolder = {name}
+  SettingsCopy = {name}.svm
+}}
+"""
+
+RCD_TEMPLATE = """\
+{name}
+{{
+//Driver Info
+  Nationality={nationality}
+  DateofBirth={day:02d}-{month:02d}-{year}
+  Starts={starts}
+  Poles={poles}
+  Wins={wins}
+  DriversChampionships={titles}
+
+//Driver Stats
+  Aggression={aggression:.2f}
+  Reputation={reputation:.2f}
+  Courtesy={courtesy:.2f}
+  Composure={composure:.2f}
+  Speed={speed:.2f}
+  Crash={crash:.2f}
+  Recovery={recovery:.2f}
+  CompletedLaps={completed_laps:.2f}
+  MinRacingSkill={min_racing_skill:.2f}
+}}
+"""
+
+
+@dataclass
+class InstallationSpec:
+    """Size of a synthetic installation (defaults: 2,000 vehicles)."""
+
+    vanilla_mods: int = 10
+    all_teams_mods: int = 10
+    teams_per_mod: int = 25
+    cars_per_team: int = 4
+    venues: int = 100
+    layouts_per_venue: int = 2
+    talents: int = 1000
+    championships: int = 100
+    rfm_mods: int = 100
+    mas_size: int = 16 * 1024
+    seed: int = 1976
+
+    @property
+    def vehicles(self) -> int:
+        """Number of .veh files."""
+        return (self.vanilla_mods + self.all_teams_mods) * self.teams_per_mod * self.cars_per_team
+
+    def scaled(self, factor: float) -> "InstallationSpec":
+        """
+        Get a spec with the file counts multiplied by factor.
+
+        Mods and venues are scaled, so the tree gets wider, not deeper.
+
+        Args:
+            factor: Scale factor (e.g., 0.1 for quick runs, 5 for 10k vehicles)
+
+        Returns:
+            New InstallationSpec
+        """
+        counts = ("vanilla_mods", "all_teams_mods", "venues", "talents", "championships", "rfm_mods")
+        return replace(self, **{name: max(1, round(getattr(self, name) * factor)) for name in counts})
+
+
+@dataclass
+class SyntheticInstallation:
+    """A generated installation and the files it contains."""
+
+    root: Path
+    spec: InstallationSpec
+    player: str = PLAYER
+    # Paths relative to GameData/Vehicles, per layout
+    vanilla_vehicles: List[str] = field(default_factory=list)
+    all_teams_vehicles: List[str] = field(default_factory=list)
+    # Paths relative to GameData/Locations
+    tracks: List[str] = field(default_factory=list)
+    talents: List[str] = field(default_factory=list)
+    championships: List[str] = field(default_factory=list)
+    rfm_mods: List[str] = field(default_factory=list)
+
+    @property
+    def vehicles_dir(self) -> Path:
+        return self.root / "GameData" / "Vehicles"
+
+    @property
+    def locations_dir(self) -> Path:
+        return self.root / "GameData" / "Locations"
+
+    @property
+    def talent_dir(self) -> Path:
+        return self.root / "GameData" / "Talent"
+
+    @property
+    def userdata_dir(self) -> Path:
+        return self.root / "UserData" / self.player
+
+    @property
+    def rfm_dir(self) -> Path:
+        return self.root / "rFm"
+
+
+def _write(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="windows-1252")
+
+
+def _write_bytes(path: Path, size: int, magic: bytes = b"MAS\x00") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(magic + b"\x00" * max(0, size - len(magic)))
+
+
+def _write_mod_files(mod_dir: Path, mod: str, spec: InstallationSpec) -> None:
+    """Technical files shared by all vehicles of a mod."""
+    _write(mod_dir / f"{mod}.hdv", HDV_TEMPLATE.format(mod=mod))
+    _write(mod_dir / f"{mod}.tbc", TBC_TEMPLATE.format(mod=mod))
+    _write(mod_dir / f"{mod}_engine.ini", "RevLimitRange=(17000, 250, 8)\nFuelConsumption=0.00012\n")
+    _write(mod_dir / f"{mod}_upgrades.ini", "UpgradeType=\"Engine\"\n{\n  Level=\"Stock\"\n}\n")
+    _write(mod_dir / f"{mod}_cockpitinfo.ini", "Cockpit\n{\n  Mirror=1\n}\n")
+    _write(mod_dir / f"{mod}.sfx", f"VS_INSIDE_IGNITION={mod}\\ignition.wav\n")
+    _write(mod_dir / f"{mod}.cam", "CamName=Cockpit\n")
+    _write(mod_dir / f"{mod}_spinner.gen", f"MASFile={mod}.mas\n")
+    _write_bytes(mod_dir / f"{mod}.mas", spec.mas_size)
+
+
+def _write_team(team_dir: Path, mod: str, team: str, gen: str, first_number: int,
+                vclass: str, rng: random.Random, spec: InstallationSpec) -> List[Path]:
+    """Vehicles of one team, with their liveries and the team MAS."""
+    team_mas = f"{team}.mas"
+    _write_bytes(team_dir / team_mas, spec.mas_size)
+    gen_path = team_dir.parent / gen
+    if not gen_path.exists():
+        _write(gen_path, GEN_TEMPLATE.format(mod=mod, team_mas=team_mas))
+
+    paths = []
+    for car_index in range(spec.cars_per_team):
+        number = first_number + car_index
+        car = f"{team}_{number:02d}"
+        manufacturer = rng.choice(MANUFACTURERS)
+        _write(team_dir / f"{car}.veh", VEH_TEMPLATE.format(
+            car=car,
+            mod=mod,
+            gen=gen,
+            number=number,
+            team=f"{mod} {team}",
+            pit=car_index // 2 + 1,
+            driver=f"Driver {mod} {number}",
+            manufacturer=manufacturer,
+            vclass=vclass,
+            category="Open Wheel" if vclass == "Formula" else "Sports Car",
+            founded=rng.randint(1950, 2000),
+            starts=rng.randint(0, 400),
+            poles=rng.randint(0, 50),
+            wins=rng.randint(0, 50),
+            titles=rng.randint(0, 5),
+        ))
+        # Livery and notes, renamed with the vehicle on isolation
+        _write_bytes(team_dir / f"{car}.dds", 1024, magic=b"DDS ")
+        _write(team_dir / f"{car}.txt", f"{car} livery notes\n")
+        paths.append(team_dir / f"{car}.veh")
+    return paths
+
+
+def _build_vehicles(install: SyntheticInstallation, rng: random.Random) -> None:
+    spec = install.spec
+    vehicles_dir = install.vehicles_dir
+    _write(vehicles_dir / "headphysics.ini", "HeadPhysics\n{\n  Mass=5.0\n}\n")
+
+    number = 1
+    for m in range(spec.vanilla_mods):
+        mod = f"Vanilla{m:02d}"
+        mod_dir = vehicles_dir / mod
+        _write_mod_files(mod_dir, mod, spec)
+        for t in range(spec.teams_per_mod):
+            vclass = CLASSES[t % len(CLASSES)]
+            team_dir = mod_dir / f"Season{2000 + m}" / vclass / f"Team{t:02d}"
+            for path in _write_team(team_dir, mod, f"Team{t:02d}", f"{mod}_{vclass}.gen", number, vclass, rng, spec):
+                install.vanilla_vehicles.append(path.relative_to(vehicles_dir).as_posix())
+            number += spec.cars_per_team
+
+    for m in range(spec.all_teams_mods):
+        mod = f"AllTeams{m:02d}"
+        mod_dir = vehicles_dir / mod
+        _write_mod_files(mod_dir, mod, spec)
+        for t in range(spec.teams_per_mod):
+            vclass = CLASSES[m % len(CLASSES)]
+            team_dir = mod_dir / "All_Teams" / f"Team{t:02d}"
+            for path in _write_team(team_dir, mod, f"Team{t:02d}", f"{mod}.gen", number, vclass, rng, spec):
+                install.all_teams_vehicles.append(path.relative_to(vehicles_dir).as_posix())
+            number += spec.cars_per_team
+
+
+def _build_tracks(install: SyntheticInstallation, rng: random.Random) -> None:
+    spec = install.spec
+    for v in range(spec.venues):
+        venue = f"Venue{v:03d}"
+        venue_dir = install.locations_dir / venue
+        _write_bytes(venue_dir / f"{venue}.mas", spec.mas_size)
+        for l in range(spec.layouts_per_venue):
+            layout = ["Long", "Short", "National", "Club"][l % 4]
+            name = f"{venue}_{layout}"
+            path = venue_dir / layout / f"{name}.gdb"
+            _write(path, GDB_TEMPLATE.format(
+                name=name,
+                venue=venue,
+                layout=layout,
+                filter=rng.choice(CLASSES),
+                length=rng.uniform(2.0, 7.0),
+                record=rng.uniform(60.0, 120.0),
+            ))
+            _write(path.with_suffix(".aiw"), "[Waypoint]\ntrack length=4600.0\n")
+            install.tracks.append(path.relative_to(install.locations_dir).as_posix())
+
+
+def _build_talents(install: SyntheticInstallation, rng: random.Random) -> None:
+    for i in range(install.spec.talents):
+        name = f"Talent Driver {i:05d}"
+        _write(install.talent_dir / f"{normalize_name_to_filename(name)}.rcd", RCD_TEMPLATE.format(
+            name=name,
+            nationality=rng.choice(NATIONALITIES),
+            day=rng.randint(1, 28),
+            month=rng.randint(1, 12),
+            year=rng.randint(1940, 1990),
+            starts=rng.randint(0, 200),
+            poles=rng.randint(0, 30),
+            wins=rng.randint(0, 30),
+            titles=rng.randint(0, 3),
+            aggression=rng.uniform(30, 90),
+            reputation=rng.uniform(0, 100),
+            courtesy=rng.uniform(40, 85),
+            composure=rng.uniform(40, 100),
+            speed=rng.uniform(40, 100),
+            crash=rng.uniform(0, 60),
+            recovery=rng.uniform(40, 100),
+            completed_laps=rng.uniform(75, 99),
+            min_racing_skill=rng.uniform(40, 95),
+        ))
+        install.talents.append(name)
+
+
+def _build_championships(install: SyntheticInstallation) -> None:
+    template = CCH_TEMPLATE.read_text(encoding="windows-1252")
+    for i in range(install.spec.championships):
+        name = f"BenchChampionship{i:03d}"
+        _write(install.userdata_dir / f"{name}.cch", template)
+        install.championships.append(name)
+
+
+def _build_rfm_mods(install: SyntheticInstallation, rng: random.Random) -> None:
+    for i in range(install.spec.rfm_mods):
+        name = f"BenchMod{i:03d}"
+        rfm = RFMod(mod_name=f"Bench Mod {i}", vehicle_filter=f"RFTOOL_{name}", max_opponents=19)
+        for s in range(3):
+            scene_order = [
+                Path(track).stem
+                for track in rng.sample(install.tracks, min(len(install.tracks), 12))
+            ]
+            rfm.add_season(Season(
+                name=f"{name} Season {s + 1}",
+                vehicle_filter=f"RFTOOL_{name}",
+                scene_order=scene_order,
+                full_season_name=f"{name} Full Season {s + 1}",
+            ))
+        rfm.pit_group_order = [PitGroup(2, f"Group{g}") for g in range(1, 11)]
+        generate_rfm(rfm, str(install.rfm_dir / f"{name}.rfm"))
+        install.rfm_mods.append(name)
+
+
+def build_installation(root: str | Path, spec: InstallationSpec = InstallationSpec()) -> SyntheticInstallation:
+    """
+    Write a synthetic rFactor installation.
+
+    Args:
+        root: Directory of the installation (created if needed)
+        spec: Size of the installation
+
+    Returns:
+        SyntheticInstallation describing the generated files
+    """
+    install = SyntheticInstallation(root=Path(root), spec=spec)
+    rng = random.Random(spec.seed)
+
+    install.root.mkdir(parents=True, exist_ok=True)
+    (install.root / "rFactor.exe").write_bytes(b"")
+    install.userdata_dir.mkdir(parents=True, exist_ok=True)
+
+    _build_vehicles(install, rng)
+    _build_tracks(install, rng)
+    _build_talents(install, rng)
+    _build_championships(install)
+    _build_rfm_mods(install, rng)
+    return install
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("output", help="Directory of the installation to create")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply the default file counts (default: 1.0)")
+    args = parser.parse_args()
+
+    spec = InstallationSpec().scaled(args.scale)
+    start = time.perf_counter()
+    install = build_installation(args.output, spec)
+    print(f"Synthetic installation written to {install.root} in {time.perf_counter() - start:.1f}s:")
+    for f in fields(InstallationSpec):
+        print(f"  {f.name}: {getattr(spec, f.name)}")
+    print(f"  => {spec.vehicles} vehicles, {len(install.tracks)} tracks, {len(install.talents)} talents")
+
+
+if __name__ == "__main__":
+    main()
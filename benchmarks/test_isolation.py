@@ -0,0 +1,31 @@
+"""Benchmarks of vehicle isolation (copying vehicles into a championship mod)."""
+
+import pytest
+
+from src.services.vehicle_isolation_service import VehicleIsolationService
+
+# Vehicles per isolated championship (a full grid)
+GRID_SIZE = 20
+
+
+@pytest.mark.parametrize("layout", ["vanilla", "all_teams"])
+def test_isolate_vehicles(benchmark, installation, layout):
+    """Isolate a full grid: copy vehicles, assets and shared technical files."""
+    service = VehicleIsolationService(str(installation.root))
+    championship = f"Bench_{layout}"
+    assignments = [
+        {"vehicle_path": path, "driver_name": f"Talent Driver {i:05d}"}
+        for i, path in enumerate(getattr(installation, f"{layout}_vehicles")[:GRID_SIZE])
+    ]
+
+    try:
+        isolated = benchmark.pedantic(
+            service.isolate_vehicles,
+            args=(championship, assignments),
+            setup=lambda: service.cleanup_championship_vehicles(championship),
+            rounds=5,
+        )
+    finally:
+        service.cleanup_championship_vehicles(championship)
+
+    assert len(isolated) == len(assignments)
@@ -0,0 +1,67 @@
+"""Benchmarks of single-file parsing, per file format."""
+
+import pytest
+
+from src.parsers.cch_parser import CCHParser
+from src.parsers.gdb_parser import GdbParser
+from src.parsers.rcd_parser import RCDParser
+from src.parsers.rfm_parser import RFMParser
+from src.parsers.veh_parser import VehParser
+from src.utils.file_utils import normalize_name_to_filename
+
+
+@pytest.mark.parametrize("layout", ["vanilla", "all_teams"])
+def test_parse_veh(benchmark, installation, layout):
+    """Parse one .veh file, resolving its technical files."""
+    path = installation.vehicles_dir / getattr(installation, f"{layout}_vehicles")[0]
+
+    vehicle = benchmark(VehParser().parse_file, path)
+
+    assert vehicle.config.hdvehicle_exists
+
+
+@pytest.mark.parametrize("header_only", [False, True], ids=["full", "header"])
+def test_parse_gdb(benchmark, installation, header_only):
+    """Parse one .gdb file."""
+    path = installation.locations_dir / installation.tracks[0]
+
+    track = benchmark(GdbParser().parse_file, path, header_only=header_only)
+
+    assert track.venue_name
+
+
+def test_parse_rcd(benchmark, installation):
+    """Parse one .rcd talent file."""
+    path = installation.talent_dir / f"{normalize_name_to_filename(installation.talents[0])}.rcd"
+
+    talent = benchmark(RCDParser.parse_file, str(path))
+
+    assert talent.name == installation.talents[0]
+
+
+def test_parse_cch(benchmark, installation):
+    """Parse one .cch championship file (read and parse)."""
+    path = installation.userdata_dir / f"{installation.championships[0]}.cch"
+
+    championship = benchmark(CCHParser.parse_file, str(path))
+
+    assert championship.file_path == str(path)
+
+
+def test_parse_cch_content(benchmark, installation):
+    """Parse the content of one .cch championship file (no I/O)."""
+    path = installation.userdata_dir / f"{installation.championships[0]}.cch"
+    content = path.read_text(encoding="windows-1252")
+
+    championship = benchmark(CCHParser.parse_content, content)
+
+    assert championship is not None
+
+
+def test_parse_rfm(benchmark, installation):
+    """Parse one .rfm mod file."""
+    path = installation.rfm_dir / f"{installation.rfm_mods[0]}.rfm"
+
+    rfm = benchmark(lambda: RFMParser(str(path)).parse())
+
+    assert len(rfm.seasons) == 3
@@ -0,0 +1,43 @@
+"""Benchmarks of the API routes, served from warm catalogs."""
+
+import pytest
+
+# Read-only GET routes; {placeholders} are filled from the installation
+ROUTES = [
+    "/health",
+    "/api/metrics",
+    "/api/config/stats",
+    "/api/talents/",
+    "/api/talents/stats",
+    "/api/talents/stats?by_nationality=true",
+    "/api/talents/{talent}",
+    "/api/talents/search/?q=Driver",
+    "/api/talents/nationalities/?from_existing=true",
+    "/api/vehicles/",
+    "/api/vehicles/classes",
+    "/api/vehicles/manufacturers",
+    "/api/vehicles/stats",
+    "/api/vehicles/{vehicle}",
+    "/api/tracks/",
+    "/api/tracks/venues",
+    "/api/tracks/{track}",
+    "/api/championships/",
+    "/api/championships/{championship}",
+    "/api/championships/rfm/{rfm}",
+]
+
+
+@pytest.mark.parametrize("route", ROUTES)
+def test_route(benchmark, installation, client, route):
+    """GET one route and check it succeeds."""
+    url = route.format(
+        talent=installation.talents[0],
+        vehicle=installation.vanilla_vehicles[0],
+        track=installation.tracks[0],
+        championship=installation.championships[0],
+        rfm=installation.rfm_mods[0],
+    )
+
+    response = benchmark(client.get, url)
+
+    assert response.status_code == 200, response.text[:200]
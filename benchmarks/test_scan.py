@@ -0,0 +1,92 @@
+"""Benchmarks of directory scans and catalog loads."""
+
+import pytest
+
+from src.parsers.gdb_parser import GdbParser
+from src.parsers.veh_parser import VehParser
+from src.services.talent_catalog import TalentCatalog
+from src.services.track_catalog import TrackCatalog
+from src.services.vehicle_catalog import VehicleCatalog
+
+# name -> (catalog class, installation directory attribute, expected items attribute)
+CATALOGS = {
+    "talents": (TalentCatalog, "talent_dir", "talents"),
+    "tracks": (TrackCatalog, "locations_dir", "tracks"),
+    "vehicles": (VehicleCatalog, "vehicles_dir", None),
+}
+
+
+def _expected_items(installation, name: str) -> int:
+    attribute = CATALOGS[name][2]
+    return len(getattr(installation, attribute)) if attribute else installation.spec.vehicles
+
+
+@pytest.mark.parametrize("name", sorted(CATALOGS))
+def test_catalog_cold_scan(benchmark, installation, name):
+    """Cold load: every file is parsed (no index, nothing in memory)."""
+    cls, directory, _ = CATALOGS[name]
+    root = getattr(installation, directory)
+
+    items = benchmark.pedantic(
+        lambda catalog: catalog.items(),
+        setup=lambda: ((cls(root),), {}),
+        rounds=5,
+    )
+
+    assert len(items) == _expected_items(installation, name)
+
+
+@pytest.mark.parametrize("name", sorted(CATALOGS))
+def test_catalog_index_load(benchmark, installation, tmp_path, name):
+    """Restart: items are rebuilt from the persistent index, nothing is parsed."""
+    cls, directory, _ = CATALOGS[name]
+    root = getattr(installation, directory)
+    index_path = tmp_path / f"{name}_index.json"
+    cls(root, index_path).items()
+
+    items = benchmark.pedantic(
+        lambda catalog: catalog.items(),
+        setup=lambda: ((cls(root, index_path),), {}),
+        rounds=5,
+    )
+
+    assert len(items) == _expected_items(installation, name)
+
+
+@pytest.mark.parametrize("name", sorted(CATALOGS))
+def test_catalog_rescan_unchanged(benchmark, installation, name):
+    """Forced re-scan of an unchanged directory (stat walk, no parsing)."""
+    cls, directory, _ = CATALOGS[name]
+    catalog = cls(getattr(installation, directory))
+    catalog.items()
+
+    changed = benchmark(catalog.refresh)
+
+    assert not changed
+
+
+@pytest.mark.parametrize("name", sorted(CATALOGS))
+def test_catalog_hit(benchmark, installation, name):
+    """Loaded catalog: fingerprint check and copy of the item list."""
+    cls, directory, _ = CATALOGS[name]
+    catalog = cls(getattr(installation, directory))
+    catalog.items()
+
+    items = benchmark(catalog.items)
+
+    assert len(items) == _expected_items(installation, name)
+
+
+def test_veh_parser_scan_directory(benchmark, installation):
+    """VehParser.scan_directory over the whole Vehicles tree."""
+    vehicles = benchmark.pedantic(VehParser().scan_directory, args=(installation.vehicles_dir,), rounds=3)
+
+    assert len(vehicles) == installation.spec.vehicles
+
+
+@pytest.mark.parametrize("header_only", [False, True], ids=["full", "header"])
+def test_gdb_parser_scan_directory(benchmark, installation, header_only):
+    """GdbParser.scan_directory over the whole Locations tree."""
+    tracks = benchmark(GdbParser().scan_directory, installation.locations_dir, header_only=header_only)
+
+    assert len(tracks) == len(installation.tracks)
@@ -0,0 +1,55 @@
+"""Benchmarks of the JSON serialization of a large vehicle list."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from typing import List
+
+from src.models.vehicle import Vehicle, VehicleTeamInfo
+from src.web.fast_json import FastJSONResponse
+from src.web.routes.vehicles import _vehicle_to_list_item
+from src.web.schemas.vehicle import VehicleListItemSchema
+
+ITEMS = 10_000
+
+
+@pytest.fixture(scope="module")
+def serialization_client():
+    """App serving the same 10,000 vehicles through both serialization paths."""
+    vehicles = [
+        Vehicle(
+            number=index,
+            description=f"Bench Team #{index}",
+            manufacturer=f"Make{index % 12:02d}",
+            classes=f"GT{index % 3 + 1} Bench",
+            team_info=VehicleTeamInfo(team=f"Bench Team {index % 40}", driver=f"Driver {index:05d}"),
+            file_path=f"/rFactor/GameData/Vehicles/Bench/Team{index % 40}/Car{index:05d}.veh",
+            file_name=f"Car{index:05d}.veh",
+            relative_path=f"Bench/Team{index % 40}/Car{index:05d}.veh",
+        )
+        for index in range(ITEMS)
+    ]
+
+    app = FastAPI()
+
+    @app.get("/default", response_model=List[VehicleListItemSchema])
+    async def default_path():
+        # Pydantic objects, validated and encoded by FastAPI (the previous path)
+        return [VehicleListItemSchema(**_vehicle_to_list_item(v)) for v in vehicles]
+
+    @app.get("/fast", response_model=List[VehicleListItemSchema])
+    async def fast_path():
+        return FastJSONResponse([_vehicle_to_list_item(v) for v in vehicles])
+
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.mark.benchmark(group="serialize_10k_vehicles")
+@pytest.mark.parametrize("path", ["default", "fast"])
+def test_serialize_vehicle_list(benchmark, serialization_client, path):
+    """GET 10,000 vehicle list items, serialized by FastAPI or by FastJSONResponse."""
+    response = benchmark(serialization_client.get, f"/{path}")
+
+    assert response.status_code == 200
+    assert len(response.json()) == ITEMS
@@ -9,7 +9,7 @@ echo.
 
 cd frontend
 
-echo [1/2] Installing dependencies...
+echo [1/3] Installing dependencies...
 call npm install
 if errorlevel 1 (
     echo [ERROR] Failed to install npm dependencies
@@ -17,7 +17,7 @@ if errorlevel 1 (
     exit /b 1
 )
 
-echo [2/2] Building React app...
+echo [2/3] Building React app...
 call npm run build
 if errorlevel 1 (
     echo [ERROR] Failed to build React app
@@ -27,6 +27,14 @@ if errorlevel 1 (
 
 cd ..
 
+echo [3/3] Precompressing assets (.gz, .br)...
+python scripts\precompress_assets.py frontend\dist
+if errorlevel 1 (
+    echo [ERROR] Failed to precompress the build
+    pause
+    exit /b 1
+)
+
 echo.
 echo ====================================================
 echo    Frontend build completed!
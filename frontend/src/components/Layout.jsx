@@ -1,8 +1,12 @@
 import { Outlet } from 'react-router-dom'
 import Navigation from './Navigation'
 import { motion } from 'framer-motion'
+import { useServerEvents } from '../services/events'
 
 export default function Layout() {
+  // Refetch data changed on the server (see /api/events)
+  useServerEvents()
+
   return (
     <div className="min-h-screen flex flex-col">
       <Navigation />
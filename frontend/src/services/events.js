@@ -0,0 +1,54 @@
+import { useEffect } from 'react'
+import { useQueryClient } from '@tanstack/react-query'
+
+// Query keys to refetch when some data changes on the server
+const QUERY_KEYS = {
+  talents: ['talents', 'talent', 'nationalities'],
+  vehicles: ['vehicles', 'vehicle'],
+  tracks: ['tracks', 'track'],
+  championships: ['championships', 'championship', 'championship-rfm'],
+}
+
+// Catalog names of the "catalog" events -> data names
+const CATALOGS = {
+  talents: 'talents',
+  vehicles: 'vehicles',
+  locations: 'tracks',
+}
+
+/**
+ * Subscribe to the server-sent events of /api/events and refetch the
+ * queries whose data changed (catalogs updated on disk, API writes,
+ * finished imports and championship creations), instead of polling.
+ */
+export function useServerEvents() {
+  const queryClient = useQueryClient()
+
+  useEffect(() => {
+    if (typeof EventSource === 'undefined') return undefined
+
+    const source = new EventSource('/api/events')
+
+    const invalidate = (names) => {
+      names.forEach((name) => {
+        (QUERY_KEYS[name] || []).forEach((key) => queryClient.invalidateQueries({ queryKey: [key] }))
+      })
+    }
+    const listen = (type, handler) => {
+      source.addEventListener(type, (event) => handler(JSON.parse(event.data)))
+    }
+
+    listen('catalog', (data) => invalidate([CATALOGS[data.catalog]]))
+    listen('changed', (data) => invalidate(data.tags))
+    listen('import', (data) => {
+      if (data.status === 'completed' && !data.validate_only) invalidate(['talents'])
+    })
+    listen('isolation', (data) => {
+      if (data.status === 'completed') invalidate(['vehicles', 'championships'])
+    })
+    // Events were missed (server restarted or page in background too long)
+    listen('resync', () => queryClient.invalidateQueries())
+
+    return () => source.close()
+  }, [queryClient])
+}
@@ -39,6 +39,8 @@ hiddenimports += collect_submodules('pydantic')
 hiddenimports += collect_submodules('jinja2')
 hiddenimports += collect_submodules('starlette')
 hiddenimports += ['uvicorn.logging', 'uvicorn.loops', 'uvicorn.loops.auto', 'uvicorn.protocols', 'uvicorn.protocols.http', 'uvicorn.protocols.http.auto', 'uvicorn.protocols.websockets', 'uvicorn.protocols.websockets.auto', 'uvicorn.lifespan', 'uvicorn.lifespan.on']
+# Imported on first use through optional_import, which PyInstaller can't see
+hiddenimports += ['numpy', 'orjson']
 
 # Add data files from packages
 datas += collect_data_files('fastapi')
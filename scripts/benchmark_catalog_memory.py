@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Measure the memory footprint of an in-memory vehicle catalog.
+
+Builds a synthetic GameData/Vehicles tree (default: 10,000 vehicles spread
+over a few mods that share their technical files), parses it with VehParser
+and measures the deep size of the parsed vehicles, counting shared objects
+such as interned strings once. For comparison, the same vehicles are copied
+into plain (non-slotted) dataclasses with private string copies, which is
+how they were stored before the models were slotted and the parser interned
+repeated values.
+
+Usage:
+    uv run python scripts/benchmark_catalog_memory.py [--vehicles 10000]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from dataclasses import fields, is_dataclass, make_dataclass
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from src.models.vehicle import Vehicle, VehicleConfig, VehicleTeamInfo
+from src.parsers.veh_parser import VehParser
+
+MODS = 5
+TEAMS_PER_MOD = 20
+CLASSES = ["F1_1976", "F2_1976", "GT", "Touring", "Prototype"]
+MANUFACTURERS = ["Ferrari", "McLaren", "Lotus", "Tyrrell", "Brabham", "March"]
+
+VEH_TEMPLATE = """\
+DefaultLivery="{car}.dds"
+HDVehicle="{mod}.hdv"
+Graphics="{mod}.gen"
+Spinner="{mod}_spinner.gen"
+GenString=""
+Upgrades="{mod}_upgrades.ini"
+Sounds="{mod}.sfx"
+Cameras="{mod}.cam"
+HeadPhysics="headphysics.ini"
+Cockpit="{mod}_cockpitinfo.ini"
+AIUpgradeClass="{mod}"
+Number={number}
+Team="{team}"
+FullTeamName="{team} Racing"
+PitGroup="Group{pit}"
+Driver="Driver {number}"
+Description="{team} #{number}"
+Engine="{manufacturer} V8"
+Manufacturer="{manufacturer}"
+Classes="{vclass}"
+Category="Open Wheel"
+TeamFounded=1970
+TeamHeadquarters="England"
+TeamStarts=100
+TeamPoles=10
+TeamWins=5
+TeamWorldChampionships=1
+"""
+
+
+def build_tree(root: Path, count: int) -> list[Path]:
+    """Write count synthetic .veh files (and the shared files they reference)."""
+    vehicles_dir = root / "GameData" / "Vehicles"
+    paths = []
+    for n in range(count):
+        mod_index = n % MODS
+        mod = f"Mod{mod_index}"
+        team = f"Team{(n // MODS) % TEAMS_PER_MOD}"
+        team_dir = vehicles_dir / mod / team
+        if not team_dir.exists():
+            team_dir.mkdir(parents=True)
+        mod_dir = vehicles_dir / mod
+        for shared in (f"{mod}.hdv", f"{mod}.gen", f"{mod}.sfx", f"{mod}.cam"):
+            shared_path = mod_dir / shared
+            if not shared_path.exists():
+                shared_path.write_text("", encoding="windows-1252")
+
+        car = f"{team}_{n}"
+        path = team_dir / f"{car}.veh"
+        path.write_text(VEH_TEMPLATE.format(
+            car=car,
+            mod=mod,
+            team=f"{mod} {team}",
+            number=n,
+            pit=n % 10 + 1,
+            manufacturer=MANUFACTURERS[n % len(MANUFACTURERS)],
+            vclass=f"{CLASSES[mod_index]} {mod}",
+        ), encoding="windows-1252")
+        paths.append(path)
+    return paths
+
+
+def _plain_class(cls, cache: dict):
+    """Get a non-slotted dataclass with the same fields as cls."""
+    if cls not in cache:
+        cache[cls] = make_dataclass(f"Plain{cls.__name__}", [f.name for f in fields(cls)])
+    return cache[cls]
+
+
+def to_baseline(obj, cache: dict):
+    """Deep-copy a model into plain dataclasses with unshared strings."""
+    if is_dataclass(obj):
+        plain = _plain_class(type(obj), cache)
+        return plain(*(to_baseline(getattr(obj, f.name), cache) for f in fields(obj)))
+    if isinstance(obj, str) and obj:
+        # A new string object, as if each file had been parsed independently
+        return (obj + ".")[:-1]
+    return obj
+
+
+def deep_size(root) -> int:
+    """Total size of an object graph, counting each object once."""
+    seen = set()
+    total = 0
+    stack = [root]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, (list, tuple)):
+            stack.extend(obj)
+        elif isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif is_dataclass(obj):
+            stack.extend(getattr(obj, f.name) for f in fields(obj))
+            if hasattr(obj, "__dict__"):
+                # The per-instance attribute dict of non-slotted classes
+                total += sys.getsizeof(obj.__dict__)
+    return total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--vehicles", type=int, default=10_000, help="Number of vehicles (default: 10000)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"Writing {args.vehicles} synthetic vehicles...")
+        paths = build_tree(Path(tmp), args.vehicles)
+        veh_parser = VehParser()
+        contents = [(p.read_text(encoding="windows-1252"), str(p)) for p in paths]
+
+        start = time.perf_counter()
+        vehicles = [veh_parser.parse_content(c, p) for c, p in contents]
+        print(f"Parsed in {time.perf_counter() - start:.1f}s")
+
+    plain_classes: dict = {}
+    current = deep_size(vehicles)
+    baseline = deep_size([to_baseline(v, plain_classes) for v in vehicles])
+
+    count = len(vehicles)
+    print()
+    print(f"{'representation':<32}{'total':>12}{'per vehicle':>14}")
+    print(f"{'plain dataclasses':<32}{baseline / 1024 / 1024:>10.1f}MB{baseline / count:>12.0f} B")
+    print(f"{'slotted + interned (current)':<32}{current / 1024 / 1024:>10.1f}MB{current / count:>12.0f} B")
+    print(f"\nSaved {(1 - current / baseline) * 100:.0f}% "
+          f"({(baseline - current) / 1024 / 1024:.1f}MB for {count} vehicles)")
+
+    # Sanity check: slotted instances have no per-instance __dict__
+    assert not hasattr(vehicles[0], "__dict__")
+    assert all(not hasattr(cls(), "__dict__") for cls in (Vehicle, VehicleConfig, VehicleTeamInfo))
+
+
+if __name__ == "__main__":
+    main()
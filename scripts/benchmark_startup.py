@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Measure the import time of the web application (cold start budget).
+
+Runs `python -X importtime -c "import src.web.app"` in fresh interpreters,
+reports the total import time and the slowest modules, and checks that the
+modules deferred to first use (NumPy, Jinja2, the championship creator)
+are not imported at startup.
+
+Exits with status 1 when --budget-ms is exceeded or when a deferred module
+is imported eagerly, so the script can guard the startup time in CI.
+
+Usage:
+    uv run python scripts/benchmark_startup.py [--runs 5] [--top 15] [--budget-ms 1500]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent
+
+APP_MODULE = "src.web.app"
+
+# Modules that must only be imported on first use
+DEFERRED_MODULES = [
+    "numpy",
+    "jinja2",
+    "src.services.championship_creator",
+    "src.services.vehicle_isolation_service",
+]
+
+
+def run_importtime() -> tuple[dict, float]:
+    """
+    Import the app once with -X importtime in a fresh interpreter.
+
+    Returns:
+        Tuple of ({module: (self_us, cumulative_us)}, wall time in seconds)
+    """
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {APP_MODULE}"],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+    )
+    wall = time.perf_counter() - start
+    if result.returncode != 0:
+        print(result.stderr.strip().splitlines()[-1], file=sys.stderr)
+        sys.exit(f"Importing {APP_MODULE} failed")
+
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, self_us, cumulative_us, name = (part.strip() for part in line.replace("import time:", "|").split("|"))
+        modules[name] = (int(self_us), int(cumulative_us))
+    return modules, wall
+
+
+def eager_deferred_modules() -> list[str]:
+    """Get the deferred modules that are imported by the app at startup."""
+    code = (
+        f"import json, sys, {APP_MODULE}; "
+        f"print(json.dumps([m for m in {DEFERRED_MODULES!r} if m in sys.modules]))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT_DIR, capture_output=True, text=True)
+    if result.returncode != 0:
+        sys.exit(f"Importing {APP_MODULE} failed")
+    return json.loads(result.stdout)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5, help="Number of cold imports (default: 5)")
+    parser.add_argument("--top", type=int, default=15, help="Number of slowest modules to show (default: 15)")
+    parser.add_argument("--budget-ms", type=float, default=None, help="Fail if the app import takes longer")
+    args = parser.parse_args()
+
+    runs = [run_importtime() for _ in range(args.runs)]
+    # The fastest run is the least disturbed by the rest of the machine
+    modules, wall = min(runs, key=lambda run: run[0][APP_MODULE][1])
+    total_ms = modules[APP_MODULE][1] / 1000
+
+    print(f"{APP_MODULE} import: {total_ms:.0f} ms (best of {args.runs}, wall {wall * 1000:.0f} ms with -X importtime)")
+    own = sum(self_us for name, (self_us, _) in modules.items() if name == "src" or name.startswith("src.")) / 1000
+    print(f"  of which application modules (self time): {own:.0f} ms")
+
+    print("\nSlowest modules (cumulative):")
+    print(f"{'module':<50}{'self ms':>10}{'total ms':>10}")
+    slowest = sorted(modules.items(), key=lambda item: item[1][1], reverse=True)[:args.top]
+    for name, (self_us, cumulative_us) in slowest:
+        print(f"{name:<50}{self_us / 1000:>10.1f}{cumulative_us / 1000:>10.1f}")
+
+    failed = False
+    eager = eager_deferred_modules()
+    if eager:
+        failed = True
+        print(f"\nFAIL: imported at startup but should be deferred: {', '.join(eager)}")
+    else:
+        print(f"\nDeferred modules not imported at startup: {', '.join(DEFERRED_MODULES)}")
+
+    if args.budget_ms is not None:
+        if total_ms > args.budget_ms:
+            failed = True
+            print(f"FAIL: {total_ms:.0f} ms exceeds the {args.budget_ms:.0f} ms budget")
+        else:
+            print(f"Within the {args.budget_ms:.0f} ms budget")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
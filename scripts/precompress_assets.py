@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Precompress the React build for the static file server.
+
+Writes a .gz (and a .br when the brotli package is installed) next to each
+compressible file of frontend/dist, e.g. assets/index-3f2a1b.js.gz. The app
+serves these variants to browsers that accept them (see
+src/web/static_files.py), so the assets are compressed once, at the best
+compression level, instead of on every request.
+
+Variants that wouldn't save at least 5% are not written, and stale
+variants are rewritten. Run it after every `npm run build`
+(build_frontend.bat does).
+
+Usage:
+    python scripts/precompress_assets.py [frontend/dist] [--min-size 1024]
+"""
+
+import argparse
+import gzip
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent
+DEFAULT_BUILD_DIR = ROOT_DIR / "frontend" / "dist"
+
+# Text formats; images and fonts of the build are already compressed
+COMPRESSIBLE_SUFFIXES = {".js", ".mjs", ".css", ".html", ".svg", ".json", ".map", ".txt", ".xml", ".ico"}
+
+# Variants must be smaller than this fraction of the original
+MAX_RATIO = 0.95
+
+
+def compress_gzip(data: bytes) -> bytes:
+    """Compress with gzip at the maximum level (reproducible: no mtime)."""
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def load_brotli():
+    """Get the brotli compressor, or None if the package isn't installed."""
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return lambda data: brotli.compress(data, quality=11)
+
+
+def precompress(build_dir: Path, min_size: int = 1024) -> dict:
+    """
+    Write the precompressed variants of the files of a build directory.
+
+    Args:
+        build_dir: Build output directory (e.g., frontend/dist)
+        min_size: Files smaller than this (in bytes) are skipped
+
+    Returns:
+        Statistics per variant suffix: files written, original and
+        compressed sizes
+    """
+    compressors = {".gz": compress_gzip}
+    brotli_compress = load_brotli()
+    if brotli_compress is not None:
+        compressors[".br"] = brotli_compress
+
+    stats = {suffix: {"files": 0, "original_bytes": 0, "compressed_bytes": 0} for suffix in compressors}
+    for path in sorted(build_dir.rglob("*")):
+        if not path.is_file() or path.suffix.lower() not in COMPRESSIBLE_SUFFIXES:
+            continue
+        data = path.read_bytes()
+        if len(data) < min_size:
+            continue
+
+        for suffix, compress in compressors.items():
+            variant = path.with_name(path.name + suffix)
+            compressed = compress(data)
+            if len(compressed) > len(data) * MAX_RATIO:
+                # Not worth it: make sure no stale variant is served instead
+                variant.unlink(missing_ok=True)
+                continue
+            variant.write_bytes(compressed)
+            stats[suffix]["files"] += 1
+            stats[suffix]["original_bytes"] += len(data)
+            stats[suffix]["compressed_bytes"] += len(compressed)
+
+    return stats
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Precompress the React build (.gz, .br)")
+    parser.add_argument("build_dir", nargs="?", default=str(DEFAULT_BUILD_DIR), help="Build directory")
+    parser.add_argument("--min-size", type=int, default=1024, help="Skip files smaller than this (bytes)")
+    args = parser.parse_args()
+
+    build_dir = Path(args.build_dir)
+    if not build_dir.is_dir():
+        print(f"Build directory not found: {build_dir} (run `npm run build` first)")
+        return 1
+
+    if load_brotli() is None:
+        print("brotli is not installed: writing .gz variants only (pip install brotli for .br)")
+
+    stats = precompress(build_dir, min_size=args.min_size)
+    for suffix, variant_stats in stats.items():
+        print(
+            f"{suffix}: {variant_stats['files']} files, "
+            f"{variant_stats['original_bytes'] / 1024:.0f} KiB -> {variant_stats['compressed_bytes'] / 1024:.0f} KiB"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,8 +4,10 @@ Generator for rFactor Talent files (.rcd).
 Creates .rcd files from Talent objects.
 """
 
+from typing import List
+
 from ..models.talent import Talent
-from ..utils.file_utils import write_rfactor_file
+from ..utils.file_utils import RFACTOR_ENCODING, RFACTOR_LINE_ENDING, write_rfactor_file
 
 
 class RCDGenerator:
@@ -37,6 +39,30 @@ class RCDGenerator:
         Returns:
             File content as string
         """
+        return '\n'.join(RCDGenerator._lines(talent))
+
+    @staticmethod
+    def to_bytes(talent: Talent) -> bytes:
+        """
+        Convert a Talent object to encoded .rcd file content.
+
+        Lines are joined with CRLF directly, so the result can be written
+        as-is without normalizing line endings.
+
+        Args:
+            talent: Talent object to convert
+
+        Returns:
+            File content encoded in cp1252 with CRLF line endings
+
+        Raises:
+            UnicodeEncodeError: If the talent contains characters cp1252 can't encode
+        """
+        return RFACTOR_LINE_ENDING.join(RCDGenerator._lines(talent)).encode(RFACTOR_ENCODING)
+
+    @staticmethod
+    def _lines(talent: Talent) -> List[str]:
+        """Build the lines of a .rcd file (without line endings)."""
         lines = []
 
         # Name (first line)
@@ -77,4 +103,4 @@ class RCDGenerator:
         # Empty line at end
         lines.append('')
 
-        return '\n'.join(lines)
+        return lines
@@ -5,6 +5,8 @@ This module serves as the executable entry point when the application is package
 It starts the web server and opens the browser automatically.
 """
 
+import argparse
+import multiprocessing
 import sys
 import os
 import webbrowser
@@ -15,6 +17,8 @@ import uvicorn
 import logging
 from datetime import datetime
 import socket
+import urllib.error
+import urllib.request
 
 
 def setup_logging():
@@ -95,22 +99,153 @@ def find_free_port(start_port=5000, max_attempts=10):
     return None
 
 
-def open_browser(port=5000, delay=3):
+def wait_until_ready(port=5000, timeout=120.0, interval=0.25):
     """
-    Open the default web browser after a delay.
+    Wait until the server answers /ready (catalogs loaded).
 
     Args:
         port: Port number where the server is running
-        delay: Seconds to wait before opening browser
+        timeout: Maximum number of seconds to wait
+        interval: Seconds between two checks
+
+    Returns:
+        bool: True if the server is ready, False if the timeout expired
+    """
+    ready_url = f"http://127.0.0.1:{port}/ready"
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(ready_url, timeout=2) as response:
+                if response.status == 200:
+                    return True
+        except (urllib.error.URLError, OSError):
+            # Server not listening yet, or 503 while the catalogs load
+            pass
+        time.sleep(interval)
+    return False
+
+
+def open_browser(port=5000, timeout=120.0):
     """
-    time.sleep(delay)
+    Open the default web browser once the server is ready.
+
+    Args:
+        port: Port number where the server is running
+        timeout: Maximum number of seconds to wait for the catalogs to load
+                 (the browser is opened anyway afterwards)
+    """
+    logger = logging.getLogger(__name__)
+    start = time.monotonic()
+    if wait_until_ready(port, timeout):
+        logger.info(f"Server ready in {time.monotonic() - start:.1f}s")
+    else:
+        logger.warning(f"Server not ready after {timeout:.0f}s, opening the browser anyway")
+
     url = f"http://localhost:{port}"
     print(f"\nOpening browser at {url}...")
     webbrowser.open(url)
 
 
+def profile_startup(logger):
+    """
+    Import the app and load the catalogs under cProfile.
+
+    The catalogs are loaded in the main thread (cProfile only sees the
+    calling thread) so the first scan is part of the profile; the background
+    warm-up of the server then finds them already loaded. The statistics are
+    written to logs/profile_startup_<timestamp>.prof and the slowest
+    functions are logged.
+
+    Args:
+        logger: Application logger
+
+    Returns:
+        The FastAPI app
+    """
+    from src.utils.profiler import profile_to_file
+
+    def startup():
+        from src.web.app import app
+        from src.services.catalog_warmup import CATALOGS
+        from src.utils.config import get_config
+
+        config = get_config()
+        if config.is_configured():
+            for name, factory in CATALOGS:
+                try:
+                    factory(Path(config.get_rfactor_path())).ensure_fresh()
+                except Exception:
+                    logger.exception(f"Failed to load the {name} catalog")
+        return app
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    output_path = Path("logs") / f"profile_startup_{timestamp}.prof"
+    start = time.perf_counter()
+    app, summary = profile_to_file(startup, output_path)
+    logger.info(f"Startup profiled in {time.perf_counter() - start:.2f}s, statistics saved to {output_path}")
+    logger.info(f"Slowest functions (cumulative):\n{summary}")
+    return app
+
+
+def run_workers(host, port, workers, logger):
+    """
+    Run the server with several worker processes.
+
+    This process becomes the catalog coordinator: it scans the installation
+    and publishes the catalogs to the shared store (cache/catalogs.sqlite),
+    which the workers read instead of scanning (see
+    src/services/catalog_store.py).
+
+    Args:
+        host: Host address to listen on
+        port: Port number to listen on
+        workers: Number of worker processes
+        logger: Application logger
+    """
+    from src.services.catalog_coordinator import get_catalog_coordinator
+    from src.services.catalog_store import COORDINATOR, ROLE_ENV, WORKER, set_catalog_role
+
+    set_catalog_role(COORDINATOR)
+    # Inherited by the worker processes
+    os.environ[ROLE_ENV] = WORKER
+
+    coordinator = get_catalog_coordinator()
+    coordinator.start()
+    logger.info(f"Catalog coordinator started, starting {workers} workers")
+    try:
+        # The workers import the app themselves
+        uvicorn.run(
+            "src.web.app:app",
+            host=host,
+            port=port,
+            workers=workers,
+            log_level="info",
+            access_log=True,
+        )
+    finally:
+        coordinator.stop()
+
+
 def main():
     """Main entry point for the application."""
+    parser = argparse.ArgumentParser(description="rFactor Championship Creator")
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profile the startup and the first catalog scan (statistics saved in logs/)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of server processes (catalogs are scanned once and shared between them)",
+    )
+    args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.profile and args.workers > 1:
+        parser.error("--profile requires a single worker")
+
     print("=" * 70)
     print("    rFactor Championship Creator")
     print("=" * 70)
@@ -187,8 +322,8 @@ def main():
 
         logger.info(f"Starting server on {host}:{port}")
 
-        # Start browser in a separate thread
-        browser_thread = threading.Thread(target=open_browser, args=(port, 3))
+        # Open the browser once the catalogs are loaded (see /ready)
+        browser_thread = threading.Thread(target=open_browser, args=(port,))
         browser_thread.daemon = True
         browser_thread.start()
 
@@ -200,8 +335,15 @@ def main():
             if str(internal_dir) not in sys.path:
                 sys.path.insert(0, str(internal_dir))
 
+        if args.workers > 1:
+            run_workers(host, port, args.workers, logger)
+            return
+
         # Import the app
-        from src.web.app import app
+        if args.profile:
+            app = profile_startup(logger)
+        else:
+            from src.web.app import app
 
         logger.info("App imported successfully")
 
@@ -236,4 +378,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # The worker processes of --workers re-run the executable when frozen
+    multiprocessing.freeze_support()
     main()
@@ -4,11 +4,12 @@ Data models for rFactor Talent (driver) files (.rcd).
 A Talent represents a driver with personal information and racing statistics.
 """
 
+import sys
 from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class TalentPersonalInfo:
     """Personal information about a driver."""
 
@@ -20,7 +21,10 @@ class TalentPersonalInfo:
     drivers_championships: int = 0
 
     def __post_init__(self):
-        """Validate personal info data."""
+        """Validate personal info data and intern the nationality."""
+        # Few distinct nationalities across thousands of talents
+        if isinstance(self.nationality, str):
+            self.nationality = sys.intern(self.nationality)
         if self.starts < 0:
             raise ValueError("Starts must be >= 0")
         if self.poles < 0:
@@ -31,7 +35,7 @@ class TalentPersonalInfo:
             raise ValueError("Drivers championships must be >= 0")
 
 
-@dataclass
+@dataclass(slots=True)
 class TalentStats:
     """Racing statistics for a driver.
 
@@ -70,7 +74,7 @@ class TalentStats:
                 )
 
 
-@dataclass
+@dataclass(slots=True)
 class Talent:
     """
     Represents a rFactor driver (Talent).
@@ -8,7 +8,7 @@ from dataclasses import dataclass, field
 from typing import Dict
 
 
-@dataclass
+@dataclass(slots=True)
 class Track:
     """Represents an rFactor track (.gdb file)."""
 
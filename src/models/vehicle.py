@@ -2,13 +2,15 @@
 Vehicle data model for rFactor .veh files.
 
 Represents a vehicle with its configuration, team information, and metadata.
+The classes are slotted because the vehicle catalog keeps every vehicle of
+the installation in memory.
 """
 
 from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class VehicleTeamInfo:
     """Team and driver information for a vehicle."""
 
@@ -24,7 +26,7 @@ class VehicleTeamInfo:
     team_world_championships: int = 0  # Number of championships
 
 
-@dataclass
+@dataclass(slots=True)
 class VehicleConfig:
     """Technical configuration for a vehicle."""
 
@@ -75,7 +77,7 @@ class VehicleConfig:
     ai_upgrade_class: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Vehicle:
     """
     Represents an rFactor vehicle (.veh file).
@@ -17,6 +17,7 @@ from ..models.championship import (
     Player, Opponent, TrackStat
 )
 from ..utils.file_utils import read_rfactor_file
+from ..utils.metrics import FILES_PARSED, timed
 
 
 class CCHParseError(Exception):
@@ -49,6 +50,7 @@ class CCHParser:
         """
         try:
             content = read_rfactor_file(filepath)
+            FILES_PARSED.inc(kind="cch")
             championship = CCHParser.parse_content(content)
             championship.file_path = filepath
             return championship
@@ -56,6 +58,7 @@ class CCHParser:
             raise CCHParseError(f"Failed to parse {filepath}: {e}") from e
 
     @staticmethod
+    @timed("cch.parse_content")
     def parse_content(content: str) -> Championship:
         """
         Parse the content of a .cch file.
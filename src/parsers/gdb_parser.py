@@ -6,10 +6,12 @@ VenueName and optional Layout. Also provides directory scanning utilities.
 """
 
 import re
+import sys
 from pathlib import Path
 from typing import Optional, Iterable
 
 from ..models.track import Track
+from ..utils.metrics import FILES_PARSED, timed
 
 
 class GdbParser:
@@ -19,21 +21,90 @@ class GdbParser:
     VENUENAME_RE = re.compile(r"^VenueName\s*=\s*\"?(?P<val>[^\"]+)\"?\s*$", re.IGNORECASE)
     LAYOUT_RE = re.compile(r"^Layout\s*=\s*\"?(?P<val>[^\"]+)\"?\s*$", re.IGNORECASE)
 
-    def parse_file(self, file_path: str | Path) -> Optional[Track]:
-        """Parse a .gdb file and return a Track object or None if not parsable."""
+    # Keys read in header-only mode (lowercase key -> Track attribute)
+    HEADER_KEYS = {"trackname": "track_name", "venuename": "venue_name", "layout": "layout"}
+
+    # Header-only mode gives up after this many lines. TrackName and
+    # VenueName sit at the top of the file; Layout is optional and usually
+    # absent, so without a bound the whole file would be read.
+    HEADER_MAX_LINES = 64
+
+    def parse_file(self, file_path: str | Path, header_only: bool = False) -> Optional[Track]:
+        """
+        Parse a .gdb file and return a Track object or None if not parsable.
+
+        Args:
+            file_path: Path to the .gdb file
+            header_only: Only read TrackName, VenueName and Layout, stopping
+                         as soon as they are found (gdb_info is left empty)
+
+        Returns:
+            Track or None if the file can't be read
+        """
         file_path = Path(file_path)
-        if not file_path.exists() or file_path.suffix.lower() != ".gdb":
+        if file_path.suffix.lower() != ".gdb":
             return None
 
         try:
             # GDB often uses ANSI/Windows-1252 like other rFactor files
             with open(file_path, 'r', encoding='windows-1252', errors='ignore') as f:
+                if header_only:
+                    return self.parse_header(f, str(file_path))
                 content = f.read()
         except Exception:
             return None
+        finally:
+            FILES_PARSED.inc(kind="gdb")
 
         return self.parse_content(content, str(file_path))
 
+    def parse_header(self, lines: Iterable[str], file_path: str = "") -> Track:
+        """
+        Parse only the listing fields (TrackName, VenueName, Layout).
+
+        Stops reading as soon as all three are found, or after
+        HEADER_MAX_LINES lines. Other keys are skipped and gdb_info stays
+        empty; use parse_file/parse_content for the full details.
+
+        Args:
+            lines: Lines of a .gdb file (e.g., an open file object)
+            file_path: Path of the file, for the file metadata
+
+        Returns:
+            Track with the listing fields set
+        """
+        track = Track()
+        remaining = set(self.HEADER_KEYS)
+
+        for line_number, raw_line in enumerate(lines):
+            if line_number >= self.HEADER_MAX_LINES:
+                break
+
+            line = raw_line.split("//")[0].strip()
+            if "=" not in line:
+                continue
+
+            key, val = line.split("=", 1)
+            key = key.strip().lower()
+            if key not in remaining:
+                continue
+
+            val = val.strip().strip('"').strip()
+            if not val:
+                continue
+
+            # Venues and layouts repeat across the tracks of a folder
+            setattr(track, self.HEADER_KEYS[key], sys.intern(val))
+            remaining.discard(key)
+            if not remaining:
+                break
+
+        if file_path:
+            p = Path(file_path)
+            track.file_path = str(p)
+            track.file_name = p.name
+        return track
+
     def parse_content(self, content: str, file_path: str = "") -> Optional[Track]:
         """Parse content of a .gdb file into a Track."""
         track = Track()
@@ -79,9 +150,9 @@ class GdbParser:
                 # Trim surrounding quotes if present
                 if len(val) >= 2 and ((val[0] == '"' and val[-1] == '"') or (val[0] == "'" and val[-1] == "'")):
                     val = val[1:-1]
-                # Avoid empty keys
+                # Avoid empty keys; all .gdb files share the same key names
                 if key:
-                    track.gdb_info[key] = val
+                    track.gdb_info[sys.intern(key)] = val
 
         # Set file metadata
         if file_path:
@@ -90,12 +161,13 @@ class GdbParser:
             track.file_name = p.name
         return track
 
-    def scan_directory(self, locations_dir: str | Path) -> list[Track]:
+    @timed("gdb.scan_directory")
+    def scan_directory(self, locations_dir: str | Path, header_only: bool = False) -> list[Track]:
         """Scan recursively for .gdb files under locations_dir."""
         locations_dir = Path(locations_dir)
         tracks: list[Track] = []
         for gdb in locations_dir.glob("**/*.gdb"):
-            tr = self.parse_file(gdb)
+            tr = self.parse_file(gdb, header_only=header_only)
             if tr:
                 # Set relative path w.r.t GameData/Locations
                 try:
@@ -25,6 +25,7 @@ from pathlib import Path
 
 from ..models.talent import Talent, TalentPersonalInfo, TalentStats
 from ..utils.file_utils import read_rfactor_file
+from ..utils.metrics import FILES_PARSED
 
 
 class RCDParseError(Exception):
@@ -57,6 +58,7 @@ class RCDParser:
         """
         try:
             content = read_rfactor_file(filepath)
+            FILES_PARSED.inc(kind="rcd")
             talent = RCDParser.parse_content(content)
             talent.file_path = filepath
             return talent
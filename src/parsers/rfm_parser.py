@@ -16,6 +16,7 @@ from ..models.rfm import (
     PitGroup,
     CareerSettings,
 )
+from ..utils.metrics import FILES_PARSED, timed
 
 
 class RFMParser:
@@ -32,6 +33,7 @@ class RFMParser:
         self.lines: List[str] = []
         self.current_line: int = 0
 
+    @timed("rfm.parse")
     def parse(self) -> RFMod:
         """
         Parse RFM file.
@@ -49,6 +51,7 @@ class RFMParser:
         # Read file with proper encoding
         with open(self.file_path, 'r', encoding='windows-1252') as f:
             self.lines = f.readlines()
+        FILES_PARSED.inc(kind="rfm")
 
         self.current_line = 0
 
@@ -6,16 +6,34 @@ and technical configuration.
 """
 
 import re
+import sys
 from pathlib import Path
 from typing import Optional
 
 from ..models.vehicle import Vehicle, VehicleTeamInfo, VehicleConfig
 from ..utils.config import get_config
+from ..utils.metrics import FILES_PARSED, timed
 
 
 class VehParser:
     """Parser for .veh vehicle files."""
 
+    # Keys whose values repeat across many vehicles (class names, shared
+    # technical files, teams...). Their values are interned so a catalog of
+    # thousands of vehicles keeps a single copy of each string.
+    INTERNED_KEYS = frozenset({
+        'HDVehicle', 'GenString', 'Graphics', 'Spinner', 'Upgrades', 'Sounds',
+        'Cameras', 'HeadPhysics', 'Cockpit', 'AIUpgradeClass', 'Engine',
+        'Manufacturer', 'Classes', 'Category', 'Team', 'FullTeamName',
+        'PitGroup', 'TeamHeadquarters',
+    })
+
+    # VehicleConfig technical file references with *_resolved/*_exists fields
+    TECHNICAL_FILES = (
+        'hdvehicle', 'graphics', 'spinner', 'upgrades',
+        'sounds', 'cameras', 'head_physics', 'cockpit',
+    )
+
     def __init__(self):
         """Initialize the parser."""
         self.config = get_config()
@@ -39,6 +57,7 @@ class VehParser:
             # Read file with Windows-1252 encoding (common for rFactor files)
             with open(file_path, 'r', encoding='windows-1252', errors='ignore') as f:
                 content = f.read()
+            FILES_PARSED.inc(kind="veh")
 
             return self.parse_content(content, str(file_path))
 
@@ -74,6 +93,8 @@ class VehParser:
                 key, value = line.split('=', 1)
                 key = key.strip()
                 value = value.strip().strip('"')  # Remove quotes
+                if key in self.INTERNED_KEYS:
+                    value = sys.intern(value)
 
                 # Parse configuration fields
                 if key == 'DefaultLivery':
@@ -312,6 +333,12 @@ class VehParser:
                         config.cockpit_resolved, config.cockpit_exists = _resolve_technical_file(
                             file_path_obj.parent, config.cockpit, vehicles_root, mod_root
                         )
+
+                    # Vehicles of a mod share their technical files: keep one copy of each path
+                    for name in self.TECHNICAL_FILES:
+                        resolved = getattr(config, f"{name}_resolved")
+                        if resolved:
+                            setattr(config, f"{name}_resolved", sys.intern(resolved))
             except (ValueError, IndexError):
                 vehicle.relative_path = ""
                 # Fallback: try to resolve HDV with just Vehicles root if path info unavailable
@@ -335,6 +362,7 @@ class VehParser:
 
         return vehicle
 
+    @timed("veh.scan_directory")
     def scan_directory(self, directory: str | Path) -> list[Vehicle]:
         """
         Scan a directory recursively for .veh files and parse them.
@@ -0,0 +1,100 @@
+"""
+Batched execution of per-item operations on a worker pool.
+
+Used by bulk endpoints (championships, talents) to run the same operation on
+many items at once while reporting a result for each item.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class BatchItemResult:
+    """Result of a single item in a batch."""
+
+    item: str
+    success: bool
+    message: str = ""
+    data: Any = None
+
+
+@dataclass
+class BatchResult:
+    """Result of a whole batch, in input order."""
+
+    results: List[BatchItemResult] = field(default_factory=list)
+
+    @property
+    def success_count(self) -> int:
+        """Number of items that succeeded."""
+        return sum(1 for r in self.results if r.success)
+
+    @property
+    def error_count(self) -> int:
+        """Number of items that failed."""
+        return sum(1 for r in self.results if not r.success)
+
+    @property
+    def total(self) -> int:
+        """Total number of items processed."""
+        return len(self.results)
+
+
+class BatchExecutor:
+    """Runs a function over many items on a thread pool."""
+
+    # File operations are I/O bound, so a few more threads than cores is fine
+    DEFAULT_MAX_WORKERS = min(16, (os.cpu_count() or 1) + 4)
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Initialize the executor.
+
+        Args:
+            max_workers: Maximum number of worker threads (default: DEFAULT_MAX_WORKERS)
+        """
+        self.max_workers = max_workers or self.DEFAULT_MAX_WORKERS
+
+    def run(
+        self,
+        func: Callable[[T], Any],
+        items: Iterable[T],
+        label: Callable[[T], str] = str,
+    ) -> BatchResult:
+        """
+        Run func on every item and collect per-item results.
+
+        Exceptions raised by func are caught and reported as failures for
+        that item only; the other items are still processed.
+
+        Args:
+            func: Function called with each item. Its return value is stored
+                  in BatchItemResult.data.
+            items: Items to process
+            label: Function returning the name used to report an item
+
+        Returns:
+            BatchResult with one BatchItemResult per item, in input order
+        """
+        items = list(items)
+        if not items:
+            return BatchResult()
+
+        def _run_one(item: T) -> BatchItemResult:
+            try:
+                return BatchItemResult(item=label(item), success=True, data=func(item))
+            except Exception as e:
+                return BatchItemResult(item=label(item), success=False, message=str(e))
+
+        # Avoid the pool overhead for a single item
+        if len(items) == 1:
+            return BatchResult(results=[_run_one(items[0])])
+
+        workers = min(self.max_workers, len(items))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return BatchResult(results=list(pool.map(_run_one, items)))
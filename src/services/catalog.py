@@ -0,0 +1,535 @@
+"""
+Shared, in-memory catalogs of rFactor files with a persistent index.
+
+A catalog scans a directory for files with a given extension, parses them
+once and keeps the results in memory across requests. Parsed records are
+also written to a JSON index keyed by relative path, mtime and size, so a
+restart only re-parses files that changed since the last run.
+
+Subclasses provide the parsing and (de)serialization of their items.
+
+In the multi-worker server mode (see catalog_store.py), the coordinator
+process scans and publishes each generation to the shared catalog store,
+and the worker processes read their catalogs from it instead of scanning.
+"""
+
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Generic, List, Optional, Tuple, TypeVar
+
+from ..utils.config import get_config
+from ..utils.installation_stats import iter_files
+from ..utils.metrics import CATALOG_FILES, CATALOG_REQUESTS, span
+from .catalog_store import COORDINATOR, WORKER, get_catalog_role, get_catalog_store
+from .event_bus import get_event_bus
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Maximum number of changed/removed paths listed in a "catalog" event
+MAX_EVENT_PATHS = 200
+
+# Seconds a worker waits for the coordinator to process its refresh requests
+# (a cold scan of a large installation included)
+STORE_WAIT_SECONDS = 120
+
+
+class FileCatalog(Generic[T]):
+    """Base class for mtime-indexed catalogs of rFactor files."""
+
+    # Subclasses must set these
+    KIND = ""
+    EXTENSION = ""
+    RECURSIVE = True
+
+    # Bump when the record format changes to discard old index files
+    INDEX_VERSION = 1
+
+    # Below this many files to parse, parallel parsing isn't worth it
+    PARALLEL_THRESHOLD = 32
+
+    def __init__(self, root_dir: str | Path, index_path: Optional[str | Path] = None, max_workers: Optional[int] = None):
+        """
+        Initialize the catalog.
+
+        Args:
+            root_dir: Directory to scan (e.g., GameData/Locations)
+            index_path: Path of the persistent JSON index (None = no index)
+            max_workers: Number of threads used to parse files on cold scans
+        """
+        self.root_dir = Path(root_dir)
+        self.index_path = Path(index_path) if index_path else None
+        self.max_workers = max_workers or min(16, (os.cpu_count() or 1) + 4)
+
+        self._lock = threading.RLock()
+        self._items: Dict[str, T] = {}
+        self._sorted: List[T] = []
+        self._stamps: Dict[str, Tuple[int, int]] = {}
+        self._fingerprint: Optional[Tuple] = None
+        self._loaded = False
+        self.generation = 0
+
+        # Shared store (multi-worker mode): whether this coordinator published
+        # the catalog, and the last refresh request of this worker
+        self._store_published = False
+        self._pending_request = 0
+
+        # Progress of the running scan (read without the lock, see progress())
+        self._scan_total = 0
+        self._scan_done = 0
+
+    # ----- Hooks for subclasses -----
+
+    def parse(self, file_path: str, relative_path: str) -> Optional[T]:
+        """Parse one file into an item (None if not parsable)."""
+        raise NotImplementedError
+
+    def to_record(self, item: T) -> dict:
+        """Convert an item to a JSON-serializable record for the index."""
+        raise NotImplementedError
+
+    def from_record(self, record: dict, file_path: str, relative_path: str) -> T:
+        """Rebuild an item from an index record."""
+        raise NotImplementedError
+
+    def _rebuild_indexes(self) -> None:
+        """Rebuild secondary indexes after the items changed."""
+        pass
+
+    # ----- Public API -----
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the catalog has been loaded at least once."""
+        return self._loaded
+
+    def items(self, force_reload: bool = False) -> List[T]:
+        """
+        Get all items, loading or refreshing the catalog if needed.
+
+        The first call loads the persistent index and re-parses only files
+        that changed. Later calls only re-scan when the directory fingerprint
+        changed (see directory_fingerprint) or when force_reload is True.
+
+        Args:
+            force_reload: If True, re-scan the whole directory
+
+        Returns:
+            List of items sorted by relative path
+        """
+        self.ensure_fresh(force_reload)
+        with self._lock:
+            return list(self._sorted)
+
+    def get(self, relative_path: str) -> Optional[T]:
+        """
+        Get an item by its relative path.
+
+        Args:
+            relative_path: Path relative to the catalog root (any separator)
+
+        Returns:
+            Item or None if not in the catalog
+        """
+        self.ensure_fresh()
+        rel = relative_path.replace("\\", "/").strip("/")
+        with self._lock:
+            return self._items.get(rel)
+
+    def ensure_fresh(self, force_reload: bool = False) -> None:
+        """
+        Make sure the catalog reflects the directory.
+
+        Args:
+            force_reload: If True, re-scan even if the fingerprint didn't change
+        """
+        if get_catalog_role() == WORKER:
+            self._sync_from_store(force_reload)
+            return
+
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    CATALOG_REQUESTS.inc(catalog=self.KIND, result="miss")
+                    self._load_index()
+                    self.refresh()
+                    return
+
+        if force_reload or self.directory_fingerprint() != self._fingerprint:
+            CATALOG_REQUESTS.inc(catalog=self.KIND, result="miss")
+            self.refresh()
+        else:
+            CATALOG_REQUESTS.inc(catalog=self.KIND, result="hit")
+
+    def refresh(self) -> bool:
+        """
+        Re-scan the directory and re-parse new or modified files.
+
+        Returns:
+            True if the catalog content changed
+        """
+        if get_catalog_role() == WORKER:
+            return self._sync_from_store(force_reload=True)
+
+        with self._lock:
+            fingerprint = self.directory_fingerprint()
+            found: Dict[str, Tuple[str, Tuple[int, int]]] = {}
+            root = str(self.root_dir)
+            with span(f"{self.KIND}.scan_directory"):
+                for entry in iter_files(root, self.EXTENSION, recursive=self.RECURSIVE):
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    rel = os.path.relpath(entry.path, root).replace("\\", "/")
+                    found[rel] = (entry.path, (stat.st_mtime_ns, stat.st_size))
+
+            to_parse = [
+                (path, rel) for rel, (path, stamp) in found.items()
+                if self._stamps.get(rel) != stamp or rel not in self._items
+            ]
+            removed = [rel for rel in self._items if rel not in found]
+            self._scan_total = len(to_parse)
+            self._scan_done = 0
+            CATALOG_FILES.inc(len(found) - len(to_parse), catalog=self.KIND, result="hit")
+            CATALOG_FILES.inc(len(to_parse), catalog=self.KIND, result="miss")
+
+            for rel in removed:
+                self._items.pop(rel, None)
+                self._stamps.pop(rel, None)
+
+            with span(f"{self.KIND}.parse_files"):
+                parsed = self._parse_many(to_parse)
+            updated = []
+            for (path, rel), item in zip(to_parse, parsed):
+                if item is None:
+                    if self._items.pop(rel, None) is not None:
+                        removed.append(rel)
+                    self._stamps.pop(rel, None)
+                else:
+                    self._items[rel] = item
+                    self._stamps[rel] = found[rel][1]
+                    updated.append(rel)
+
+            self._fingerprint = fingerprint
+            self._loaded = True
+            changed = bool(to_parse or removed)
+            if changed or self.generation == 0:
+                self.generation += 1
+                self._sorted = [self._items[rel] for rel in sorted(self._items)]
+                self._rebuild_indexes()
+                self._save_index()
+                self._publish_change(updated, removed)
+            if get_catalog_role() == COORDINATOR and (changed or not self._store_published):
+                self._publish_to_store(updated, removed)
+            return changed
+
+    def invalidate(self, relative_path: Optional[str] = None) -> None:
+        """
+        Mark one file (or the whole catalog) as needing a re-parse.
+
+        The next access re-scans the directory; only invalidated or changed
+        files are parsed again.
+
+        Args:
+            relative_path: File to invalidate (None = all files)
+        """
+        if get_catalog_role() == WORKER:
+            # The coordinator re-parses; the next access waits for it
+            rel = relative_path.replace("\\", "/").strip("/") if relative_path else None
+            request_id = get_catalog_store().request_refresh(self.KIND, str(self.root_dir), rel, invalidate=True)
+            with self._lock:
+                self._pending_request = max(self._pending_request, request_id)
+            return
+
+        with self._lock:
+            if relative_path is None:
+                self._stamps.clear()
+            else:
+                self._stamps.pop(relative_path.replace("\\", "/").strip("/"), None)
+            self._fingerprint = None
+
+    @property
+    def is_published(self) -> bool:
+        """Whether this coordinator's catalog is up to date in the shared store."""
+        return self._store_published
+
+    def is_stale(self) -> bool:
+        """
+        Check whether a loaded catalog no longer matches its directory.
+
+        Only compares the directory fingerprint: it doesn't scan the files
+        nor update the hit/miss metrics.
+
+        In a worker process, compares the generation of the shared store
+        with the local one instead.
+
+        Returns:
+            True if the catalog is loaded and its fingerprint changed
+        """
+        if get_catalog_role() == WORKER:
+            return self._loaded and get_catalog_store().generation(self.KIND, str(self.root_dir)) != self.generation
+        return self._loaded and self.directory_fingerprint() != self._fingerprint
+
+    def progress(self) -> dict:
+        """
+        Report the loading progress of the catalog.
+
+        Safe to call while a scan is running in another thread: it doesn't
+        take the catalog lock, so the counts are a snapshot.
+
+        Returns:
+            Dictionary with loaded, items (currently known), parsed and
+            to_parse (files of the current or last scan)
+        """
+        return {
+            "loaded": self._loaded,
+            "items": len(self._items),
+            "parsed": min(self._scan_done, self._scan_total),
+            "to_parse": self._scan_total,
+        }
+
+    def counts_by_top_level(self) -> Dict[str, int]:
+        """
+        Count loaded items per top-level folder (mod or track folder).
+
+        Returns:
+            Dictionary of folder name -> item count ("" for files at the root)
+        """
+        counts: Dict[str, int] = {}
+        with self._lock:
+            for rel in self._items:
+                top = rel.split("/", 1)[0] if "/" in rel else ""
+                counts[top] = counts.get(top, 0) + 1
+        return counts
+
+    def directory_fingerprint(self) -> Tuple:
+        """
+        Cheap fingerprint of the catalog directory.
+
+        Uses the mtimes of the root and of its direct subdirectories, which
+        change when files or folders are added or removed at those levels.
+        Deeper edits are picked up with force_reload.
+
+        Returns:
+            Tuple of (name, mtime) entries
+        """
+        entries = []
+        try:
+            entries.append(("", os.stat(self.root_dir).st_mtime_ns))
+            with os.scandir(self.root_dir) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        entries.append((entry.name, entry.stat(follow_symlinks=False).st_mtime_ns))
+        except OSError:
+            pass
+        return tuple(sorted(entries))
+
+    # ----- Internals -----
+
+    def _publish_change(self, changed: List[str], removed: List[str]) -> None:
+        """Publish a "catalog" event for a new generation."""
+        get_event_bus().publish("catalog", {
+            "catalog": self.KIND,
+            "generation": self.generation,
+            "items": len(self._items),
+            "changed": changed[:MAX_EVENT_PATHS],
+            "removed": removed[:MAX_EVENT_PATHS],
+            # Too many paths to list: reload the whole catalog
+            "truncated": len(changed) > MAX_EVENT_PATHS or len(removed) > MAX_EVENT_PATHS,
+        })
+
+    def _publish_to_store(self, updated: List[str], removed: List[str]) -> None:
+        """Publish the changes of a refresh to the shared store (coordinator)."""
+        if self._store_published:
+            rels = updated
+        else:
+            # First publication of this process: the whole catalog
+            rels = [rel for rel in self._items if rel in self._stamps]
+        try:
+            get_catalog_store().publish(
+                self.KIND,
+                str(self.root_dir),
+                ((rel, self._stamps[rel], self.to_record(self._items[rel])) for rel in rels),
+                removed,
+                replace=not self._store_published,
+            )
+            self._store_published = True
+        except Exception as e:
+            # The changes of this refresh would be lost: publish the whole
+            # catalog next time (see is_published)
+            self._store_published = False
+            logger.warning(f"Could not publish the {self.KIND} catalog to the store: {e}")
+
+    def _sync_from_store(self, force_reload: bool = False) -> bool:
+        """
+        Update a worker's catalog from the shared store.
+
+        Asks the coordinator for a rescan on the first load, on force_reload
+        or if the catalog was never published, and waits for the pending invalidations of this
+        worker, then applies the items changed since the local generation.
+
+        Args:
+            force_reload: If True, ask the coordinator for a rescan first
+
+        Returns:
+            True if the catalog content changed
+        """
+        store = get_catalog_store()
+        root = str(self.root_dir)
+        with self._lock:
+            # First load: the published generation may predate the coordinator
+            if force_reload or not self._loaded or store.generation(self.KIND, root) is None:
+                self._pending_request = store.request_refresh(self.KIND, root)
+            if self._pending_request:
+                if not store.wait_for_requests(self.KIND, root, self._pending_request, STORE_WAIT_SECONDS):
+                    logger.warning(f"Catalog coordinator did not refresh {self.KIND} within {STORE_WAIT_SECONDS}s")
+                self._pending_request = 0
+
+            if self._loaded and store.generation(self.KIND, root) == self.generation:
+                CATALOG_REQUESTS.inc(catalog=self.KIND, result="hit")
+                return False
+
+            CATALOG_REQUESTS.inc(catalog=self.KIND, result="miss")
+            generation, changes, present = store.read_changes(self.KIND, root, self.generation if self._loaded else 0)
+            updated = []
+            for rel, stamp, record in changes:
+                try:
+                    path = os.path.join(root, *rel.split("/"))
+                    self._items[rel] = self.from_record(record, path, rel)
+                    self._stamps[rel] = stamp
+                    updated.append(rel)
+                except Exception:
+                    continue
+            removed = [rel for rel in self._items if rel not in present]
+            for rel in removed:
+                self._items.pop(rel, None)
+                self._stamps.pop(rel, None)
+
+            changed = bool(updated or removed) or not self._loaded
+            self._loaded = True
+            if generation != self.generation:
+                self.generation = generation
+                self._sorted = [self._items[rel] for rel in sorted(self._items)]
+                self._rebuild_indexes()
+                self._publish_change(updated, removed)
+            return changed
+
+    def _parse_one(self, job: Tuple[str, str]) -> Optional[T]:
+        """Parse one (file_path, relative_path) job, swallowing errors."""
+        path, rel = job
+        try:
+            return self.parse(path, rel)
+        except Exception:
+            return None
+        finally:
+            self._scan_done += 1
+
+    def _parse_many(self, jobs: List[Tuple[str, str]]) -> List[Optional[T]]:
+        """Parse many files, in parallel when there are enough of them."""
+        if len(jobs) < self.PARALLEL_THRESHOLD:
+            return [self._parse_one(job) for job in jobs]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            return list(pool.map(self._parse_one, jobs))
+
+    def _load_index(self) -> None:
+        """Load items from the persistent index, if it matches this catalog."""
+        if not self.index_path or not self.index_path.exists():
+            return
+
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception:
+            # Corrupted index: ignore it, the scan will rebuild it
+            return
+
+        if data.get("version") != self.INDEX_VERSION or data.get("root") != str(self.root_dir):
+            return
+
+        root = str(self.root_dir)
+        for rel, entry in data.get("entries", {}).items():
+            try:
+                path = os.path.join(root, *rel.split("/"))
+                self._items[rel] = self.from_record(entry["record"], path, rel)
+                self._stamps[rel] = (entry["mtime_ns"], entry["size"])
+            except Exception:
+                continue
+
+    def _save_index(self) -> None:
+        """Write the persistent index atomically (temp file + rename)."""
+        if not self.index_path:
+            return
+
+        data = {
+            "version": self.INDEX_VERSION,
+            "root": str(self.root_dir),
+            "entries": {
+                rel: {
+                    "mtime_ns": self._stamps[rel][0],
+                    "size": self._stamps[rel][1],
+                    "record": self.to_record(item),
+                }
+                for rel, item in self._items.items()
+                if rel in self._stamps
+            },
+        }
+
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.index_path.with_suffix(self.index_path.suffix + ".tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            # The index is only an optimization; the catalog still works without it
+            pass
+
+
+def get_catalog_index_dir() -> Path:
+    """
+    Get the directory where catalog indexes are stored.
+
+    Indexes live in a "cache" folder next to the configuration file.
+
+    Returns:
+        Path to the index directory
+    """
+    return get_config().config_file.absolute().parent / "cache"
+
+
+def get_catalog_index_path(root_dir: str | Path, index_name: str) -> Optional[Path]:
+    """
+    Get the persistent index path for a catalog directory.
+
+    Only directories of the configured rFactor installation get an index,
+    so catalogs built for other paths (e.g., temporary test installations)
+    don't write into the cache folder.
+
+    Args:
+        root_dir: Directory scanned by the catalog
+        index_name: Index file name (e.g., "talents_index.json")
+
+    Returns:
+        Path of the index file, or None if root_dir is outside the installation
+    """
+    rfactor_path = get_config().get_rfactor_path()
+    if not rfactor_path:
+        return None
+
+    root = os.path.normcase(os.path.abspath(str(root_dir)))
+    installation = os.path.normcase(os.path.abspath(rfactor_path))
+    try:
+        if os.path.commonpath([root, installation]) != installation:
+            return None
+    except ValueError:
+        # Different drives on Windows
+        return None
+
+    return get_catalog_index_dir() / index_name
@@ -0,0 +1,191 @@
+"""
+Catalog coordinator of the multi-worker server mode.
+
+With `python -m src.main --workers N`, the main process doesn't serve
+requests: it runs CatalogCoordinator, the only owner of the catalog scans.
+It loads the catalogs of the configured installation, publishes every new
+generation to the shared store (see catalog_store.py), processes the
+refresh requests of the workers (invalidations after edits, forced
+reloads, catalogs of another directory) and refreshes the catalogs whose
+directory changed, so the workers never parse rFactor files themselves.
+"""
+
+import logging
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+from ..utils.config import get_config
+from .catalog import FileCatalog
+from .catalog_store import get_catalog_store
+from .catalog_warmup import CATALOGS
+from .talent_catalog import get_talent_catalog
+from .track_catalog import get_track_catalog
+from .vehicle_catalog import get_vehicle_catalog
+
+logger = logging.getLogger(__name__)
+
+# Catalog KIND -> factory(root_dir) of the shared catalog
+CATALOG_FACTORIES: Dict[str, Callable[[str], FileCatalog]] = {
+    "talents": get_talent_catalog,
+    "vehicles": get_vehicle_catalog,
+    "locations": get_track_catalog,
+}
+
+# Seconds between two checks of the refresh requests
+POLL_INTERVAL = 0.05
+
+# Seconds between two checks of the catalog directories
+WATCH_INTERVAL = 2.0
+
+
+class CatalogCoordinator:
+    """Scans the catalogs for the worker processes, in a daemon thread."""
+
+    def __init__(self, poll_interval: float = POLL_INTERVAL, watch_interval: float = WATCH_INTERVAL):
+        """
+        Initialize a stopped coordinator.
+
+        Args:
+            poll_interval: Seconds between two checks of the refresh requests
+            watch_interval: Seconds between two checks of the catalog directories
+        """
+        self.poll_interval = poll_interval
+        self.watch_interval = watch_interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._catalogs: Dict[Tuple[str, str], FileCatalog] = {}
+
+    def start(self) -> None:
+        """Start the coordinator thread (no-op if already running)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="catalog-coordinator", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the coordinator thread and wait for it."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def load(self) -> None:
+        """Load and publish the catalogs of the configured installation."""
+        config = get_config()
+        if not config.is_configured():
+            return
+
+        root = Path(config.get_rfactor_path())
+        for name, factory in CATALOGS:
+            try:
+                self._track(factory(root)).ensure_fresh()
+            except Exception:
+                logger.exception(f"Failed to load the {name} catalog")
+
+    def process_requests(self) -> int:
+        """
+        Process the pending refresh requests of the workers.
+
+        Returns:
+            Number of requests processed
+        """
+        store = get_catalog_store()
+        requests = store.pending_requests()
+        if not requests:
+            return 0
+
+        by_catalog = defaultdict(list)
+        for request_id, kind, root, relative_path, invalidate in requests:
+            by_catalog[(kind, root)].append((request_id, relative_path, invalidate))
+
+        for (kind, root), catalog_requests in by_catalog.items():
+            try:
+                factory = CATALOG_FACTORIES.get(kind)
+                if factory is None:
+                    logger.warning(f"Ignoring refresh requests for unknown catalog {kind}")
+                else:
+                    self._refresh(self._track(factory(root)), catalog_requests)
+            except Exception:
+                logger.exception(f"Failed to refresh the {kind} catalog of {root}")
+            finally:
+                # Completed even on failure, so the workers don't wait forever
+                store.complete_requests(request_id for request_id, _, _ in catalog_requests)
+
+        return len(requests)
+
+    def check(self) -> int:
+        """
+        Refresh the catalogs whose directory changed.
+
+        Loaded catalogs whose last publication failed are refreshed too, so
+        they are published again in full.
+
+        Returns:
+            Number of catalogs refreshed
+        """
+        refreshed = 0
+        for (kind, root), catalog in list(self._catalogs.items()):
+            try:
+                if catalog.is_stale():
+                    catalog.ensure_fresh()
+                    refreshed += 1
+                elif catalog.is_loaded and not catalog.is_published:
+                    catalog.refresh()
+                    refreshed += 1
+            except Exception:
+                logger.exception(f"Failed to refresh the {kind} catalog of {root}")
+        return refreshed
+
+    def _track(self, catalog: FileCatalog) -> FileCatalog:
+        """Remember a catalog to watch its directory."""
+        self._catalogs[(catalog.KIND, str(catalog.root_dir))] = catalog
+        return catalog
+
+    def _refresh(self, catalog: FileCatalog, requests) -> None:
+        """Apply the invalidations of a catalog's requests and rescan it once."""
+        for _, relative_path, invalidate in requests:
+            if invalidate:
+                catalog.invalidate(relative_path)
+
+        if catalog.is_loaded:
+            catalog.refresh()
+        else:
+            # First load: reuse the persistent index
+            catalog.ensure_fresh()
+
+    def _run(self) -> None:
+        """Load the catalogs, then serve the requests and watch the directories."""
+        self.load()
+        waited = 0.0
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.process_requests()
+            except Exception:
+                logger.exception("Failed to process the catalog refresh requests")
+
+            waited += self.poll_interval
+            if waited >= self.watch_interval:
+                waited = 0.0
+                self.check()
+
+
+# Global coordinator instance
+_coordinator_instance: Optional[CatalogCoordinator] = None
+
+
+def get_catalog_coordinator() -> CatalogCoordinator:
+    """
+    Get the global catalog coordinator.
+
+    Returns:
+        CatalogCoordinator instance
+    """
+    global _coordinator_instance
+
+    if _coordinator_instance is None:
+        _coordinator_instance = CatalogCoordinator()
+
+    return _coordinator_instance
@@ -0,0 +1,338 @@
+"""
+Shared on-disk store of the catalogs, for the multi-worker server mode.
+
+With `python -m src.main --workers N`, every worker process serves requests
+from its own in-memory catalogs, but only the coordinator (the main
+process, see catalog_coordinator.py) scans and parses the installation.
+The coordinator publishes each catalog generation to a SQLite database in
+WAL mode; workers read the items that changed since their generation, and
+ask the coordinator for rescans through a queue of refresh requests (their
+only writes).
+
+WAL mode lets the workers read while the coordinator writes: a reader sees
+the last committed generation, never a partially written one.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+# Environment variable selecting the catalog role of a process (set by
+# src.main for the worker processes)
+ROLE_ENV = "RFACTOR_CATALOG_ROLE"
+
+# Roles: a single process owning its catalogs (default), the coordinator
+# of a multi-worker server, or one of its workers
+STANDALONE = "standalone"
+COORDINATOR = "coordinator"
+WORKER = "worker"
+
+STORE_FILENAME = "catalogs.sqlite"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS catalogs (
+    kind TEXT NOT NULL,
+    root TEXT NOT NULL,
+    generation INTEGER NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (kind, root)
+);
+CREATE TABLE IF NOT EXISTS items (
+    kind TEXT NOT NULL,
+    root TEXT NOT NULL,
+    relative_path TEXT NOT NULL,
+    generation INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    record TEXT NOT NULL,
+    PRIMARY KEY (kind, root, relative_path)
+);
+CREATE INDEX IF NOT EXISTS items_generation ON items (kind, root, generation);
+CREATE TABLE IF NOT EXISTS refresh_requests (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    root TEXT NOT NULL,
+    relative_path TEXT,
+    invalidate INTEGER NOT NULL,
+    requested_at REAL NOT NULL
+);
+"""
+
+# (relative_path, (mtime_ns, size), record)
+StoreEntry = Tuple[str, Tuple[int, int], dict]
+
+
+class CatalogStore:
+    """SQLite database shared by the coordinator and the workers."""
+
+    def __init__(self, path: str | Path):
+        """
+        Open (and create if needed) the store.
+
+        Args:
+            path: Path of the SQLite database
+        """
+        self.path = Path(path)
+        self._local = threading.local()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connection() as conn:
+            conn.executescript(SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get the connection of the calling thread (sqlite3 connections aren't shared)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            # Durable enough for a cache that the coordinator can rebuild
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    # ----- Coordinator side -----
+
+    def publish(
+        self,
+        kind: str,
+        root: str,
+        upserts: Iterable[StoreEntry],
+        removed: Iterable[str],
+        replace: bool = False,
+    ) -> int:
+        """
+        Publish a new generation of a catalog.
+
+        Args:
+            kind: Catalog kind (e.g., "talents")
+            root: Directory of the catalog
+            upserts: New or modified items
+            removed: Relative paths of the removed items
+            replace: If True, the upserts are the whole catalog (first
+                     publication of this coordinator)
+
+        Returns:
+            The new generation
+        """
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT generation FROM catalogs WHERE kind = ? AND root = ?", (kind, root)
+            ).fetchone()
+            generation = (row[0] if row else 0) + 1
+
+            if replace:
+                conn.execute("DELETE FROM items WHERE kind = ? AND root = ?", (kind, root))
+            else:
+                conn.executemany(
+                    "DELETE FROM items WHERE kind = ? AND root = ? AND relative_path = ?",
+                    ((kind, root, rel) for rel in removed),
+                )
+            conn.executemany(
+                "INSERT OR REPLACE INTO items (kind, root, relative_path, generation, mtime_ns, size, record) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (kind, root, rel, generation, stamp[0], stamp[1], json.dumps(record, separators=(",", ":")))
+                    for rel, stamp, record in upserts
+                ),
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO catalogs (kind, root, generation, updated_at) VALUES (?, ?, ?, ?)",
+                (kind, root, generation, time.time()),
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return generation
+
+    def pending_requests(self) -> List[Tuple[int, str, str, Optional[str], bool]]:
+        """
+        Get the refresh requests of the workers, oldest first.
+
+        Returns:
+            List of (id, kind, root, relative_path, invalidate)
+        """
+        rows = self._connection().execute(
+            "SELECT id, kind, root, relative_path, invalidate FROM refresh_requests ORDER BY id"
+        ).fetchall()
+        return [(row[0], row[1], row[2], row[3], bool(row[4])) for row in rows]
+
+    def complete_requests(self, request_ids: Iterable[int]) -> None:
+        """
+        Mark refresh requests as done (the waiting workers then read the store).
+
+        Args:
+            request_ids: Ids of the processed requests
+        """
+        self._connection().executemany(
+            "DELETE FROM refresh_requests WHERE id = ?", ((request_id,) for request_id in request_ids)
+        )
+
+    # ----- Worker side -----
+
+    def generation(self, kind: str, root: str) -> Optional[int]:
+        """
+        Get the published generation of a catalog.
+
+        Args:
+            kind: Catalog kind
+            root: Directory of the catalog
+
+        Returns:
+            Generation, or None if the catalog was never published
+        """
+        row = self._connection().execute(
+            "SELECT generation FROM catalogs WHERE kind = ? AND root = ?", (kind, root)
+        ).fetchone()
+        return row[0] if row else None
+
+    def read_changes(self, kind: str, root: str, since: int) -> Tuple[int, List[StoreEntry], set]:
+        """
+        Read the items changed since a generation, in a consistent snapshot.
+
+        Args:
+            kind: Catalog kind
+            root: Directory of the catalog
+            since: Generation the reader already has (0 = read everything)
+
+        Returns:
+            Tuple of (current generation, changed items, relative paths of
+            all current items)
+        """
+        conn = self._connection()
+        conn.execute("BEGIN")
+        try:
+            row = conn.execute(
+                "SELECT generation FROM catalogs WHERE kind = ? AND root = ?", (kind, root)
+            ).fetchone()
+            rows = conn.execute(
+                "SELECT relative_path, mtime_ns, size, record FROM items "
+                "WHERE kind = ? AND root = ? AND generation > ?",
+                (kind, root, since),
+            ).fetchall()
+            present = {
+                rel for (rel,) in conn.execute(
+                    "SELECT relative_path FROM items WHERE kind = ? AND root = ?", (kind, root)
+                )
+            }
+        finally:
+            conn.execute("COMMIT")
+
+        changes = [(rel, (mtime_ns, size), json.loads(record)) for rel, mtime_ns, size, record in rows]
+        return (row[0] if row else 0), changes, present
+
+    def request_refresh(self, kind: str, root: str, relative_path: Optional[str] = None, invalidate: bool = False) -> int:
+        """
+        Ask the coordinator to rescan a catalog.
+
+        Args:
+            kind: Catalog kind
+            root: Directory of the catalog
+            relative_path: File to re-parse (None = the whole catalog)
+            invalidate: If True, re-parse the file(s) even if unchanged
+
+        Returns:
+            Request id, to wait for with wait_for_requests
+        """
+        cursor = self._connection().execute(
+            "INSERT INTO refresh_requests (kind, root, relative_path, invalidate, requested_at) VALUES (?, ?, ?, ?, ?)",
+            (kind, root, relative_path, int(invalidate), time.time()),
+        )
+        return cursor.lastrowid
+
+    def wait_for_requests(self, kind: str, root: str, up_to: int, timeout: float, interval: float = 0.02) -> bool:
+        """
+        Wait until the coordinator processed the requests of a catalog.
+
+        Args:
+            kind: Catalog kind
+            root: Directory of the catalog
+            up_to: Id of the last request to wait for
+            timeout: Maximum number of seconds to wait
+            interval: Seconds between two checks
+
+        Returns:
+            True if the requests were processed, False on timeout
+        """
+        deadline = time.monotonic() + timeout
+        conn = self._connection()
+        while True:
+            (pending,) = conn.execute(
+                "SELECT COUNT(*) FROM refresh_requests WHERE kind = ? AND root = ? AND id <= ?",
+                (kind, root, up_to),
+            ).fetchone()
+            if not pending:
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(interval)
+
+
+# Role of this process and shared store
+_role: Optional[str] = None
+_store_instance: Optional[CatalogStore] = None
+_store_lock = threading.Lock()
+
+
+def get_catalog_role() -> str:
+    """
+    Get the catalog role of this process.
+
+    Returns:
+        STANDALONE, COORDINATOR or WORKER (from RFACTOR_CATALOG_ROLE unless
+        set with set_catalog_role)
+    """
+    global _role
+
+    if _role is None:
+        role = os.environ.get(ROLE_ENV, STANDALONE)
+        _role = role if role in (STANDALONE, COORDINATOR, WORKER) else STANDALONE
+    return _role
+
+
+def set_catalog_role(role: Optional[str]) -> None:
+    """
+    Set the catalog role of this process.
+
+    Args:
+        role: STANDALONE, COORDINATOR or WORKER (None = back to the
+              environment variable)
+
+    Raises:
+        ValueError: If the role is unknown
+    """
+    global _role, _store_instance
+
+    if role not in (None, STANDALONE, COORDINATOR, WORKER):
+        raise ValueError(f"Unknown catalog role: {role}")
+    with _store_lock:
+        _role = role
+        _store_instance = None
+
+
+def get_catalog_store() -> CatalogStore:
+    """
+    Get the shared catalog store.
+
+    The database lives next to the catalog indexes (see
+    get_catalog_index_dir).
+
+    Returns:
+        CatalogStore instance
+    """
+    global _store_instance
+
+    if _store_instance is None:
+        # Imported here: the catalog module imports this one
+        from .catalog import get_catalog_index_dir
+
+        with _store_lock:
+            if _store_instance is None:
+                _store_instance = CatalogStore(get_catalog_index_dir() / STORE_FILENAME)
+
+    return _store_instance
@@ -0,0 +1,195 @@
+"""
+Background warm-up of the shared catalogs at application startup.
+
+Loading the talent, vehicle and track catalogs (from their persistent
+indexes, re-parsing only changed files) happens in parallel threads while
+the server is already accepting requests. The /health and /ready endpoints
+report the progress, and the launcher opens the browser once everything is
+loaded, so the first page doesn't pay for the cold scans.
+"""
+
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..utils.config import get_config
+from .catalog import FileCatalog
+from .talent_catalog import get_talent_catalog
+from .track_catalog import get_track_catalog
+from .vehicle_catalog import get_vehicle_catalog
+
+logger = logging.getLogger(__name__)
+
+# name -> factory(rfactor_path) returning the shared catalog to warm
+CATALOGS: List[Tuple[str, Callable[[Path], FileCatalog]]] = [
+    ("talents", lambda root: get_talent_catalog(root / "GameData" / "Talent")),
+    ("vehicles", lambda root: get_vehicle_catalog(root / "GameData" / "Vehicles")),
+    ("tracks", lambda root: get_track_catalog(root / "GameData" / "Locations")),
+]
+
+
+class CatalogWarmup:
+    """Loads the catalogs of the configured installation in background threads."""
+
+    def __init__(self):
+        """Initialize an idle warm-up (ready, nothing to load)."""
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._ready.set()
+        self._run = 0
+        self._rfactor_path: Optional[str] = None
+        self._catalogs: Dict[str, FileCatalog] = {}
+        self._state: Dict[str, dict] = {}
+        self._started_at: Optional[float] = None
+        self._finished_at: Optional[float] = None
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether the last warm-up finished (successfully or not)."""
+        return self._ready.is_set()
+
+    def start(self) -> bool:
+        """
+        Start warming the catalogs of the configured installation.
+
+        Returns immediately; each catalog is loaded in its own daemon
+        thread. Calling start again (e.g., after the rFactor path changed)
+        starts a new warm-up and the previous one is no longer reported.
+
+        Returns:
+            True if a warm-up was started, False if the app isn't configured
+        """
+        config = get_config()
+        rfactor_path = config.get_rfactor_path() if config.is_configured() else None
+
+        with self._lock:
+            self._run += 1
+            run = self._run
+            self._rfactor_path = rfactor_path
+            self._catalogs = {}
+            self._state = {}
+            self._started_at = time.monotonic()
+            self._finished_at = None
+
+            if not rfactor_path:
+                self._finished_at = self._started_at
+                self._ready.set()
+                return False
+
+            self._ready.clear()
+            for name, factory in CATALOGS:
+                self._catalogs[name] = factory(Path(rfactor_path))
+                self._state[name] = {"status": "pending"}
+
+        logger.info(f"Warming catalogs for {rfactor_path}")
+        for name, catalog in list(self._catalogs.items()):
+            thread = threading.Thread(
+                target=self._warm,
+                args=(run, name, catalog),
+                name=f"catalog-warmup-{name}",
+                daemon=True,
+            )
+            thread.start()
+        return True
+
+    def catalogs(self) -> Dict[str, FileCatalog]:
+        """
+        Get the catalogs of the last warm-up.
+
+        Returns:
+            Dictionary of catalog name -> shared catalog (empty if the app
+            isn't configured)
+        """
+        with self._lock:
+            return dict(self._catalogs)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for the warm-up to finish.
+
+        Args:
+            timeout: Maximum number of seconds to wait (None = no limit)
+
+        Returns:
+            True if the catalogs are ready
+        """
+        return self._ready.wait(timeout)
+
+    def progress(self) -> dict:
+        """
+        Report the warm-up progress.
+
+        Returns:
+            Dictionary with ready, rfactor_path, elapsed (seconds) and per
+            catalog status ("pending", "loading", "ready" or "error"),
+            item counts and files parsed so far
+        """
+        with self._lock:
+            catalogs = dict(self._catalogs)
+            state = {name: dict(entry) for name, entry in self._state.items()}
+            started_at = self._started_at
+            finished_at = self._finished_at
+            rfactor_path = self._rfactor_path
+
+        for name, catalog in catalogs.items():
+            state[name].update(catalog.progress())
+
+        if started_at is None:
+            elapsed = 0.0
+        else:
+            elapsed = (finished_at or time.monotonic()) - started_at
+
+        return {
+            "ready": self.is_ready,
+            "rfactor_path": rfactor_path,
+            "elapsed": round(elapsed, 3),
+            "catalogs": state,
+        }
+
+    def _warm(self, run: int, name: str, catalog: FileCatalog) -> None:
+        """Load one catalog and record the outcome."""
+        self._set_state(run, name, {"status": "loading"})
+        start = time.monotonic()
+        try:
+            catalog.ensure_fresh()
+        except Exception as e:
+            logger.exception(f"Failed to warm the {name} catalog")
+            self._set_state(run, name, {"status": "error", "error": str(e)})
+        else:
+            seconds = time.monotonic() - start
+            logger.info(f"Catalog {name} ready in {seconds:.2f}s")
+            self._set_state(run, name, {"status": "ready", "seconds": round(seconds, 3)})
+
+        with self._lock:
+            if run != self._run:
+                return
+            if all(entry["status"] in ("ready", "error") for entry in self._state.values()):
+                self._finished_at = time.monotonic()
+                self._ready.set()
+
+    def _set_state(self, run: int, name: str, entry: dict) -> None:
+        """Update the state of a catalog, ignoring outdated warm-ups."""
+        with self._lock:
+            if run == self._run:
+                self._state[name] = entry
+
+
+# Global warm-up instance
+_warmup_instance: Optional[CatalogWarmup] = None
+
+
+def get_catalog_warmup() -> CatalogWarmup:
+    """
+    Get the global catalog warm-up instance.
+
+    Returns:
+        CatalogWarmup instance
+    """
+    global _warmup_instance
+
+    if _warmup_instance is None:
+        _warmup_instance = CatalogWarmup()
+
+    return _warmup_instance
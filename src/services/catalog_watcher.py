@@ -0,0 +1,94 @@
+"""
+Background detection of changes to the rFactor installation.
+
+While browsers are subscribed to /api/events, CatalogWatcher periodically
+compares the directory fingerprint of each loaded catalog (see
+FileCatalog.directory_fingerprint) and refreshes the stale ones. The
+refresh publishes a "catalog" event, so files added or removed in
+GameData show up in the UI without a reload. Without subscribers, the
+catalogs are only refreshed when a request reads them.
+"""
+
+import logging
+import threading
+from typing import Optional
+
+from .catalog_warmup import get_catalog_warmup
+from .event_bus import get_event_bus
+
+logger = logging.getLogger(__name__)
+
+# Seconds between two checks of the catalog directories
+WATCH_INTERVAL = 2.0
+
+
+class CatalogWatcher:
+    """Refreshes stale catalogs in a daemon thread while events are subscribed."""
+
+    def __init__(self, interval: float = WATCH_INTERVAL):
+        """
+        Initialize a stopped watcher.
+
+        Args:
+            interval: Seconds between two checks
+        """
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the watcher thread (no-op if already running)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="catalog-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the watcher thread and wait for it."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def check(self) -> int:
+        """
+        Refresh the loaded catalogs whose directory changed.
+
+        Returns:
+            Number of catalogs refreshed
+        """
+        refreshed = 0
+        for name, catalog in get_catalog_warmup().catalogs().items():
+            try:
+                if catalog.is_stale():
+                    catalog.ensure_fresh()
+                    refreshed += 1
+            except Exception:
+                logger.exception(f"Failed to refresh the {name} catalog")
+        return refreshed
+
+    def _run(self) -> None:
+        """Check the catalogs every interval while there are subscribers."""
+        while not self._stop.wait(self.interval):
+            if get_event_bus().subscriber_count:
+                self.check()
+
+
+# Global watcher instance
+_watcher_instance: Optional[CatalogWatcher] = None
+
+
+def get_catalog_watcher() -> CatalogWatcher:
+    """
+    Get the global catalog watcher.
+
+    Returns:
+        CatalogWatcher instance
+    """
+    global _watcher_instance
+
+    if _watcher_instance is None:
+        _watcher_instance = CatalogWatcher()
+
+    return _watcher_instance
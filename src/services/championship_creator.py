@@ -4,6 +4,7 @@ Service for creating custom championships.
 Orchestrates RFM generation and vehicle isolation.
 """
 
+import logging
 from pathlib import Path
 from typing import List, Dict, Optional
 
@@ -11,6 +12,8 @@ from ..models.rfm import RFMod, Season, DefaultScoring, SeasonScoringInfo, PitGr
 from ..generators.rfm_generator import generate_rfm
 from .vehicle_isolation_service import VehicleIsolationService
 
+logger = logging.getLogger(__name__)
+
 
 class ChampionshipCreator:
     """Service for creating custom championships."""
@@ -116,7 +119,7 @@ class ChampionshipCreator:
             raise ValueError(f"Championship '{championship_name}' already exists at {rfm_path}")
 
         # Step 1: Isolate vehicles
-        print(f"Isolating {len(vehicle_assignments)} vehicles...")
+        logger.info(f"Isolating {len(vehicle_assignments)} vehicles...")
         try:
             isolated_paths = self.isolation_service.isolate_vehicles(
                 championship_name,
@@ -130,7 +133,7 @@ class ChampionshipCreator:
             raise IOError("No vehicles were successfully isolated")
 
         # Step 2: Create RFM
-        print(f"Creating RFM file...")
+        logger.info("Creating RFM file...")
         try:
             rfm = self._create_rfm(
                 championship_name,
@@ -152,7 +155,7 @@ class ChampionshipCreator:
                 pass  # Ignore cleanup errors
             raise IOError(f"Failed to generate RFM file: {e}")
 
-        print(f"Championship created successfully: {rfm_path}")
+        logger.info(f"Championship created successfully: {rfm_path}")
         return str(rfm_path)
 
     def _create_rfm(
@@ -269,7 +272,7 @@ class ChampionshipCreator:
         if rfm_path.exists():
             try:
                 rfm_path.unlink()
-                print(f"Deleted RFM file: {rfm_path}")
+                logger.info(f"Deleted RFM file: {rfm_path}")
                 rfm_deleted = True
             except Exception as e:
                 raise IOError(f"Failed to delete RFM file {rfm_path}: {e}")
@@ -279,12 +282,12 @@ class ChampionshipCreator:
             self.isolation_service.cleanup_championship_vehicles(championship_name)
         except Exception as e:
             if rfm_deleted:
-                print(f"Warning: RFM deleted but vehicles cleanup failed: {e}")
+                logger.warning(f"RFM deleted but vehicles cleanup failed: {e}")
             else:
                 raise IOError(f"Failed to cleanup vehicles: {e}")
 
         if not rfm_deleted:
-            print(f"Championship '{championship_name}' not found")
+            logger.warning(f"Championship '{championship_name}' not found")
 
     def list_custom_championships(self) -> List[str]:
         """
@@ -4,8 +4,10 @@ Service for managing rFactor Championships.
 Provides methods to list, get, create, and manage championships.
 """
 
+import io
+import zipfile
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from ..models.championship import Championship
 from ..models.rfm import RFMod
@@ -13,7 +15,8 @@ from ..parsers.cch_parser import CCHParser
 from ..parsers.rfm_parser import RFMParser
 from ..generators.cch_generator import CCHGenerator
 from ..utils.file_utils import find_files_by_extension
-from ..utils.rfactor_validator import RFactorValidator
+from ..utils.installation_cache import get_installation_cache
+from .batch_executor import BatchExecutor, BatchResult
 
 
 class ChampionshipService:
@@ -35,7 +38,7 @@ class ChampionshipService:
 
         # Validate rFactor installation if requested
         if validate:
-            RFactorValidator.validate_or_raise(str(self.rfactor_path))
+            get_installation_cache().validate_or_raise(str(self.rfactor_path))
 
         # Auto-detect or create player if not specified
         if player_name is None:
@@ -382,3 +385,98 @@ class ChampionshipService:
         self.create(championship, new_filename)
 
         return championship
+
+    def duplicate_many(
+        self,
+        pairs: List[Tuple[str, str]],
+        executor: Optional[BatchExecutor] = None
+    ) -> BatchResult:
+        """
+        Duplicate several championships in one batch.
+
+        Args:
+            pairs: List of (source_filename, new_filename) tuples
+            executor: BatchExecutor to use (default: a new one)
+
+        Returns:
+            BatchResult with one entry per pair (item is the new filename)
+        """
+        executor = executor or BatchExecutor()
+
+        # Two items targeting the same new file would race on create()
+        seen = set()
+        duplicated_targets = set()
+        for _, new_filename in pairs:
+            key = new_filename.lower()
+            if key in seen:
+                duplicated_targets.add(key)
+            seen.add(key)
+
+        def _duplicate(pair: Tuple[str, str]) -> str:
+            source_filename, new_filename = pair
+            if new_filename.lower() in duplicated_targets:
+                raise ValueError(f"Duplicate target name in batch: {new_filename}")
+            self.duplicate(source_filename, new_filename)
+            return source_filename
+
+        return executor.run(_duplicate, pairs, label=lambda pair: pair[1])
+
+    def delete_many(self, filenames: List[str], executor: Optional[BatchExecutor] = None) -> BatchResult:
+        """
+        Delete several championships in one batch.
+
+        Args:
+            filenames: Names of the championships to delete (without .cch)
+            executor: BatchExecutor to use (default: a new one)
+
+        Returns:
+            BatchResult with one entry per filename
+        """
+        executor = executor or BatchExecutor()
+        return executor.run(self.delete, filenames)
+
+    def export_many(
+        self,
+        filenames: List[str],
+        executor: Optional[BatchExecutor] = None
+    ) -> Tuple[bytes, BatchResult]:
+        """
+        Export several championships into a single zip archive.
+
+        Files are read on the worker pool and written to the archive in
+        input order. Championships that can't be read are reported in the
+        result, left out of the archive and listed in export_errors.txt.
+
+        Args:
+            filenames: Names of the championships to export (without .cch)
+            executor: BatchExecutor to use (default: a new one)
+
+        Returns:
+            Tuple of (zip archive bytes, BatchResult)
+        """
+        executor = executor or BatchExecutor()
+
+        def _read(filename: str) -> bytes:
+            if not filename.endswith('.cch'):
+                filename = f"{filename}.cch"
+            filepath = self.userdata_dir / filename
+            if not filepath.exists():
+                raise FileNotFoundError(f"Championship not found: {filename}")
+            return filepath.read_bytes()
+
+        result = executor.run(_read, filenames)
+
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+            for item in result.results:
+                if item.success:
+                    name = item.item if item.item.endswith('.cch') else f"{item.item}.cch"
+                    archive.writestr(name, item.data)
+                    # Don't keep file contents around in the result
+                    item.data = None
+
+            if result.error_count:
+                errors = [f"{r.item}: {r.message}" for r in result.results if not r.success]
+                archive.writestr('export_errors.txt', "\n".join(errors) + "\n")
+
+        return buffer.getvalue(), result
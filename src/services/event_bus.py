@@ -0,0 +1,222 @@
+"""
+In-process publish/subscribe of application events.
+
+Services publish events from any thread (catalog refreshes, vehicle
+isolation, CSV imports...) and the /api/events endpoint streams them to
+the browsers as server-sent events, so the UI updates without polling.
+
+Each event has an increasing id. The last HISTORY_SIZE events are kept, so
+a client reconnecting with the id of the last event it received (the
+Last-Event-ID header of EventSource) gets the events it missed.
+"""
+
+import asyncio
+import itertools
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Set
+
+from ..utils.metrics import get_metrics
+
+EVENTS_PUBLISHED = get_metrics().counter(
+    "rfactor_events_published_total",
+    "Events published to the server-sent events stream",
+    ("type",),
+)
+
+# Number of past events kept for reconnecting clients
+HISTORY_SIZE = 256
+
+# Events queued per subscriber before it is considered too slow
+QUEUE_SIZE = 1000
+
+
+@dataclass
+class Event:
+    """One application event."""
+
+    id: int
+    type: str
+    data: Dict[str, Any]
+    timestamp: float = field(default_factory=time.time)
+
+
+class SubscriptionOverflow(Exception):
+    """Raised when events were missed by a subscriber."""
+    pass
+
+
+class Subscription:
+    """Events queued for one subscriber, consumed in its event loop."""
+
+    def __init__(self, bus: "EventBus", loop: asyncio.AbstractEventLoop, types: Optional[Set[str]] = None):
+        """
+        Initialize the subscription.
+
+        Args:
+            bus: Event bus the subscription belongs to
+            loop: Event loop of the subscriber
+            types: Event types to receive (None = all)
+        """
+        self.bus = bus
+        self.loop = loop
+        self.types = types
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+        self.overflowed = False
+
+    def wants(self, event: Event) -> bool:
+        """Whether the subscriber receives this type of event."""
+        return self.types is None or event.type in self.types
+
+    def _deliver(self, event: Event) -> None:
+        """Queue an event (runs in the subscriber's event loop)."""
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+    async def get(self) -> Event:
+        """
+        Wait for the next event.
+
+        Returns:
+            Next event
+
+        Raises:
+            SubscriptionOverflow: If events were dropped because the
+                subscriber didn't keep up (it must reload its data)
+        """
+        if self.overflowed:
+            self.overflowed = False
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            raise SubscriptionOverflow()
+        return await self.queue.get()
+
+    def close(self) -> None:
+        """Stop receiving events."""
+        self.bus.unsubscribe(self)
+
+
+class EventBus:
+    """Thread-safe publisher of events to asyncio subscribers."""
+
+    def __init__(self, history_size: int = HISTORY_SIZE):
+        """
+        Initialize an empty bus.
+
+        Args:
+            history_size: Number of past events kept for replay
+        """
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._history: Deque[Event] = deque(maxlen=history_size)
+        self._subscriptions: List[Subscription] = []
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of connected subscribers."""
+        return len(self._subscriptions)
+
+    @property
+    def last_event_id(self) -> int:
+        """Id of the last published event (0 if none)."""
+        with self._lock:
+            return self._history[-1].id if self._history else 0
+
+    def publish(self, event_type: str, data: Dict[str, Any]) -> Event:
+        """
+        Publish an event to all subscribers.
+
+        Safe to call from any thread; never blocks on subscribers.
+
+        Args:
+            event_type: Type of the event (e.g., "catalog")
+            data: JSON-serializable payload
+
+        Returns:
+            Published event
+        """
+        with self._lock:
+            event = Event(id=next(self._ids), type=event_type, data=data)
+            self._history.append(event)
+            subscriptions = list(self._subscriptions)
+
+        EVENTS_PUBLISHED.inc(type=event_type)
+        for subscription in subscriptions:
+            if subscription.wants(event):
+                try:
+                    subscription.loop.call_soon_threadsafe(subscription._deliver, event)
+                except RuntimeError:
+                    # The subscriber's event loop is closed
+                    self.unsubscribe(subscription)
+        return event
+
+    def subscribe(
+        self,
+        types: Optional[Set[str]] = None,
+        last_event_id: Optional[int] = None,
+    ) -> Subscription:
+        """
+        Subscribe the current event loop to events.
+
+        Args:
+            types: Event types to receive (None = all)
+            last_event_id: Id of the last event the subscriber received, to
+                           replay the events published since
+
+        Returns:
+            Subscription to read events from
+
+        Raises:
+            SubscriptionOverflow: If events after last_event_id are no
+                longer in the history (the subscriber must reload its data)
+        """
+        subscription = Subscription(self, asyncio.get_running_loop(), types)
+        with self._lock:
+            if last_event_id is not None:
+                latest = self._history[-1].id if self._history else 0
+                oldest = self._history[0].id if self._history else 1
+                # Missed events left the history, or the server restarted
+                if last_event_id < oldest - 1 or last_event_id > latest:
+                    raise SubscriptionOverflow()
+                for event in self._history:
+                    if event.id > last_event_id and subscription.wants(event):
+                        subscription._deliver(event)
+            self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """
+        Remove a subscription (no-op if already removed).
+
+        Args:
+            subscription: Subscription to remove
+        """
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+
+
+# Global bus instance
+_bus_instance: Optional[EventBus] = None
+_bus_lock = threading.Lock()
+
+
+def get_event_bus() -> EventBus:
+    """
+    Get the global event bus.
+
+    Returns:
+        EventBus instance
+    """
+    global _bus_instance
+
+    if _bus_instance is None:
+        with _bus_lock:
+            if _bus_instance is None:
+                _bus_instance = EventBus()
+
+    return _bus_instance
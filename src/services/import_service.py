@@ -4,14 +4,22 @@ Service for importing talents from CSV files.
 Supports importing driver lists from CSV format into rFactor talent files.
 """
 
+import asyncio
+import codecs
 import csv
+import io
+import itertools
+import queue
+import threading
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import AsyncIterator, Iterable, Iterator, List, Dict, Optional, TextIO, Tuple, Union
 from dataclasses import dataclass, field
 
 from ..models.talent import Talent, TalentPersonalInfo, TalentStats
+from .batch_executor import BatchExecutor
+from .event_bus import get_event_bus
 from .talent_service import TalentService
-from ..utils.talent_randomizer import TalentRandomizer
+from ..utils.talent_randomizer import TalentRandomizer, make_rng
 
 
 @dataclass
@@ -63,14 +71,19 @@ class ImportService:
 
     ALL_COLUMNS = ['name'] + PERSONAL_INFO_COLUMNS + STATS_COLUMNS
 
-    def __init__(self, talent_service: TalentService):
+    # Number of parsed rows written to disk together
+    WRITE_BATCH_SIZE = 500
+
+    def __init__(self, talent_service: TalentService, executor: Optional[BatchExecutor] = None):
         """
         Initialize the ImportService.
 
         Args:
             talent_service: TalentService instance for creating talents
+            executor: BatchExecutor used by the .rcd batch writer (default: new executor)
         """
         self.talent_service = talent_service
+        self.executor = executor or BatchExecutor()
 
     @staticmethod
     def validate_csv_headers(headers: List[str]) -> Tuple[bool, Optional[str]]:
@@ -97,7 +110,7 @@ class ImportService:
         return True, None
 
     @staticmethod
-    def parse_csv_row(row: Dict[str, str], row_num: int, fill_missing: bool = True) -> Talent:
+    def parse_csv_row(row: Dict[str, str], row_num: int, fill_missing: bool = True, rng=None) -> Talent:
         """
         Parse a CSV row into a Talent object.
 
@@ -105,6 +118,7 @@ class ImportService:
             row: Dictionary of column_name -> value
             row_num: Row number (for error reporting)
             fill_missing: If True, use TalentRandomizer to fill missing/empty fields
+            rng: Random generator used to fill missing fields (default: new generator)
 
         Returns:
             Talent object
@@ -113,7 +127,7 @@ class ImportService:
             ValueError: If row data is invalid
         """
         # Normalize keys to lowercase
-        row = {k.lower().strip(): v.strip() for k, v in row.items()}
+        row = {k.lower().strip(): (v or '').strip() for k, v in row.items() if k is not None}
 
         # Extract name
         name = row.get('name', '').strip()
@@ -124,10 +138,11 @@ class ImportService:
         data = {'name': name}
 
         # Helper to get value or None/empty
-        def get_value(key, convert_fn=str, default=''):
-            val = row.get(key, default).strip()
-            if not val or val == '':
-                return None
+        def get_value(key, convert_fn=str, default=None):
+            val = row.get(key)
+            val = '' if val is None else val.strip()
+            if not val:
+                return default
             try:
                 return convert_fn(val)
             except (ValueError, TypeError):
@@ -152,7 +167,7 @@ class ImportService:
 
         # Fill missing fields with randomizer if requested
         if fill_missing:
-            data = TalentRandomizer.fill_missing_fields(data)
+            data = TalentRandomizer.fill_missing_fields(data, rng=rng)
 
         # Create talent objects
         try:
@@ -191,89 +206,153 @@ class ImportService:
 
     def import_from_csv(
         self,
-        csv_path: str,
+        source: Union[str, Path, TextIO],
         overwrite_existing: bool = True,
         fill_missing: bool = True,
         validate_only: bool = False,
+        seed: Optional[int] = None,
     ) -> ImportResult:
         """
-        Import talents from a CSV file.
+        Import talents from a CSV file or text stream.
+
+        Rows are read one at a time, so the CSV is never fully loaded in
+        memory. Existing talents are looked up in a set built from a single
+        scan of the Talent directory, and .rcd files are written in
+        parallel batches of WRITE_BATCH_SIZE rows.
 
         Args:
-            csv_path: Path to the CSV file
+            source: Path to the CSV file, or an open text stream
+                    (opened with newline='')
             overwrite_existing: If True, overwrite talents that already exist (default: True)
             fill_missing: If True, use randomizer to fill missing/empty fields (default: True)
             validate_only: If True, only validate without creating files
+            seed: Random seed for the filled fields (same CSV + seed = same talents)
 
         Returns:
-            ImportResult with success/error counts and details
+            ImportResult with success/error counts and details (sorted by row)
 
         Raises:
             FileNotFoundError: If CSV file doesn't exist
             ValueError: If CSV format is invalid
+            csv.Error: If a CSV record can't be parsed
+        """
+        if isinstance(source, (str, Path)):
+            csv_file = Path(source)
+            if not csv_file.exists():
+                raise FileNotFoundError(f"CSV file not found: {source}")
+
+            with open(csv_file, 'r', encoding='utf-8-sig', newline='') as f:
+                return self.import_from_csv(f, overwrite_existing, fill_missing, validate_only, seed)
+
+        reader = csv.DictReader(source)
+
+        # Validate headers
+        if not reader.fieldnames:
+            raise ValueError("CSV file is empty or has no headers")
+
+        run = self._start_import(reader.fieldnames, overwrite_existing, fill_missing, validate_only, seed)
+        for row_num, row in enumerate(reader, start=2):  # Start at 2 (header is row 1)
+            run.add_row(row_num, row)
+        return run.finish()
+
+    async def import_from_chunks(
+        self,
+        chunks: AsyncIterator[bytes],
+        overwrite_existing: bool = True,
+        fill_missing: bool = True,
+        validate_only: bool = False,
+        encoding: str = 'utf-8-sig',
+        seed: Optional[int] = None,
+    ) -> ImportResult:
+        """
+        Import talents from an async iterator of raw CSV bytes.
+
+        Chunks are decoded incrementally and their lines read by a single
+        csv.DictReader in a worker thread (as import_from_csv does), so
+        memory use depends on the chunk size and WRITE_BATCH_SIZE, not on
+        the size of the upload.
+
+        Args:
+            chunks: Async iterator of bytes (e.g., successive UploadFile.read calls)
+            overwrite_existing: If True, overwrite talents that already exist (default: True)
+            fill_missing: If True, use randomizer to fill missing/empty fields (default: True)
+            validate_only: If True, only validate without creating files
+            encoding: Text encoding of the CSV (default: UTF-8, with optional BOM)
+            seed: Random seed for the filled fields (same CSV + seed = same talents)
+
+        Returns:
+            ImportResult with success/error counts and details (sorted by row)
+
+        Raises:
+            ValueError: If CSV format or encoding is invalid
+            csv.Error: If a CSV record can't be parsed
         """
-        csv_file = Path(csv_path)
-        if not csv_file.exists():
-            raise FileNotFoundError(f"CSV file not found: {csv_path}")
-
-        result = ImportResult()
-
-        # Read CSV
-        with open(csv_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-
-            # Validate headers
-            if not reader.fieldnames:
-                raise ValueError("CSV file is empty or has no headers")
-
-            is_valid, error = self.validate_csv_headers(reader.fieldnames)
-            if not is_valid:
-                raise ValueError(error)
-
-            # Process each row
-            for row_num, row in enumerate(reader, start=2):  # Start at 2 (header is row 1)
-                try:
-                    # Parse talent from row (with optional field filling)
-                    talent = self.parse_csv_row(row, row_num, fill_missing=fill_missing)
-
-                    # Check if talent already exists
-                    talent_exists = self.talent_service.exists(talent.name)
-
-                    if talent_exists:
-                        if overwrite_existing:
-                            # Overwrite existing talent
-                            if not validate_only:
-                                self.talent_service.update(talent.name, talent)
-                            result.add_success(overwrite=True)
-                            result.add_warning(
-                                row_num,
-                                talent.name,
-                                "Talent already exists - overwritten with CSV data"
-                            )
-                        else:
-                            # Skip existing talent
-                            result.add_error(
-                                row_num,
-                                talent.name,
-                                "Talent already exists (skipped - overwrite disabled)"
-                            )
-                            continue
-                    else:
-                        # Create new talent
-                        if not validate_only:
-                            self.talent_service.create(talent)
-                        result.add_success(overwrite=False)
-
-                except ValueError as e:
-                    result.add_error(row_num, row.get('name', 'Unknown'), str(e))
-                except Exception as e:
-                    result.add_error(
-                        row_num,
-                        row.get('name', 'Unknown'),
-                        f"Unexpected error: {e}"
-                    )
-
-        return result
+        decoder = codecs.getincrementaldecoder(encoding)()
+        lines = _LineQueue()
+        importer = asyncio.ensure_future(asyncio.to_thread(
+            self._import_lines, lines, overwrite_existing, fill_missing, validate_only, seed
+        ))
+
+        try:
+            async for chunk in chunks:
+                if importer.done():
+                    # The import failed: its error is raised below
+                    break
+                await asyncio.to_thread(lines.put, decoder.decode(chunk))
+            else:
+                await asyncio.to_thread(lines.put, decoder.decode(b'', final=True))
+                await asyncio.to_thread(lines.close)
+        except BaseException:
+            # Decoding error or interrupted upload: stop the import thread
+            await asyncio.to_thread(lines.abort)
+            await asyncio.gather(importer, return_exceptions=True)
+            raise
+
+        return await importer
+
+    def _import_lines(
+        self,
+        lines: '_LineQueue',
+        overwrite_existing: bool,
+        fill_missing: bool,
+        validate_only: bool,
+        seed: Optional[int],
+    ) -> ImportResult:
+        """Import the lines of a _LineQueue (runs in a worker thread)."""
+        try:
+            return self.import_from_csv(lines, overwrite_existing, fill_missing, validate_only, seed)
+        finally:
+            lines.stop()
+
+    def _start_import(
+        self,
+        fieldnames: List[str],
+        overwrite_existing: bool,
+        fill_missing: bool,
+        validate_only: bool,
+        seed: Optional[int] = None,
+    ) -> '_ImportRun':
+        """
+        Validate the CSV headers and prepare an import.
+
+        Args:
+            fieldnames: CSV header row
+            overwrite_existing: If True, overwrite talents that already exist
+            fill_missing: If True, use randomizer to fill missing/empty fields
+            validate_only: If True, only validate without creating files
+            seed: Random seed for the filled fields
+
+        Returns:
+            _ImportRun to feed rows to
+
+        Raises:
+            ValueError: If required columns are missing
+        """
+        is_valid, error = self.validate_csv_headers(fieldnames)
+        if not is_valid:
+            raise ValueError(error)
+
+        return _ImportRun(self, overwrite_existing, fill_missing, validate_only, seed)
 
     @staticmethod
     def generate_csv_template(output_path: str) -> None:
@@ -327,55 +406,378 @@ class ImportService:
             writer.writeheader()
             writer.writerows(template_data)
 
-    def export_to_csv(self, output_path: str, talent_names: Optional[List[str]] = None) -> int:
+    @classmethod
+    def validate_export_columns(cls, columns: Optional[List[str]]) -> List[str]:
+        """
+        Validate a column selection for export.
+
+        Args:
+            columns: Column names in the desired order (None = all columns)
+
+        Returns:
+            List of lowercase column names
+
+        Raises:
+            ValueError: If a column is unknown
+        """
+        if not columns:
+            return list(cls.ALL_COLUMNS)
+
+        selected = [c.lower().strip() for c in columns if c and c.strip()]
+        unknown = [c for c in selected if c not in cls.ALL_COLUMNS]
+        if unknown:
+            raise ValueError(
+                f"Unknown columns: {', '.join(unknown)}. "
+                f"Available columns: {', '.join(cls.ALL_COLUMNS)}"
+            )
+        return selected or list(cls.ALL_COLUMNS)
+
+    def select_talents(self, talent_names: Optional[List[str]] = None) -> Iterable[Talent]:
+        """
+        Get the talents to export from the talent catalog.
+
+        Exporting all talents is lazy: the catalog is only read when the
+        result is iterated. Named talents are resolved immediately so that
+        unknown names are reported before anything is written.
+
+        Args:
+            talent_names: Talent names to export (None = all)
+
+        Returns:
+            Iterable of Talent objects
+
+        Raises:
+            ValueError: If a talent doesn't exist
+        """
+        catalog = self.talent_service.get_catalog()
+
+        if talent_names is None:
+            # A generator function, not a generator expression: the latter
+            # would call catalog.items() right away
+            def _all() -> Iterator[Talent]:
+                yield from catalog.items()
+
+            return _all()
+
+        talents = []
+        for name in talent_names:
+            talent = catalog.by_filename(self.talent_service.get_filepath(name).stem)
+            if not talent:
+                raise ValueError(f"Talent not found: {name}")
+            talents.append(talent)
+        return talents
+
+    @classmethod
+    def iter_csv(
+        cls,
+        talents: Iterable[Talent],
+        columns: Optional[List[str]] = None,
+        rows_per_chunk: int = 256,
+    ) -> Iterator[str]:
+        """
+        Generate CSV text for talents, a few rows at a time.
+
+        The header is yielded first, on its own, so a streamed response can
+        start immediately.
+
+        Args:
+            talents: Talents to write
+            columns: Columns to include (None = ALL_COLUMNS)
+            rows_per_chunk: Number of rows per yielded chunk
+
+        Yields:
+            CSV text chunks
+        """
+        columns = cls.validate_export_columns(columns)
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        def _take() -> str:
+            text = buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            return text
+
+        writer.writerow(columns)
+        yield _take()
+
+        count = 0
+        for talent in talents:
+            info = talent.personal_info
+            stats = talent.stats
+            values = {
+                'name': talent.name,
+                'nationality': info.nationality,
+                'date_of_birth': info.date_of_birth,
+                'starts': info.starts,
+                'poles': info.poles,
+                'wins': info.wins,
+                'drivers_championships': info.drivers_championships,
+                'aggression': stats.aggression,
+                'reputation': stats.reputation,
+                'courtesy': stats.courtesy,
+                'composure': stats.composure,
+                'speed': stats.speed,
+                'crash': stats.crash,
+                'recovery': stats.recovery,
+                'completed_laps': stats.completed_laps,
+                'min_racing_skill': stats.min_racing_skill,
+            }
+            writer.writerow([values[c] for c in columns])
+            count += 1
+            if count % rows_per_chunk == 0:
+                yield _take()
+
+        rest = _take()
+        if rest:
+            yield rest
+
+    def export_to_csv(
+        self,
+        output_path: str,
+        talent_names: Optional[List[str]] = None,
+        columns: Optional[List[str]] = None,
+    ) -> int:
         """
         Export talents to CSV file.
 
         Args:
             output_path: Path where to save the CSV
             talent_names: Optional list of talent names to export (None = all)
+            columns: Optional list of columns to export (None = all)
 
         Returns:
             Number of talents exported
 
         Raises:
-            ValueError: If a talent doesn't exist
+            ValueError: If a talent doesn't exist or a column is unknown
         """
-        # Get talents to export
-        if talent_names is None:
-            talents = self.talent_service.list_all_talents()
-        else:
-            talents = []
-            for name in talent_names:
-                talent = self.talent_service.get(name)
-                if not talent:
-                    raise ValueError(f"Talent not found: {name}")
-                talents.append(talent)
-
-        # Write to CSV
+        columns = self.validate_export_columns(columns)
+        talents = self.select_talents(talent_names)
+
+        count = 0
+
+        def _counted(items: Iterable[Talent]) -> Iterator[Talent]:
+            nonlocal count
+            for talent in items:
+                count += 1
+                yield talent
+
         with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=self.ALL_COLUMNS)
-            writer.writeheader()
+            for chunk in self.iter_csv(_counted(talents), columns):
+                f.write(chunk)
+
+        return count
+
+
+class _LineQueue:
+    """
+    Decoded CSV text passed from the event loop to the import thread.
+
+    The event loop puts text as it is received; the import thread iterates
+    over its lines with csv.DictReader, which pulls the next lines itself
+    when a quoted field spans several of them. At most MAX_PENDING pieces
+    of text are queued, so a slow import slows down the upload instead of
+    buffering it.
+    """
 
-            for talent in talents:
-                row = {
-                    'name': talent.name,
-                    'nationality': talent.personal_info.nationality,
-                    'date_of_birth': talent.personal_info.date_of_birth,
-                    'starts': talent.personal_info.starts,
-                    'poles': talent.personal_info.poles,
-                    'wins': talent.personal_info.wins,
-                    'drivers_championships': talent.personal_info.drivers_championships,
-                    'aggression': talent.stats.aggression,
-                    'reputation': talent.stats.reputation,
-                    'courtesy': talent.stats.courtesy,
-                    'composure': talent.stats.composure,
-                    'speed': talent.stats.speed,
-                    'crash': talent.stats.crash,
-                    'recovery': talent.stats.recovery,
-                    'completed_laps': talent.stats.completed_laps,
-                    'min_racing_skill': talent.stats.min_racing_skill,
-                }
-                writer.writerow(row)
-
-        return len(talents)
+    MAX_PENDING = 16
+
+    # Queue items marking the end of the text and an interrupted upload
+    _END = object()
+    _ABORT = object()
+
+    def __init__(self):
+        self._queue: queue.Queue = queue.Queue(maxsize=self.MAX_PENDING)
+        self._partial_line = ''
+        self._stopped = threading.Event()
+
+    def put(self, text: str) -> None:
+        """
+        Queue decoded text (blocks while the queue is full).
+
+        Args:
+            text: Next piece of CSV text
+        """
+        text = self._partial_line + text
+        end = text.rfind('\n') + 1
+        self._partial_line = text[end:]
+        if end:
+            self._put(text[:end])
+
+    def close(self) -> None:
+        """Queue the last line (if it has no newline) and the end of the text."""
+        if self._partial_line:
+            self._put(self._partial_line)
+            self._partial_line = ''
+        self._put(self._END)
+
+    def abort(self) -> None:
+        """Make the iteration raise ValueError (the upload was interrupted)."""
+        self._put(self._ABORT)
+
+    def stop(self) -> None:
+        """Called by the import thread when it stops reading (discards later text)."""
+        self._stopped.set()
+
+    def _put(self, item) -> None:
+        """Queue an item, unless the import thread stopped reading."""
+        while not self._stopped.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def __iter__(self) -> Iterator[str]:
+        while True:
+            item = self._queue.get()
+            if item is self._END:
+                return
+            if item is self._ABORT:
+                raise ValueError("CSV upload interrupted")
+            # Split on newlines only, keeping them (like a file opened with newline='')
+            start = 0
+            while start < len(item):
+                end = item.find('\n', start) + 1 or len(item)
+                yield item[start:end]
+                start = end
+
+
+# Ids of the imports, reported in the "import" progress events
+_import_ids = itertools.count(1)
+
+
+class _ImportRun:
+    """State of one CSV import: existing talents, pending writes and results."""
+
+    def __init__(
+        self,
+        service: ImportService,
+        overwrite_existing: bool,
+        fill_missing: bool,
+        validate_only: bool,
+        seed: Optional[int] = None,
+    ):
+        self.service = service
+        self.talent_service = service.talent_service
+        self.overwrite_existing = overwrite_existing
+        self.fill_missing = fill_missing
+        self.validate_only = validate_only
+
+        # One generator per import: rows are parsed in order, so a seed
+        # reproduces the same filled values
+        self.rng = make_rng(seed)
+
+        self.result = ImportResult()
+        self.existing = self.talent_service.existing_filenames()
+
+        # filename -> (row_num, talent, overwrite), written on flush
+        self.pending: Dict[str, Tuple[int, Talent, bool]] = {}
+
+        self.import_id = next(_import_ids)
+        self._publish("started")
+
+    def _publish(self, status: str) -> None:
+        """Publish the progress of the import as an "import" event."""
+        get_event_bus().publish("import", {
+            "import_id": self.import_id,
+            "status": status,
+            "validate_only": self.validate_only,
+            "rows": self.result.total,
+            "success": self.result.success_count,
+            "errors": self.result.error_count,
+        })
+
+    def add_row(self, row_num: int, row: Dict[str, str]) -> None:
+        """
+        Parse one CSV row and queue it for writing.
+
+        Args:
+            row_num: Row number in the CSV (header is row 1)
+            row: Dictionary of column_name -> value
+        """
+        result = self.result
+        name = (row.get('name') or 'Unknown').strip() or 'Unknown'
+        try:
+            # Parse talent from row (with optional field filling)
+            talent = self.service.parse_csv_row(row, row_num, fill_missing=self.fill_missing, rng=self.rng)
+        except ValueError as e:
+            result.add_error(row_num, name, str(e))
+            return
+        except Exception as e:
+            result.add_error(row_num, name, f"Unexpected error: {e}")
+            return
+
+        filename = self.talent_service.get_filepath(talent.name).stem.lower()
+        talent_exists = filename in self.existing
+
+        if talent_exists and not self.overwrite_existing:
+            result.add_error(
+                row_num,
+                talent.name,
+                "Talent already exists (skipped - overwrite disabled)"
+            )
+            return
+
+        # The same talent twice in a batch: write the first one before queuing the second
+        if filename in self.pending:
+            self.flush()
+
+        self.pending[filename] = (row_num, talent, talent_exists)
+        self.existing.add(filename)
+
+        if len(self.pending) >= self.service.WRITE_BATCH_SIZE:
+            self.flush()
+
+    def add_rows(self, rows: List[Tuple[int, Dict[str, str]]]) -> None:
+        """
+        Add several (row_num, row) pairs.
+
+        Args:
+            rows: Rows to add, in CSV order
+        """
+        for row_num, row in rows:
+            self.add_row(row_num, row)
+
+    def flush(self) -> None:
+        """Write the pending talents and record the outcome of each row."""
+        if not self.pending:
+            return
+
+        entries = list(self.pending.values())
+        self.pending.clear()
+
+        if self.validate_only:
+            outcomes = [(True, "")] * len(entries)
+        else:
+            batch = self.talent_service.write_many([entry[1] for entry in entries], self.service.executor)
+            outcomes = [(r.success, r.message) for r in batch.results]
+
+        for (row_num, talent, overwrite), (success, message) in zip(entries, outcomes):
+            if not success:
+                self.result.add_error(row_num, talent.name, f"Unexpected error: {message}")
+                continue
+
+            self.result.add_success(overwrite=overwrite)
+            if overwrite:
+                self.result.add_warning(
+                    row_num,
+                    talent.name,
+                    "Talent already exists - overwritten with CSV data"
+                )
+
+        self._publish("running")
+
+    def finish(self) -> ImportResult:
+        """
+        Write the remaining talents and return the result.
+
+        Returns:
+            ImportResult with errors and warnings sorted by row
+        """
+        self.flush()
+        self.result.errors.sort(key=lambda e: e[0])
+        self.result.warnings.sort(key=lambda w: w[0])
+        self._publish("completed")
+        return self.result
@@ -0,0 +1,79 @@
+"""
+Batch writer for rFactor talent files (.rcd).
+
+Writes many talents at once: content is built directly with CRLF line
+endings, each file is written atomically (temporary file + rename) and the
+writes are spread over a thread pool.
+"""
+
+from pathlib import Path
+from typing import Iterable, Optional
+
+from ..generators.rcd_generator import RCDGenerator
+from ..models.talent import Talent
+from ..utils.file_utils import normalize_name_to_filename, write_file_atomic
+from .batch_executor import BatchExecutor, BatchResult
+
+
+class RCDBatchWriter:
+    """Writes many .rcd files into a Talent directory."""
+
+    def __init__(self, talent_dir: str | Path, executor: Optional[BatchExecutor] = None, fsync: bool = False):
+        """
+        Initialize the batch writer.
+
+        Args:
+            talent_dir: Directory to write to (GameData/Talent)
+            executor: BatchExecutor used to spread the writes (default: a new one)
+            fsync: Flush each file to disk before renaming it
+        """
+        self.talent_dir = Path(talent_dir)
+        self.executor = executor or BatchExecutor()
+        self.fsync = fsync
+
+    def path_for(self, talent: Talent) -> Path:
+        """
+        Get the path of the .rcd file for a talent.
+
+        Args:
+            talent: Talent to write
+
+        Returns:
+            Path inside the Talent directory
+        """
+        return self.talent_dir / (normalize_name_to_filename(talent.name) + '.rcd')
+
+    def write(self, talent: Talent) -> Path:
+        """
+        Write one talent atomically.
+
+        Args:
+            talent: Talent to write
+
+        Returns:
+            Path of the written file
+
+        Raises:
+            UnicodeEncodeError: If the talent can't be encoded in cp1252
+            OSError: If the file can't be written
+        """
+        path = self.path_for(talent)
+        write_file_atomic(str(path), RCDGenerator.to_bytes(talent), fsync=self.fsync)
+        return path
+
+    def write_many(self, talents: Iterable[Talent]) -> BatchResult:
+        """
+        Write many talents on the thread pool.
+
+        Talents must have distinct filenames; two talents mapping to the
+        same file would be written concurrently.
+
+        Args:
+            talents: Talents to write
+
+        Returns:
+            BatchResult with one entry per talent (item is the talent name,
+            data is the written path)
+        """
+        self.talent_dir.mkdir(parents=True, exist_ok=True)
+        return self.executor.run(self.write, talents, label=lambda talent: talent.name)
@@ -0,0 +1,136 @@
+"""
+Shared catalog of rFactor talents (GameData/Talent/*.rcd).
+
+Keeps parsed talents in memory across requests and persists them to an
+mtime-keyed index, so listings and exports don't re-parse every .rcd.
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+from ..models.talent import Talent
+from ..parsers.rcd_parser import RCDParser
+from ..utils.installation_stats import register_live_counts
+from .catalog import FileCatalog, get_catalog_index_path
+from .talent_stats_store import TalentStatsStore
+
+
+class TalentCatalog(FileCatalog[Talent]):
+    """Catalog of .rcd talents with a case-insensitive filename index."""
+
+    KIND = "talents"
+    EXTENSION = ".rcd"
+    RECURSIVE = False
+
+    def __init__(self, talent_dir: str | Path, index_path: Optional[str | Path] = None, max_workers: Optional[int] = None):
+        """
+        Initialize the talent catalog.
+
+        Args:
+            talent_dir: Path to GameData/Talent
+            index_path: Path of the persistent JSON index (None = no index)
+            max_workers: Number of threads used to parse files on cold scans
+        """
+        super().__init__(talent_dir, index_path, max_workers)
+        self._by_filename: Dict[str, Talent] = {}
+        self._stats_store: Optional[TalentStatsStore] = None
+        self._stats_generation = -1
+
+    def parse(self, file_path: str, relative_path: str) -> Optional[Talent]:
+        """Parse a .rcd file (Dialog.rcd is not a talent)."""
+        if os.path.splitext(relative_path)[0] == "Dialog":
+            return None
+        return RCDParser.parse_file(file_path)
+
+    def to_record(self, item: Talent) -> dict:
+        """Convert a talent to an index record."""
+        record = item.to_dict()
+        record.pop("file_path", None)
+        return record
+
+    def from_record(self, record: dict, file_path: str, relative_path: str) -> Talent:
+        """Rebuild a talent from an index record."""
+        talent = Talent.from_dict(record)
+        talent.file_path = file_path
+        return talent
+
+    def _rebuild_indexes(self) -> None:
+        """Index talents by lowercase filename (without extension)."""
+        self._by_filename = {
+            os.path.splitext(rel)[0].lower(): talent
+            for rel, talent in self._items.items()
+        }
+
+    def by_filename(self, filename: str) -> Optional[Talent]:
+        """
+        Get a talent by filename (case-insensitive, extension optional).
+
+        Args:
+            filename: Filename (e.g., "BrandonLang" or "BrandonLang.rcd")
+
+        Returns:
+            Talent or None if not in the catalog
+        """
+        self.ensure_fresh()
+        if filename.lower().endswith(".rcd"):
+            filename = filename[:-4]
+        with self._lock:
+            return self._by_filename.get(filename.lower())
+
+    def stats_store(self, force_reload: bool = False) -> TalentStatsStore:
+        """
+        Get the columnar stats of all talents.
+
+        The store is built once per catalog generation and shared by all
+        callers until a talent is added, modified or removed.
+
+        Args:
+            force_reload: If True, re-scan the whole directory first
+
+        Returns:
+            TalentStatsStore of the current talents
+        """
+        self.ensure_fresh(force_reload)
+        with self._lock:
+            if self._stats_store is None or self._stats_generation != self.generation:
+                self._stats_store = TalentStatsStore.from_talents(self._sorted)
+                self._stats_generation = self.generation
+            return self._stats_store
+
+
+# Shared catalogs, one per Talent directory
+_catalogs: Dict[str, TalentCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_talent_catalog(talent_dir: str | Path) -> TalentCatalog:
+    """
+    Get the shared talent catalog for a Talent directory.
+
+    Args:
+        talent_dir: Path to GameData/Talent
+
+    Returns:
+        TalentCatalog instance (created on first use)
+    """
+    key = os.path.normcase(os.path.abspath(str(talent_dir)))
+    with _catalogs_lock:
+        catalog = _catalogs.get(key)
+        if catalog is None:
+            catalog = TalentCatalog(talent_dir, get_catalog_index_path(talent_dir, "talents_index.json"))
+            _catalogs[key] = catalog
+        return catalog
+
+
+def _live_talent_counts(rfactor_path: str) -> Optional[Dict[str, int]]:
+    """Talent count from a loaded catalog, for InstallationStats."""
+    key = os.path.normcase(os.path.abspath(os.path.join(rfactor_path, "GameData", "Talent")))
+    catalog = _catalogs.get(key)
+    if catalog is None or not catalog.is_loaded:
+        return None
+    return {"": sum(catalog.counts_by_top_level().values())}
+
+
+register_live_counts("talents", _live_talent_counts)
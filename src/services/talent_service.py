@@ -4,14 +4,21 @@ Service for managing rFactor Talents (drivers).
 Provides methods to list, get, create, and search talents.
 """
 
+import os
+import random
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
-from ..models.talent import Talent
+from ..models.talent import Talent, TalentPersonalInfo, TalentStats
 from ..parsers.rcd_parser import RCDParser
 from ..generators.rcd_generator import RCDGenerator
 from ..utils.file_utils import find_files_by_extension, normalize_name_to_filename
-from ..utils.rfactor_validator import RFactorValidator
+from ..utils.installation_cache import get_installation_cache
+from ..utils.talent_randomizer import CAREER_FIELDS, RACING_STAT_FIELDS, TalentRandomizer
+from .batch_executor import BatchExecutor, BatchResult
+from .rcd_batch_writer import RCDBatchWriter
+from .talent_catalog import TalentCatalog, get_talent_catalog
+from .talent_stats_store import TalentStatsStore
 
 
 class TalentService:
@@ -32,7 +39,7 @@ class TalentService:
 
         # Validate rFactor installation if requested
         if validate:
-            RFactorValidator.validate_or_raise(str(self.rfactor_path))
+            get_installation_cache().validate_or_raise(str(self.rfactor_path))
 
         self.talent_dir = self.rfactor_path / "GameData" / "Talent"
 
@@ -53,28 +60,107 @@ class TalentService:
 
         return sorted([f.stem for f in rcd_files])
 
-    def list_all_talents(self) -> List[Talent]:
+    def existing_filenames(self) -> Set[str]:
         """
-        List all available talents (full Talent objects).
+        List the filenames of all existing talents in a single directory scan.
+
+        Useful to check many names at once without parsing any file
+        (see get_filepath for the name -> filename mapping).
 
         Returns:
-            List of Talent objects
+            Set of lowercase filenames without extension (Dialog excluded)
+        """
+        filenames = set()
+        with os.scandir(self.talent_dir) as it:
+            for entry in it:
+                stem, ext = os.path.splitext(entry.name)
+                if ext.lower() == '.rcd' and stem != 'Dialog' and entry.is_file():
+                    filenames.add(stem.lower())
+        return filenames
+
+    def get_filepath(self, name: str) -> Path:
+        """
+        Get the path of the .rcd file for a talent name.
+
+        Args:
+            name: Name of the talent (e.g., "Brandon Lang")
 
-        Note: This can be slow for large talent directories.
+        Returns:
+            Path to the .rcd file (which may not exist)
         """
-        names = self.list_all()
-        talents = []
+        return self.talent_dir / (normalize_name_to_filename(name) + '.rcd')
+
+    def get_catalog(self) -> TalentCatalog:
+        """
+        Get the shared talent catalog for this Talent directory.
+
+        Returns:
+            TalentCatalog shared by all TalentService instances
+        """
+        return get_talent_catalog(self.talent_dir)
 
+    def get_stats_store(self, force_reload: bool = False) -> TalentStatsStore:
+        """
+        Get the columnar stats of all talents, for aggregations.
+
+        Args:
+            force_reload: If True, re-scan the whole directory first
+
+        Returns:
+            TalentStatsStore shared until the talents change
+        """
+        return self.get_catalog().stats_store(force_reload)
+
+    def invalidate_cache(self, names: Optional[Iterable[str]] = None) -> None:
+        """
+        Mark talents as modified so the catalog re-reads them.
+
+        Must be called after writing .rcd files without going through
+        create/update/delete (e.g., bulk imports).
+
+        Args:
+            names: Talent names that were written (None = all talents)
+        """
+        catalog = self.get_catalog()
+        if names is None:
+            catalog.invalidate()
+            return
         for name in names:
-            try:
-                talent = self.get_by_filename(name)
-                if talent is not None:
-                    talents.append(talent)
-            except Exception:
-                # Skip talents that can't be parsed
-                continue
+            catalog.invalidate(self.get_filepath(name).name)
 
-        return talents
+    def write_many(self, talents: List[Talent], executor: Optional[BatchExecutor] = None) -> BatchResult:
+        """
+        Write many talents (create or overwrite) with the batch writer.
+
+        Files are written atomically on a thread pool and the catalog is
+        invalidated for them. Talents must have distinct filenames.
+
+        Args:
+            talents: Talents to write
+            executor: BatchExecutor to use (default: a new one)
+
+        Returns:
+            BatchResult with one entry per talent
+        """
+        result = RCDBatchWriter(self.talent_dir, executor).write_many(talents)
+        self.invalidate_cache(talent.name for talent in talents)
+        return result
+
+    def list_all_talents(self, force_reload: bool = False) -> List[Talent]:
+        """
+        List all available talents (full Talent objects).
+
+        Talents come from the shared catalog, so only files added or
+        modified since the last call are parsed. Files that can't be parsed
+        are skipped.
+
+        Args:
+            force_reload: If True, re-scan the Talent directory
+
+        Returns:
+            List of Talent objects sorted by filename
+        """
+        return self.get_catalog().items(force_reload)
 
     def get(self, name: str) -> Optional[Talent]:
         """
@@ -142,6 +228,7 @@ class TalentService:
             raise FileExistsError(f"Talent already exists: {talent.name}")
 
         RCDGenerator.generate(talent, str(filepath))
+        self.get_catalog().invalidate(filename)
 
     def update(self, talent: Talent) -> None:
         """
@@ -160,6 +247,7 @@ class TalentService:
             raise FileNotFoundError(f"Talent not found: {talent.name}")
 
         RCDGenerator.generate(talent, str(filepath))
+        self.get_catalog().invalidate(filename)
 
     def delete(self, name: str) -> None:
         """
@@ -178,6 +266,113 @@ class TalentService:
             raise FileNotFoundError(f"Talent not found: {name}")
 
         filepath.unlink()
+        self.get_catalog().invalidate(filename)
+
+    def generate_many(
+        self,
+        count: Optional[int] = None,
+        names: Optional[List[str]] = None,
+        name_pattern: str = "AI Driver {n}",
+        nationality_mix: Optional[Dict[str, float]] = None,
+        seed: Optional[int] = None,
+        executor: Optional[BatchExecutor] = None,
+    ) -> Tuple[BatchResult, List[str]]:
+        """
+        Generate random talents and write their .rcd files in parallel.
+
+        Names come from the names list if given, otherwise from name_pattern
+        where {n} is replaced by 1, 2, 3... Existing talents are checked in a
+        single scan of the Talent directory. Listed names that already exist
+        (or are repeated) are skipped; pattern numbers that are taken are
+        passed over, so the pattern always yields count new talents.
+
+        Args:
+            count: Number of talents (default: len(names))
+            names: Explicit driver names
+            name_pattern: Pattern used when names is not given (must contain {n})
+            nationality_mix: Nationality -> weight (default: uniform over
+                             TalentRandomizer.NATIONALITIES)
+            seed: Random seed for reproducible stats and nationalities
+            executor: BatchExecutor used by the batch writer (default: a new one)
+
+        Returns:
+            Tuple of (BatchResult with one entry per written talent, skipped names)
+
+        Raises:
+            ValueError: If the arguments are invalid
+        """
+        names = [n.strip() for n in names] if names else None
+        if count is None:
+            if not names:
+                raise ValueError("count is required when no names are given")
+            count = len(names)
+        if count < 1:
+            raise ValueError(f"count must be >= 1, got {count}")
+        if nationality_mix is not None:
+            nationality_mix = {k.strip(): w for k, w in nationality_mix.items() if k.strip() and w > 0}
+            if not nationality_mix:
+                raise ValueError("nationality_mix must contain at least one positive weight")
+
+        existing = self.existing_filenames()
+        selected, skipped = self._pick_new_names(count, names, name_pattern, existing)
+
+        rng = random.Random(seed)
+        batch = TalentRandomizer.generate_batch(len(selected), seed=seed)
+        if nationality_mix:
+            nationalities = rng.choices(list(nationality_mix), weights=list(nationality_mix.values()), k=len(selected))
+        else:
+            nationalities = batch.column("nationality")
+
+        talents = [
+            Talent(
+                name=name,
+                personal_info=TalentPersonalInfo(
+                    nationality=nationality,
+                    date_of_birth=row["date_of_birth"],
+                    **{f: row[f] for f in CAREER_FIELDS},
+                ),
+                stats=TalentStats(**{f: row[f] for f in RACING_STAT_FIELDS}),
+            )
+            for name, nationality, row in zip(selected, nationalities, batch.rows())
+        ]
+
+        return self.write_many(talents, executor), skipped
+
+    @staticmethod
+    def _pick_new_names(
+        count: int,
+        names: Optional[List[str]],
+        name_pattern: str,
+        existing: Set[str],
+    ) -> Tuple[List[str], List[str]]:
+        """Choose count names that don't collide with existing talents or each other."""
+        selected: List[str] = []
+        skipped: List[str] = []
+        taken = set(existing)
+
+        if names:
+            for name in names[:count]:
+                key = normalize_name_to_filename(name).lower()
+                if not name or key in taken:
+                    skipped.append(name)
+                    continue
+                taken.add(key)
+                selected.append(name)
+            return selected, skipped
+
+        if "{n}" not in name_pattern:
+            raise ValueError("name_pattern must contain {n}")
+
+        n = 0
+        while len(selected) < count:
+            n += 1
+            name = name_pattern.replace("{n}", str(n)).strip()
+            key = normalize_name_to_filename(name).lower()
+            if key in taken:
+                continue
+            taken.add(key)
+            selected.append(name)
+        return selected, skipped
 
     def search(self, query: str) -> List[Talent]:
         """
@@ -0,0 +1,250 @@
+"""
+Columnar store of talent statistics for overviews and dashboards.
+
+Holds one array per stat (plus names and nationalities) built once from the
+talent catalog, so aggregations over the whole pool (histograms,
+percentiles, per-nationality means) don't walk thousands of Talent objects
+on every request. Arrays are NumPy arrays, or plain lists on installs
+without NumPy; results are the same either way.
+"""
+
+import math
+import statistics
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ..models.talent import Talent
+from ..utils.optional_imports import optional_import
+from ..utils.talent_randomizer import CAREER_FIELDS, RACING_STAT_FIELDS
+
+# Columns that can be aggregated, in display order
+STAT_FIELDS = RACING_STAT_FIELDS + CAREER_FIELDS
+
+DEFAULT_PERCENTILES = (10, 25, 50, 75, 90)
+
+# NumPy is loaded on first use by _numpy(), to keep it out of the
+# application startup; aggregations fall back to pure Python without it
+_UNSET = object()
+np: Any = _UNSET
+
+
+def _numpy():
+    """Get NumPy, importing it on first use (None if not installed)."""
+    global np
+    if np is _UNSET:
+        np = optional_import("numpy")
+    return np
+
+
+class TalentStatsStore:
+    """Read-only columnar view of the talent pool."""
+
+    def __init__(self, names: Sequence[str], nationalities: Sequence[str], columns: Dict[str, Sequence]):
+        """
+        Initialize the store from prepared columns.
+
+        Use from_talents to build a store from Talent objects.
+
+        Args:
+            names: Talent names
+            nationalities: Nationality of each talent
+            columns: Stat name -> one value per talent
+        """
+        self.names = names
+        self.nationalities = nationalities
+        self.columns = columns
+
+    @classmethod
+    def from_talents(cls, talents: Sequence[Talent]) -> "TalentStatsStore":
+        """
+        Build a store from talents.
+
+        Args:
+            talents: Talents (e.g., TalentCatalog.items())
+
+        Returns:
+            TalentStatsStore with one row per talent
+        """
+        names = [t.name for t in talents]
+        nationalities = [t.personal_info.nationality for t in talents]
+        columns: Dict[str, Sequence] = {}
+        for field_name in RACING_STAT_FIELDS:
+            columns[field_name] = [getattr(t.stats, field_name) for t in talents]
+        for field_name in CAREER_FIELDS:
+            columns[field_name] = [getattr(t.personal_info, field_name) for t in talents]
+
+        if _numpy() is not None:
+            names = np.array(names, dtype=object)
+            nationalities = np.array(nationalities, dtype=object)
+            columns = {
+                name: np.asarray(values, dtype=np.float64 if name in RACING_STAT_FIELDS else np.int64)
+                for name, values in columns.items()
+            }
+        return cls(names, nationalities, columns)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def select(self, nationality: Optional[str] = None) -> "TalentStatsStore":
+        """
+        Get the rows matching a filter.
+
+        Args:
+            nationality: Keep only this nationality (case-insensitive)
+
+        Returns:
+            New TalentStatsStore (self if there is no filter)
+        """
+        if nationality is None:
+            return self
+
+        wanted = nationality.strip().lower()
+        rows = [i for i, nat in enumerate(self.nationalities) if nat.lower() == wanted]
+        if _numpy() is not None:
+            index = np.asarray(rows, dtype=np.intp)
+            return TalentStatsStore(
+                self.names[index],
+                self.nationalities[index],
+                {name: values[index] for name, values in self.columns.items()},
+            )
+        return TalentStatsStore(
+            [self.names[i] for i in rows],
+            [self.nationalities[i] for i in rows],
+            {name: [values[i] for i in rows] for name, values in self.columns.items()},
+        )
+
+    def summary(self, field_name: str, percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> dict:
+        """
+        Summarize one stat.
+
+        Args:
+            field_name: Stat name (see STAT_FIELDS)
+            percentiles: Percentiles to compute (0-100, linear interpolation)
+
+        Returns:
+            Dictionary with count, mean, std, min, max and percentiles
+            (percentile -> value). Values are None when the store is empty.
+        """
+        values = self.columns[field_name]
+        percentiles = list(percentiles)
+        if len(values) == 0:
+            return {
+                "count": 0, "mean": None, "std": None, "min": None, "max": None,
+                "percentiles": {_percentile_key(p): None for p in percentiles},
+            }
+
+        if _numpy() is not None:
+            quantiles = np.percentile(values, percentiles) if percentiles else []
+            return {
+                "count": int(values.size),
+                "mean": float(values.mean()),
+                "std": float(values.std()),
+                "min": float(values.min()),
+                "max": float(values.max()),
+                "percentiles": {_percentile_key(p): float(q) for p, q in zip(percentiles, quantiles)},
+            }
+
+        ordered = sorted(values)
+        return {
+            "count": len(ordered),
+            "mean": float(statistics.fmean(ordered)),
+            "std": float(statistics.pstdev(ordered)),
+            "min": float(ordered[0]),
+            "max": float(ordered[-1]),
+            "percentiles": {_percentile_key(p): _percentile(ordered, p) for p in percentiles},
+        }
+
+    def histogram(
+        self,
+        field_name: str,
+        bins: int = 10,
+        value_range: Optional[Tuple[float, float]] = None,
+    ) -> dict:
+        """
+        Count values of a stat in equal-width bins.
+
+        Bins are half-open except the last one, which includes its upper
+        edge (like numpy.histogram).
+
+        Args:
+            field_name: Stat name (see STAT_FIELDS)
+            bins: Number of bins
+            value_range: (low, high) range of the bins (default: 0-100 for
+                         racing stats, min-max for career stats)
+
+        Returns:
+            Dictionary with edges (bins + 1 values) and counts (bins values)
+        """
+        values = self.columns[field_name]
+        low, high = value_range or self._default_range(field_name, values)
+        if low == high:
+            low, high = low - 0.5, high + 0.5
+
+        if _numpy() is not None:
+            counts, edges = np.histogram(values, bins=bins, range=(low, high))
+            return {"edges": edges.tolist(), "counts": counts.tolist()}
+
+        width = (high - low) / bins
+        edges = [low + i * width for i in range(bins)] + [float(high)]
+        counts = [0] * bins
+        for value in values:
+            if low <= value <= high:
+                counts[min(int((value - low) / width), bins - 1)] += 1
+        return {"edges": edges, "counts": counts}
+
+    def by_nationality(self, fields: Sequence[str]) -> List[dict]:
+        """
+        Compute per-nationality means.
+
+        Args:
+            fields: Stats to average (see STAT_FIELDS)
+
+        Returns:
+            List of dicts with nationality, count and means (stat -> mean),
+            sorted by decreasing count then nationality
+        """
+        if len(self) == 0:
+            return []
+
+        if _numpy() is not None:
+            keys, inverse, counts = np.unique(self.nationalities, return_inverse=True, return_counts=True)
+            sums = {f: np.bincount(inverse, weights=self.columns[f], minlength=len(keys)) for f in fields}
+            groups = [
+                (str(key), int(count), {f: float(sums[f][i] / count) for f in fields})
+                for i, (key, count) in enumerate(zip(keys, counts))
+            ]
+        else:
+            totals: Dict[str, List[float]] = {}
+            for row, nationality in enumerate(self.nationalities):
+                acc = totals.setdefault(nationality, [0] * (len(fields) + 1))
+                acc[0] += 1
+                for i, f in enumerate(fields, start=1):
+                    acc[i] += self.columns[f][row]
+            groups = [
+                (key, acc[0], {f: float(acc[i] / acc[0]) for i, f in enumerate(fields, start=1)})
+                for key, acc in totals.items()
+            ]
+
+        groups.sort(key=lambda g: (-g[1], g[0]))
+        return [{"nationality": key, "count": count, "means": means} for key, count, means in groups]
+
+    @staticmethod
+    def _default_range(field_name: str, values: Sequence) -> Tuple[float, float]:
+        """Histogram range: the 0-100 stat scale, or the data range for career stats."""
+        if field_name in RACING_STAT_FIELDS:
+            return 0.0, 100.0
+        if len(values) == 0:
+            return 0.0, 1.0
+        return float(min(values)), float(max(values))
+
+
+def _percentile(ordered: Sequence[float], q: float) -> float:
+    """Linearly interpolated percentile of sorted values (numpy's default method)."""
+    position = (len(ordered) - 1) * q / 100.0
+    low = math.floor(position)
+    high = math.ceil(position)
+    return float(ordered[low] + (ordered[high] - ordered[low]) * (position - low))
+
+
+def _percentile_key(q: float) -> str:
+    """Format a percentile as a dictionary key ("p50", "p99.9")."""
+    return f"p{q:g}"
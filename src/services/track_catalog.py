@@ -0,0 +1,147 @@
+"""
+Shared catalog of rFactor tracks (GameData/Locations/**/*.gdb).
+
+Keeps parsed tracks in memory across requests, persists them to an
+mtime-keyed index and maintains a venue/layout index for the track picker.
+"""
+
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from ..models.track import Track
+from ..parsers.gdb_parser import GdbParser
+from ..utils.installation_stats import register_live_counts
+from .catalog import FileCatalog, get_catalog_index_path
+
+
+class TrackCatalog(FileCatalog[Track]):
+    """Catalog of .gdb tracks with a venue/layout index."""
+
+    KIND = "locations"
+    EXTENSION = ".gdb"
+
+    def __init__(self, locations_dir: str | Path, index_path: Optional[str | Path] = None, max_workers: Optional[int] = None):
+        """
+        Initialize the track catalog.
+
+        Args:
+            locations_dir: Path to GameData/Locations
+            index_path: Path of the persistent JSON index (None = no index)
+            max_workers: Number of threads used to parse files on cold scans
+        """
+        super().__init__(locations_dir, index_path, max_workers)
+        self.parser = GdbParser()
+        self._by_venue: Dict[str, List[Track]] = {}
+
+    def parse(self, file_path: str, relative_path: str) -> Optional[Track]:
+        """Parse the header of a .gdb file (listing fields only)."""
+        # Full key/value details are loaded on demand by TrackService
+        track = self.parser.parse_file(file_path, header_only=True)
+        if track is None:
+            return None
+        track.relative_path = relative_path
+        return track
+
+    def to_record(self, item: Track) -> dict:
+        """Convert a track to an index record."""
+        return {
+            "track_name": item.track_name,
+            "venue_name": item.venue_name,
+            "layout": item.layout,
+        }
+
+    def from_record(self, record: dict, file_path: str, relative_path: str) -> Track:
+        """Rebuild a track from an index record."""
+        return Track(
+            track_name=record.get("track_name", ""),
+            venue_name=sys.intern(record.get("venue_name", "")),
+            layout=sys.intern(record.get("layout", "")),
+            file_path=file_path,
+            file_name=os.path.basename(file_path),
+            relative_path=relative_path,
+        )
+
+    def _rebuild_indexes(self) -> None:
+        """Group tracks by venue (case-insensitive)."""
+        by_venue: Dict[str, List[Track]] = {}
+        for track in self._sorted:
+            venue = (track.venue_name or track.display_name).strip()
+            by_venue.setdefault(venue.lower(), []).append(track)
+        self._by_venue = by_venue
+
+    def by_venue(self, venue_name: str) -> List[Track]:
+        """
+        Get all tracks (layouts) of a venue.
+
+        Args:
+            venue_name: Venue name (case-insensitive)
+
+        Returns:
+            List of tracks at this venue
+        """
+        self.ensure_fresh()
+        with self._lock:
+            return list(self._by_venue.get(venue_name.strip().lower(), []))
+
+    def venues(self, force_reload: bool = False) -> List[dict]:
+        """
+        List venues with their layouts.
+
+        Args:
+            force_reload: If True, re-scan the whole directory
+
+        Returns:
+            List of dicts with venue_name, layouts and track_count, sorted by venue
+        """
+        self.ensure_fresh(force_reload)
+        with self._lock:
+            groups = list(self._by_venue.values())
+
+        venues = []
+        for tracks in groups:
+            first = tracks[0]
+            venues.append({
+                "venue_name": first.venue_name or first.display_name,
+                "layouts": sorted({t.layout or t.track_name or t.file_name for t in tracks}),
+                "track_count": len(tracks),
+            })
+        return sorted(venues, key=lambda v: v["venue_name"].lower())
+
+
+# Shared catalogs, one per Locations directory
+_catalogs: Dict[str, TrackCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_track_catalog(locations_dir: str | Path) -> TrackCatalog:
+    """
+    Get the shared track catalog for a Locations directory.
+
+    Args:
+        locations_dir: Path to GameData/Locations
+
+    Returns:
+        TrackCatalog instance (created on first use)
+    """
+    key = os.path.normcase(os.path.abspath(str(locations_dir)))
+    with _catalogs_lock:
+        catalog = _catalogs.get(key)
+        if catalog is None:
+            catalog = TrackCatalog(locations_dir, get_catalog_index_path(locations_dir, "tracks_index.json"))
+            _catalogs[key] = catalog
+        return catalog
+
+
+def _live_location_counts(rfactor_path: str) -> Optional[Dict[str, int]]:
+    """Per-folder track counts from a loaded catalog, for InstallationStats."""
+    key = os.path.normcase(os.path.abspath(os.path.join(rfactor_path, "GameData", "Locations")))
+    catalog = _catalogs.get(key)
+    if catalog is None or not catalog.is_loaded:
+        return None
+    return catalog.counts_by_top_level()
+
+
+register_live_counts("locations", _live_location_counts)
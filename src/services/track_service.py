@@ -10,6 +10,7 @@ from typing import Optional
 from ..models.track import Track
 from ..parsers.gdb_parser import GdbParser
 from ..utils.config import get_config
+from .track_catalog import TrackCatalog, get_track_catalog
 
 
 class TrackService:
@@ -18,7 +19,19 @@ class TrackService:
     def __init__(self):
         self.config = get_config()
         self.parser = GdbParser()
-        self._tracks_cache: Optional[list[Track]] = None
+
+    def get_catalog(self) -> TrackCatalog:
+        """
+        Get the shared track catalog for the configured installation.
+
+        Returns:
+            TrackCatalog shared by all TrackService instances
+
+        Raises:
+            ValueError: If rFactor path is not configured
+            FileNotFoundError: If the Locations directory does not exist
+        """
+        return get_track_catalog(self.get_locations_directory())
 
     def get_locations_directory(self) -> Path:
         """
@@ -41,12 +54,57 @@ class TrackService:
         return locations_dir
 
     def list_all(self, force_reload: bool = False) -> list[Track]:
-        if self._tracks_cache is None or force_reload:
-            locations_dir = self.get_locations_directory()
-            self._tracks_cache = self.parser.scan_directory(locations_dir)
-        return self._tracks_cache
+        """
+        List all tracks from the shared catalog.
+
+        Tracks from the catalog only carry listing fields; use
+        get_by_relative_path for the full gdb_info.
+
+        Args:
+            force_reload: If True, re-scan the Locations directory
+
+        Returns:
+            List of tracks sorted by relative path
+        """
+        return self.get_catalog().items(force_reload)
+
+    def list_venues(self, force_reload: bool = False) -> list[dict]:
+        """
+        List venues with their layouts.
+
+        Args:
+            force_reload: If True, re-scan the Locations directory
+
+        Returns:
+            List of dicts with venue_name, layouts and track_count
+        """
+        return self.get_catalog().venues(force_reload)
+
+    def get_by_venue(self, venue_name: str) -> list[Track]:
+        """
+        Get all tracks (layouts) of a venue.
+
+        Args:
+            venue_name: Venue name (case-insensitive)
+
+        Returns:
+            List of tracks at this venue
+        """
+        return self.get_catalog().by_venue(venue_name)
 
     def get_by_relative_path(self, relative_path: str) -> Optional[Track]:
+        """
+        Get a track with its full details.
+
+        Unlike the catalog entries returned by list_all, the file is fully
+        parsed so gdb_info holds every key of the .gdb.
+
+        Args:
+            relative_path: Path relative to GameData/Locations (.gdb optional)
+
+        Returns:
+            Track or None if not found
+        """
         locations_dir = self.get_locations_directory()
 
         # Normalize incoming path
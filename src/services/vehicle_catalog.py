@@ -0,0 +1,101 @@
+"""
+Shared catalog of rFactor vehicles (GameData/Vehicles/**/*.veh).
+
+Keeps parsed vehicles in memory across requests and persists them to an
+mtime-keyed index, so listings don't re-parse every .veh file and resolve
+its technical files on each request.
+"""
+
+import os
+import sys
+import threading
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, Optional
+
+from ..models.vehicle import Vehicle, VehicleConfig, VehicleTeamInfo
+from ..parsers.veh_parser import VehParser
+from ..utils.installation_stats import register_live_counts
+from .catalog import FileCatalog, get_catalog_index_path
+
+
+def _interned(values: dict) -> dict:
+    """Intern the string values of a record (most repeat across vehicles)."""
+    return {k: sys.intern(v) if isinstance(v, str) else v for k, v in values.items()}
+
+
+class VehicleCatalog(FileCatalog[Vehicle]):
+    """Catalog of .veh vehicles."""
+
+    KIND = "vehicles"
+    EXTENSION = ".veh"
+
+    def __init__(self, vehicles_dir: str | Path, index_path: Optional[str | Path] = None, max_workers: Optional[int] = None):
+        """
+        Initialize the vehicle catalog.
+
+        Args:
+            vehicles_dir: Path to GameData/Vehicles
+            index_path: Path of the persistent JSON index (None = no index)
+            max_workers: Number of threads used to parse files on cold scans
+        """
+        super().__init__(vehicles_dir, index_path, max_workers)
+        self.parser = VehParser()
+
+    def parse(self, file_path: str, relative_path: str) -> Optional[Vehicle]:
+        """Parse a .veh file and resolve its technical files."""
+        return self.parser.parse_file(file_path)
+
+    def to_record(self, item: Vehicle) -> dict:
+        """Convert a vehicle to an index record."""
+        record = asdict(item)
+        record.pop("file_path", None)
+        record.pop("file_name", None)
+        return record
+
+    def from_record(self, record: dict, file_path: str, relative_path: str) -> Vehicle:
+        """Rebuild a vehicle from an index record."""
+        fields = _interned({k: v for k, v in record.items() if k not in ("team_info", "config")})
+        return Vehicle(
+            **fields,
+            team_info=VehicleTeamInfo(**_interned(record["team_info"])),
+            config=VehicleConfig(**_interned(record["config"])),
+            file_path=file_path,
+            file_name=os.path.basename(file_path),
+        )
+
+
+# Shared catalogs, one per Vehicles directory
+_catalogs: Dict[str, VehicleCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_vehicle_catalog(vehicles_dir: str | Path) -> VehicleCatalog:
+    """
+    Get the shared vehicle catalog for a Vehicles directory.
+
+    Args:
+        vehicles_dir: Path to GameData/Vehicles
+
+    Returns:
+        VehicleCatalog instance (created on first use)
+    """
+    key = os.path.normcase(os.path.abspath(str(vehicles_dir)))
+    with _catalogs_lock:
+        catalog = _catalogs.get(key)
+        if catalog is None:
+            catalog = VehicleCatalog(vehicles_dir, get_catalog_index_path(vehicles_dir, "vehicles_index.json"))
+            _catalogs[key] = catalog
+        return catalog
+
+
+def _live_vehicle_counts(rfactor_path: str) -> Optional[Dict[str, int]]:
+    """Per-mod vehicle counts from a loaded catalog, for InstallationStats."""
+    key = os.path.normcase(os.path.abspath(os.path.join(rfactor_path, "GameData", "Vehicles")))
+    catalog = _catalogs.get(key)
+    if catalog is None or not catalog.is_loaded:
+        return None
+    return catalog.counts_by_top_level()
+
+
+register_live_counts("vehicles", _live_vehicle_counts)
@@ -5,6 +5,7 @@ This service copies selected vehicles to a championship-specific directory
 and modifies their Classes and Driver fields.
 """
 
+import logging
 import shutil
 from pathlib import Path
 from typing import List, Dict, Optional, Set
@@ -12,6 +13,10 @@ from typing import List, Dict, Optional, Set
 from ..parsers.veh_parser import VehParser
 from ..models.vehicle import Vehicle
 from ..utils.dependency_collector import DependencyCollector
+from ..utils.metrics import BYTES_COPIED, FILES_COPIED, timed
+from .event_bus import get_event_bus
+
+logger = logging.getLogger(__name__)
 
 
 class VehicleIsolationService:
@@ -50,6 +55,20 @@ class VehicleIsolationService:
         # Limit to 3 chars max
         return prefix[:3]
 
+    @staticmethod
+    def _copy_file(source: Path, destination: Path) -> None:
+        """
+        Copy a file with its metadata and count it in the copy metrics.
+
+        Args:
+            source: File to copy
+            destination: Destination file path
+        """
+        shutil.copy2(source, destination)
+        FILES_COPIED.inc()
+        BYTES_COPIED.inc(Path(destination).stat().st_size)
+
+    @timed("isolate_vehicles")
     def isolate_vehicles(
         self,
         championship_name: str,
@@ -111,44 +130,69 @@ class VehicleIsolationService:
         # Track shared files across all vehicles to avoid copying them multiple times
         copied_shared_files = set()
 
-        for i, assignment in enumerate(vehicle_assignments):
-            # Validate assignment structure
-            if 'vehicle_path' not in assignment:
-                print(f"Warning: Skipping assignment #{i+1}: missing 'vehicle_path'")
-                continue
-            if 'driver_name' not in assignment:
-                print(f"Warning: Skipping assignment #{i+1}: missing 'driver_name'")
-                continue
+        # Progress is published as "isolation" events (see /api/events)
+        events = get_event_bus()
+        total = len(vehicle_assignments)
 
-            vehicle_path = assignment['vehicle_path']
-            driver_name = assignment['driver_name']
+        def publish(status: str, **data) -> None:
+            events.publish("isolation", {
+                "championship": championship_name,
+                "status": status,
+                "total": total,
+                "done": len(isolated_paths) + len(failed_vehicles),
+                "failed": len(failed_vehicles),
+                **data,
+            })
 
-            # Isolate this vehicle
-            try:
-                new_path = self._isolate_single_vehicle(
-                    vehicle_path,
-                    champ_prefix,
-                    championship_name,
-                    driver_name,
-                    copied_shared_files
-                )
-                isolated_paths[vehicle_path] = new_path
-                print(f"  [OK] Isolated: {vehicle_path} -> {driver_name}")
-
-            except FileNotFoundError as e:
-                failed_vehicles.append((vehicle_path, str(e)))
-                print(f"  [FAIL] Failed: {vehicle_path} - {e}")
-
-            except (ValueError, IOError) as e:
-                failed_vehicles.append((vehicle_path, str(e)))
-                print(f"  [FAIL] Failed: {vehicle_path} - {e}")
+        publish("started")
+
+        try:
+            for i, assignment in enumerate(vehicle_assignments):
+                # Validate assignment structure
+                if 'vehicle_path' not in assignment:
+                    logger.warning(f"Skipping assignment #{i+1}: missing 'vehicle_path'")
+                    continue
+                if 'driver_name' not in assignment:
+                    logger.warning(f"Skipping assignment #{i+1}: missing 'driver_name'")
+                    continue
+
+                vehicle_path = assignment['vehicle_path']
+                driver_name = assignment['driver_name']
+
+                # Isolate this vehicle
+                try:
+                    new_path = self._isolate_single_vehicle(
+                        vehicle_path,
+                        champ_prefix,
+                        championship_name,
+                        driver_name,
+                        copied_shared_files
+                    )
+                    isolated_paths[vehicle_path] = new_path
+                    logger.info(f"Isolated {vehicle_path} -> {driver_name}")
+
+                except FileNotFoundError as e:
+                    failed_vehicles.append((vehicle_path, str(e)))
+                    logger.warning(f"Failed to isolate {vehicle_path}: {e}")
+
+                except (ValueError, IOError) as e:
+                    failed_vehicles.append((vehicle_path, str(e)))
+                    logger.warning(f"Failed to isolate {vehicle_path}: {e}")
+
+                publish("running", vehicle=vehicle_path)
+        except BaseException as e:
+            # Subscribers must not be left with a running isolation
+            publish("failed", error=str(e) or type(e).__name__)
+            raise
 
         # Report summary
         if failed_vehicles:
-            print(f"\nWarning: {len(failed_vehicles)} vehicle(s) failed to isolate")
+            logger.warning(f"{len(failed_vehicles)} vehicle(s) failed to isolate")
             if len(isolated_paths) == 0:
+                publish("failed", error=failed_vehicles[0][1])
                 raise IOError(f"All vehicles failed to isolate. First error: {failed_vehicles[0][1]}")
 
+        publish("completed")
         return isolated_paths
 
     def _isolate_single_vehicle(
@@ -228,7 +272,7 @@ class VehicleIsolationService:
 
         # Copy vehicle file with new name
         try:
-            shutil.copy2(original_path, new_absolute_path)
+            self._copy_file(original_path, new_absolute_path)
         except Exception as e:
             raise IOError(f"Failed to copy vehicle {original_path} to {new_absolute_path}: {e}")
 
@@ -242,7 +286,7 @@ class VehicleIsolationService:
                 vehicle_prefix
             )
         except Exception as e:
-            print(f"Warning: Error copying local assets for {vehicle_path}: {e}")
+            logger.warning(f"Error copying local assets for {vehicle_path}: {e}")
 
         # Copy shared assets (HDV, SFX, GEN, etc.)
         # Uses the vehicle object we already parsed for validation
@@ -254,7 +298,7 @@ class VehicleIsolationService:
                 copied_shared_files
             )
         except Exception as e:
-            print(f"Warning: Error copying shared assets for {vehicle_path}: {e}")
+            logger.warning(f"Error copying shared assets for {vehicle_path}: {e}")
 
         # Modify the copied vehicle
         # This can raise FileNotFoundError, ValueError, or IOError
@@ -336,10 +380,10 @@ class VehicleIsolationService:
             # Copy file
             try:
                 if not dest_file.exists():
-                    shutil.copy2(asset_file, dest_file)
+                    self._copy_file(asset_file, dest_file)
                     copied_files.add(file_key)
             except Exception as e:
-                print(f"Warning: Failed to copy {asset_file.name}: {e}")
+                logger.warning(f"Failed to copy {asset_file.name}: {e}")
 
     def _copy_shared_assets(
         self,
@@ -397,7 +441,7 @@ class VehicleIsolationService:
                         rel_to_vehicles = source_file.relative_to(self.vehicles_dir)
                     except ValueError:
                         # File is outside Vehicles directory (shouldn't happen)
-                        print(f"Warning: Referenced file outside Vehicles dir: {source_file}")
+                        logger.warning(f"Referenced file outside Vehicles dir: {source_file}")
                         continue
 
                     # Get the original mod folder name (first component in path)
@@ -416,18 +460,18 @@ class VehicleIsolationService:
                     try:
                         dest_file.parent.mkdir(parents=True, exist_ok=True)
                     except Exception as e:
-                        print(f"Warning: Failed to create directory for {ref_name}: {e}")
+                        logger.warning(f"Failed to create directory for {ref_name}: {e}")
                         continue
 
                     # Copy file
                     try:
                         if not dest_file.exists():
-                            shutil.copy2(source_file, dest_file)
+                            self._copy_file(source_file, dest_file)
                             copied_shared_files.add(file_key)
                     except Exception as e:
-                        print(f"Warning: Failed to copy {ref_name} ({source_file.name}): {e}")
+                        logger.warning(f"Failed to copy {ref_name} ({source_file.name}): {e}")
             else:
-                print(f"Warning: Referenced file not found: {ref_name}={ref_value}")
+                logger.warning(f"Referenced file not found: {ref_name}={ref_value}")
 
         # ADDITIONAL: Copy all indirect dependencies from parent directories
         # (TBC, INI files referenced by HDV but not directly in VEH)
@@ -628,9 +672,9 @@ class VehicleIsolationService:
 
         # Verify that we actually modified the required fields
         if not classes_modified:
-            print(f"Warning: Classes field not found in {vehicle_path}")
+            logger.warning(f"Classes field not found in {vehicle_path}")
         if not driver_modified:
-            print(f"Warning: Driver field not found in {vehicle_path}")
+            logger.warning(f"Driver field not found in {vehicle_path}")
 
         # Write back
         try:
@@ -717,17 +761,17 @@ class VehicleIsolationService:
                 try:
                     dest_file.parent.mkdir(parents=True, exist_ok=True)
                 except Exception as e:
-                    print(f"Warning: Failed to create directory for {file_path.name}: {e}")
+                    logger.warning(f"Failed to create directory for {file_path.name}: {e}")
                     continue
 
                 # Copy file
                 try:
                     if not dest_file.exists():
-                        shutil.copy2(file_path, dest_file)
+                        self._copy_file(file_path, dest_file)
                         copied_shared_files.add(file_key)
-                        print(f"  [Indirect] Copied: {file_path.name}")
+                        logger.debug(f"Copied indirect dependency {file_path.name}")
                 except Exception as e:
-                    print(f"Warning: Failed to copy indirect dependency {file_path.name}: {e}")
+                    logger.warning(f"Failed to copy indirect dependency {file_path.name}: {e}")
 
     def cleanup_championship_vehicles(self, championship_name: str) -> None:
         """
@@ -749,11 +793,11 @@ class VehicleIsolationService:
         if champ_dir.exists():
             try:
                 shutil.rmtree(champ_dir)
-                print(f"Cleaned up isolated vehicles for championship: {championship_name}")
+                logger.info(f"Cleaned up isolated vehicles for championship: {championship_name}")
             except Exception as e:
                 raise IOError(f"Failed to delete championship directory {champ_dir}: {e}")
         else:
-            print(f"No isolated vehicles found for championship: {championship_name}")
+            logger.info(f"No isolated vehicles found for championship: {championship_name}")
 
     def list_isolated_championships(self) -> List[str]:
         """
@@ -805,7 +849,7 @@ class VehicleIsolationService:
                 rel_path = dep_path.relative_to(vehicles_root)
             except ValueError:
                 # File is outside vehicles_root (shouldn't happen, but handle gracefully)
-                print(f"Warning: Dependency outside vehicles root: {dep_path}")
+                logger.warning(f"Dependency outside vehicles root: {dep_path}")
                 continue
 
             # Compute target path
@@ -819,14 +863,14 @@ class VehicleIsolationService:
             try:
                 target_path.parent.mkdir(parents=True, exist_ok=True)
             except Exception as e:
-                print(f"Warning: Failed to create directory {target_path.parent}: {e}")
+                logger.warning(f"Failed to create directory {target_path.parent}: {e}")
                 continue
 
             # Copy file
             try:
-                shutil.copy2(dep_path, target_path)
+                self._copy_file(dep_path, target_path)
                 copied_files.add(target_path)
             except Exception as e:
-                print(f"Warning: Failed to copy {dep_path} to {target_path}: {e}")
+                logger.warning(f"Failed to copy {dep_path} to {target_path}: {e}")
 
         return copied_files
@@ -11,6 +11,7 @@ from ..models.vehicle import Vehicle
 from ..parsers.veh_parser import VehParser
 from ..generators.veh_generator import VehGenerator
 from ..utils.config import get_config
+from .vehicle_catalog import VehicleCatalog, get_vehicle_catalog
 
 
 class VehicleService:
@@ -21,7 +22,19 @@ class VehicleService:
         self.config = get_config()
         self.parser = VehParser()
         self.generator = VehGenerator()
-        self._vehicles_cache: Optional[list[Vehicle]] = None
+
+    def get_catalog(self) -> VehicleCatalog:
+        """
+        Get the shared vehicle catalog for the configured installation.
+
+        Returns:
+            VehicleCatalog shared by all VehicleService instances
+
+        Raises:
+            ValueError: If rFactor path is not configured
+            FileNotFoundError: If the Vehicles directory does not exist
+        """
+        return get_vehicle_catalog(self.get_vehicles_directory())
 
     def get_vehicles_directory(self) -> Path:
         """
@@ -46,19 +59,19 @@ class VehicleService:
 
     def list_all(self, force_reload: bool = False) -> list[Vehicle]:
         """
-        List all vehicles from the rFactor installation.
+        List all vehicles from the shared catalog.
 
         Args:
-            force_reload: If True, force reload from disk even if cached
+            force_reload: If True, re-parse every vehicle (technical files
+                          may have been added without touching the .veh)
 
         Returns:
-            List of all vehicles
+            List of all vehicles, sorted by relative path
         """
-        if self._vehicles_cache is None or force_reload:
-            vehicles_dir = self.get_vehicles_directory()
-            self._vehicles_cache = self.parser.scan_directory(vehicles_dir)
-
-        return self._vehicles_cache
+        catalog = self.get_catalog()
+        if force_reload:
+            catalog.invalidate()
+        return catalog.items(force_reload)
 
     def get_by_filename(self, filename: str) -> Optional[Vehicle]:
         """
@@ -240,8 +253,8 @@ class VehicleService:
         return len(self.list_all(force_reload))
 
     def clear_cache(self):
-        """Clear the vehicles cache to force reload on next access."""
-        self._vehicles_cache = None
+        """Mark all vehicles as modified so the next access re-parses them."""
+        self.get_catalog().invalidate()
 
     def update(self, relative_path: str, driver: Optional[str] = None) -> Vehicle:
         """
@@ -273,8 +286,8 @@ class VehicleService:
 
         self.generator.write_file(vehicle, file_path)
 
-        # Clear cache to ensure fresh data on next read
-        self.clear_cache()
+        # Only this vehicle needs to be re-read by the catalog
+        self.get_catalog().invalidate(vehicle.relative_path)
 
         # Re-parse the file to ensure it was written correctly
         updated_vehicle = self.parser.parse_file(file_path)
@@ -2,13 +2,66 @@
 Configuration management for rFactor Championship Creator.
 
 Handles storing and retrieving application configuration, including rFactor path.
+
+The config file is the source of truth shared by the server processes: each
+Config re-reads it when another process (or a text editor) replaced it.
 """
 
 import json
+import os
+import threading
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, Tuple
 
+from .file_utils import write_file_atomic
 from .rfactor_validator import RFactorValidator, RFactorValidationError
+from .installation_cache import get_installation_cache
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts and lists to read-only mappings and tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Recursively convert a frozen value back to plain dicts and lists."""
+    if isinstance(value, Mapping):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """
+    Immutable view of the configuration at one point in time.
+
+    Snapshots are replaced, never modified, so readers can keep one for as
+    long as they need without locking. The version increases with every
+    change.
+    """
+
+    version: int
+    data: Mapping[str, Any]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a top-level configuration value (read-only)."""
+        return self.data.get(key, default)
+
+    @property
+    def randomizer_bounds(self) -> Mapping[str, Any]:
+        """Randomizer bounds (read-only)."""
+        bounds = self.data.get("randomizer_bounds")
+        if bounds is None:
+            bounds = _freeze(Config.default_randomizer_bounds())
+        return bounds
 
 
 class Config:
@@ -29,7 +82,35 @@ class Config:
             config_file = self.DEFAULT_CONFIG_FILE
 
         self.config_file = Path(config_file)
+        self._write_lock = threading.RLock()
+        self._version = 0
+        # Stamped before reading, so a concurrent replacement is reloaded later
+        self._file_stamp = self._stat_file()
         self.data = self._load_config()
+        self._publish()
+
+    def _stat_file(self) -> Optional[Tuple[int, int, int]]:
+        """Identify the current version of the config file (None if missing)."""
+        try:
+            stat = os.stat(self.config_file)
+        except OSError:
+            return None
+        # Every save replaces the file, so the inode changes even when the
+        # modification time doesn't
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    def _reload_if_changed(self) -> None:
+        """Reload the config file if it was replaced since it was last read or written."""
+        stamp = self._stat_file()
+        if stamp is None or stamp == self._file_stamp:
+            return
+
+        with self._write_lock:
+            if stamp == self._file_stamp:
+                return
+            self._file_stamp = stamp
+            self.data = self._load_config()
+            self._publish()
 
     def _load_config(self) -> dict:
         """
@@ -60,31 +141,90 @@ class Config:
             "current_player": None,
             "last_championship": None,
             "recent_championships": [],
-            "randomizer_bounds": {
-                "overall_skill": {"min": 40, "max": 95},
-                "speed_variance": 8,
-                "composure_variance": 10,
-                "crash_base": 50,
-                "crash_variance": 15,
-                "completed_laps_base": 95,
-                "completed_laps_variance": 8,
-                "completed_laps_min": 75,
-                "completed_laps_max": 99,
-                "recovery_variance": 12,
-                "aggression": {"min": 30, "max": 90},
-                "courtesy": {"min": 40, "max": 85},
-                "min_racing_skill_variance": 5,
-                "reputation_variance": 10,
-            },
+            "randomizer_bounds": self.default_randomizer_bounds(),
+            "debug_profiling": False,
+        }
+
+    @staticmethod
+    def default_randomizer_bounds() -> dict:
+        """
+        Get the default randomizer bounds.
+
+        Returns:
+            Dictionary with default randomizer bounds
+        """
+        return {
+            "overall_skill": {"min": 40, "max": 95},
+            "speed_variance": 8,
+            "composure_variance": 10,
+            "crash_base": 50,
+            "crash_variance": 15,
+            "completed_laps_base": 95,
+            "completed_laps_variance": 8,
+            "completed_laps_min": 75,
+            "completed_laps_max": 99,
+            "recovery_variance": 12,
+            "aggression": {"min": 30, "max": 90},
+            "courtesy": {"min": 40, "max": 85},
+            "min_racing_skill_variance": 5,
+            "reputation_variance": 10,
         }
 
+    @property
+    def version(self) -> int:
+        """
+        Version of the current snapshot (increases on every change).
+
+        Versions are local to the process: two processes sharing the config
+        file number their snapshots independently.
+        """
+        return self.snapshot().version
+
+    def snapshot(self) -> ConfigSnapshot:
+        """
+        Get the current immutable configuration snapshot.
+
+        Never blocks: writers publish a new snapshot instead of modifying
+        the current one. The config file is reloaded first if another
+        process replaced it (one stat call otherwise).
+
+        Returns:
+            ConfigSnapshot
+        """
+        self._reload_if_changed()
+        return self._snapshot
+
+    def _publish(self) -> None:
+        """Publish a new snapshot of self.data."""
+        with self._write_lock:
+            self._version += 1
+            self._snapshot = ConfigSnapshot(self._version, _freeze(self.data))
+
+    def _update(self, key: str, value: Any) -> None:
+        """Set a top-level value, publish a new snapshot and save."""
+        with self._write_lock:
+            # Keep the values saved meanwhile by other processes
+            self._reload_if_changed()
+            self.data[key] = value
+            self.save()
+
     def save(self) -> None:
-        """Save configuration to file."""
-        # Ensure parent directory exists
-        self.config_file.parent.mkdir(parents=True, exist_ok=True)
+        """
+        Publish a new snapshot and save configuration to file.
 
-        with open(self.config_file, 'w', encoding='utf-8') as f:
-            json.dump(self.data, f, indent=2)
+        The file is written to a temporary file first and then renamed over
+        the config file, so a crash never leaves a truncated config. The
+        temporary file is unique per process, so concurrent saves from
+        several server processes never write to the same file.
+        """
+        with self._write_lock:
+            self._publish()
+
+            # Ensure parent directory exists
+            self.config_file.parent.mkdir(parents=True, exist_ok=True)
+
+            write_file_atomic(str(self.config_file), json.dumps(self.data, indent=2).encode('utf-8'))
+            self._file_stamp = self._stat_file()
 
     def get_rfactor_path(self) -> Optional[str]:
         """
@@ -93,7 +233,7 @@ class Config:
         Returns:
             Path to rFactor installation or None if not configured
         """
-        return self.data.get("rfactor_path")
+        return self.snapshot().get("rfactor_path")
 
     def set_rfactor_path(self, path: str, validate: bool = True) -> None:
         """
@@ -107,12 +247,11 @@ class Config:
             RFactorValidationError: If validate=True and path is invalid
         """
         if validate:
-            RFactorValidator.validate_or_raise(path)
+            get_installation_cache().validate_or_raise(path)
 
         # Store as absolute path
         abs_path = str(Path(path).absolute())
-        self.data["rfactor_path"] = abs_path
-        self.save()
+        self._update("rfactor_path", abs_path)
 
     def get_current_player(self) -> Optional[str]:
         """
@@ -121,7 +260,7 @@ class Config:
         Returns:
             Player profile name or None if not set
         """
-        return self.data.get("current_player")
+        return self.snapshot().get("current_player")
 
     def set_current_player(self, player_name: str) -> None:
         """
@@ -130,8 +269,7 @@ class Config:
         Args:
             player_name: Name of the player profile
         """
-        self.data["current_player"] = player_name
-        self.save()
+        self._update("current_player", player_name)
 
     def add_recent_championship(self, championship_name: str, max_recent: int = 10) -> None:
         """
@@ -141,20 +279,21 @@ class Config:
             championship_name: Name of the championship
             max_recent: Maximum number of recent items to keep
         """
-        recent = self.data.get("recent_championships", [])
+        with self._write_lock:
+            self._reload_if_changed()
+            recent = list(self.data.get("recent_championships", []))
 
-        # Remove if already in list
-        if championship_name in recent:
-            recent.remove(championship_name)
+            # Remove if already in list
+            if championship_name in recent:
+                recent.remove(championship_name)
 
-        # Add to beginning
-        recent.insert(0, championship_name)
+            # Add to beginning
+            recent.insert(0, championship_name)
 
-        # Keep only max_recent items
-        recent = recent[:max_recent]
+            # Keep only max_recent items
+            recent = recent[:max_recent]
 
-        self.data["recent_championships"] = recent
-        self.save()
+            self._update("recent_championships", recent)
 
     def get_recent_championships(self) -> list:
         """
@@ -163,7 +302,7 @@ class Config:
         Returns:
             List of championship names
         """
-        return self.data.get("recent_championships", [])
+        return list(self.snapshot().get("recent_championships", ()))
 
     def is_configured(self) -> bool:
         """
@@ -176,13 +315,16 @@ class Config:
         if not rfactor_path:
             return False
 
-        is_valid, _ = RFactorValidator.validate(rfactor_path)
+        is_valid, _ = get_installation_cache().validate(rfactor_path)
         return is_valid
 
     def get_config_summary(self) -> dict:
         """
         Get a summary of current configuration.
 
+        Counts come from the installation cache, so this only walks the
+        installation on the first call (or in the background after changes).
+
         Returns:
             Dictionary with configuration summary
         """
@@ -197,12 +339,14 @@ class Config:
 
         if rfactor_path:
             try:
-                info = RFactorValidator.get_version_info(rfactor_path)
+                info = get_installation_cache().get_version_info(rfactor_path)
                 summary.update({
                     "rfactor_valid": info.get("is_valid", False),
                     "talent_count": info.get("talent_count", 0),
                     "vehicle_count": info.get("vehicle_count", 0),
                     "location_count": info.get("location_count", 0),
+                    "vehicles_by_mod": info.get("vehicles_by_mod", {}),
+                    "locations_by_mod": info.get("locations_by_mod", {}),
                 })
 
                 if info.get("is_valid"):
@@ -213,20 +357,34 @@ class Config:
 
         return summary
 
+    def is_debug_profiling_enabled(self) -> bool:
+        """
+        Check if the profiling endpoint (/api/debug/profile) is enabled.
+
+        Off by default; enabled with "debug_profiling": true in config.json.
+
+        Returns:
+            True if profiling is allowed
+        """
+        return bool(self.snapshot().get("debug_profiling", False))
+
     def reset(self) -> None:
         """Reset configuration to defaults."""
-        self.data = self._default_config()
-        self.save()
+        with self._write_lock:
+            self.data = self._default_config()
+            self.save()
 
     def get_randomizer_bounds(self) -> dict:
         """
         Get the randomizer bounds configuration.
 
+        Returns a mutable copy; hot paths should read
+        snapshot().randomizer_bounds instead.
+
         Returns:
             Dictionary with randomizer bounds
         """
-        default = self._default_config()["randomizer_bounds"]
-        return self.data.get("randomizer_bounds", default)
+        return _thaw(self.snapshot().randomizer_bounds)
 
     def set_randomizer_bounds(self, bounds: dict) -> None:
         """
@@ -235,8 +393,7 @@ class Config:
         Args:
             bounds: Dictionary with randomizer bounds
         """
-        self.data["randomizer_bounds"] = bounds
-        self.save()
+        self._update("randomizer_bounds", _thaw(bounds))
 
 
 # Global config instance
@@ -4,6 +4,8 @@ File utilities for reading and writing rFactor files.
 rFactor files use Windows-1252 encoding (cp1252) and CRLF line endings.
 """
 
+import os
+import threading
 from pathlib import Path
 from typing import List, Optional
 
@@ -58,6 +60,39 @@ def write_rfactor_file(filepath: str, content: str) -> None:
         f.write(normalized_content)
 
 
+def write_file_atomic(filepath: str, data: bytes, fsync: bool = False) -> None:
+    """
+    Write a file atomically (temporary file in the same directory + rename).
+
+    Readers see either the old file or the complete new one, never a
+    partially written file. The parent directory must exist.
+
+    Args:
+        filepath: Path to the file to write
+        data: Encoded file content
+        fsync: Flush the file to disk before renaming (slower, survives power loss)
+
+    Raises:
+        PermissionError: If the file can't be written
+    """
+    path = Path(filepath)
+    # Unique per process and thread; cheaper than tempfile.mkstemp for many small files
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 def find_files_by_extension(directory: str, extension: str, recursive: bool = True) -> List[Path]:
     """
     Find all files with a specific extension in a directory.
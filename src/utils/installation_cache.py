@@ -0,0 +1,254 @@
+"""
+Cached validation and statistics for rFactor installations.
+
+Validating an installation and counting its talents, vehicles and locations
+is cheap to cache but expensive to recompute on every request. Results are
+stored against a fingerprint built from directory mtimes, which changes
+whenever entries are added to or removed from the watched directories.
+
+Counts can also change deep inside a mod folder without touching the
+fingerprint, so they are refreshed in a background thread once they are
+older than REFRESH_INTERVAL. Callers always get the last known value
+immediately while the refresh runs.
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from .rfactor_validator import RFactorValidator, RFactorValidationError
+
+
+# Directories whose mtimes decide whether validation must be redone
+VALIDATION_DIRS = ("", "GameData")
+
+# Directories whose mtimes (and those of their direct subdirectories) decide
+# whether counts must be redone
+COUNT_DIRS = ("GameData/Talent", "GameData/Vehicles", "GameData/Locations")
+
+
+def _mtime_ns(path: str) -> Optional[int]:
+    """Get the mtime of a path in nanoseconds, or None if it doesn't exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def validation_fingerprint(path: str) -> Tuple[Optional[int], ...]:
+    """
+    Build a fingerprint of the items checked by RFactorValidator.validate.
+
+    Adding or removing rFactor.exe, GameData, UserData or a GameData
+    subdirectory changes the mtime of its parent, so two stat calls are
+    enough to detect any change affecting validation.
+
+    Args:
+        path: Path to the rFactor installation
+
+    Returns:
+        Tuple of mtimes (None for missing directories)
+    """
+    return tuple(_mtime_ns(os.path.join(path, d)) for d in VALIDATION_DIRS)
+
+
+def counts_fingerprint(path: str) -> Tuple:
+    """
+    Build a fingerprint of the directories counted by get_version_info.
+
+    Uses the mtimes of Talent, Vehicles and Locations and of their direct
+    subdirectories (one per mod or track folder). This is one scandir per
+    directory instead of a full recursive walk.
+
+    Args:
+        path: Path to the rFactor installation
+
+    Returns:
+        Tuple of (directory, mtime) entries
+    """
+    entries = []
+    for rel in COUNT_DIRS:
+        directory = os.path.join(path, rel)
+        entries.append((rel, _mtime_ns(directory)))
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        entries.append((entry.path, entry.stat(follow_symlinks=False).st_mtime_ns))
+        except OSError:
+            continue
+    return tuple(sorted(entries, key=lambda e: e[0]))
+
+
+@dataclass
+class _CacheEntry:
+    """A cached value with the fingerprint it was computed for."""
+
+    fingerprint: Tuple
+    value: object
+    computed_at: float
+
+
+class InstallationCache:
+    """Fingerprint-keyed cache for installation validation and counts."""
+
+    # Seconds after which counts are refreshed in the background
+    REFRESH_INTERVAL = 60.0
+
+    def __init__(self):
+        """Initialize an empty cache."""
+        self._lock = threading.Lock()
+        self._validation: Dict[str, _CacheEntry] = {}
+        self._version_info: Dict[str, _CacheEntry] = {}
+        self._refreshing: set = set()
+
+    @staticmethod
+    def _key(path: str) -> str:
+        """Normalize a path for use as a cache key."""
+        return os.path.normcase(os.path.abspath(str(path)))
+
+    def validate(self, path: str) -> Tuple[bool, List[str]]:
+        """
+        Validate an rFactor installation, using the cached result if still valid.
+
+        Args:
+            path: Path to check
+
+        Returns:
+            Tuple of (is_valid, list_of_missing_items)
+        """
+        key = self._key(path)
+        fingerprint = validation_fingerprint(key)
+
+        with self._lock:
+            entry = self._validation.get(key)
+            if entry is not None and entry.fingerprint == fingerprint:
+                is_valid, missing = entry.value
+                return is_valid, list(missing)
+
+        is_valid, missing = RFactorValidator.validate(path)
+
+        with self._lock:
+            self._validation[key] = _CacheEntry(fingerprint, (is_valid, tuple(missing)), time.monotonic())
+        return is_valid, missing
+
+    def validate_or_raise(self, path: str) -> None:
+        """
+        Validate an installation and raise an exception if invalid.
+
+        Args:
+            path: Path to validate
+
+        Raises:
+            RFactorValidationError: If the path is not a valid rFactor installation
+        """
+        is_valid, missing_items = self.validate(path)
+
+        if not is_valid:
+            missing_str = ", ".join(missing_items)
+            raise RFactorValidationError(
+                f"Invalid rFactor installation at '{path}'. "
+                f"Missing: {missing_str}"
+            )
+
+    def get_version_info(self, path: str) -> dict:
+        """
+        Get installation info and counts, using the cache when possible.
+
+        The first call for a path computes the info synchronously. Later
+        calls return the cached info immediately; if the fingerprint changed
+        or the info is older than REFRESH_INTERVAL, a background refresh is
+        started and the next call sees the new values.
+
+        Args:
+            path: Path to rFactor installation
+
+        Returns:
+            Dictionary with version info (see RFactorValidator.get_version_info)
+        """
+        key = self._key(path)
+
+        with self._lock:
+            entry = self._version_info.get(key)
+
+        if entry is None:
+            return dict(self._refresh_version_info(key, str(path)))
+
+        stale = time.monotonic() - entry.computed_at > self.REFRESH_INTERVAL
+        if stale or entry.fingerprint != counts_fingerprint(key):
+            self.refresh_in_background(path)
+
+        return dict(entry.value)
+
+    def refresh_in_background(self, path: str) -> None:
+        """
+        Recompute the version info of an installation in a daemon thread.
+
+        Does nothing if a refresh for this path is already running.
+
+        Args:
+            path: Path to rFactor installation
+        """
+        key = self._key(path)
+
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        thread = threading.Thread(
+            target=self._refresh_version_info,
+            args=(key, str(path)),
+            name="installation-cache-refresh",
+            daemon=True,
+        )
+        thread.start()
+
+    def _refresh_version_info(self, key: str, path: str) -> dict:
+        """Compute and store the version info of an installation."""
+        try:
+            fingerprint = counts_fingerprint(key)
+            info = RFactorValidator.get_version_info(path)
+            with self._lock:
+                self._version_info[key] = _CacheEntry(fingerprint, info, time.monotonic())
+            return info
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """
+        Drop cached results.
+
+        Args:
+            path: Installation to forget (None = all installations)
+        """
+        with self._lock:
+            if path is None:
+                self._validation.clear()
+                self._version_info.clear()
+            else:
+                key = self._key(path)
+                self._validation.pop(key, None)
+                self._version_info.pop(key, None)
+
+
+# Global cache instance
+_cache_instance: Optional[InstallationCache] = None
+
+
+def get_installation_cache() -> InstallationCache:
+    """
+    Get the global installation cache instance.
+
+    Returns:
+        InstallationCache instance
+    """
+    global _cache_instance
+
+    if _cache_instance is None:
+        _cache_instance = InstallationCache()
+
+    return _cache_instance
@@ -0,0 +1,201 @@
+"""
+Statistics about an rFactor installation (talent, vehicle and track counts).
+
+Counts are taken from the live catalogs when they are loaded. Otherwise the
+directories are walked with os.scandir, which streams entries instead of
+building full path lists like Path.glob("**/*.veh") does.
+
+Catalogs register a provider with register_live_counts(); the provider
+returns per-mod counts for an installation, or None if it has nothing loaded
+for it yet.
+"""
+
+import os
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+
+# kind ("talents", "vehicles", "locations") -> provider(rfactor_path) -> per-mod counts
+LiveCountProvider = Callable[[str], Optional[Dict[str, int]]]
+_live_providers: Dict[str, LiveCountProvider] = {}
+
+
+def register_live_counts(kind: str, provider: LiveCountProvider) -> None:
+    """
+    Register a provider of live counts for a kind of file.
+
+    Args:
+        kind: "talents", "vehicles" or "locations"
+        provider: Callable taking the rFactor path and returning per-mod
+                  counts, or None if it has no data for that installation
+    """
+    _live_providers[kind] = provider
+
+
+def unregister_live_counts(kind: str) -> None:
+    """
+    Remove the live count provider for a kind of file.
+
+    Args:
+        kind: "talents", "vehicles" or "locations"
+    """
+    _live_providers.pop(kind, None)
+
+
+def iter_files(directory: str, extension: str, recursive: bool = True) -> Iterator[os.DirEntry]:
+    """
+    Stream the files with a given extension under a directory.
+
+    Symlinked directories are not followed.
+
+    Args:
+        directory: Directory to walk
+        extension: File extension including the dot (case-insensitive)
+        recursive: Whether to walk subdirectories
+
+    Yields:
+        os.DirEntry for each matching file
+    """
+    extension = extension.lower()
+    stack = [directory]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive:
+                                stack.append(entry.path)
+                        elif entry.name.lower().endswith(extension):
+                            yield entry
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+
+def count_files_by_top_level(directory: str, extension: str) -> Dict[str, int]:
+    """
+    Count files with a given extension, grouped by top-level subdirectory.
+
+    Files directly inside directory are counted under the "" key.
+
+    Args:
+        directory: Directory to walk (e.g., GameData/Vehicles)
+        extension: File extension including the dot (case-insensitive)
+
+    Returns:
+        Dictionary of top-level directory name -> file count (empty groups omitted)
+    """
+    counts: Dict[str, int] = {}
+
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except OSError:
+        return counts
+
+    extension = extension.lower()
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                count = sum(1 for _ in iter_files(entry.path, extension))
+                if count:
+                    counts[entry.name] = count
+            elif entry.name.lower().endswith(extension):
+                counts[""] = counts.get("", 0) + 1
+        except OSError:
+            continue
+
+    return counts
+
+
+class InstallationStats:
+    """Collects file counts for an rFactor installation."""
+
+    def __init__(self, rfactor_path: str):
+        """
+        Initialize the statistics collector.
+
+        Args:
+            rfactor_path: Path to the rFactor installation
+        """
+        self.rfactor_path = str(rfactor_path)
+        self.gamedata_dir = os.path.join(self.rfactor_path, "GameData")
+
+    def _live_counts(self, kind: str) -> Optional[Dict[str, int]]:
+        """Get counts from a registered catalog, or None if unavailable."""
+        provider = _live_providers.get(kind)
+        if provider is None:
+            return None
+        try:
+            return provider(self.rfactor_path)
+        except Exception:
+            return None
+
+    def talent_counts(self) -> Tuple[Dict[str, int], str]:
+        """
+        Count talents (.rcd files in GameData/Talent, excluding Dialog).
+
+        Returns:
+            Tuple of ({"": count}, source) where source is "catalog" or "filesystem"
+        """
+        live = self._live_counts("talents")
+        if live is not None:
+            return live, "catalog"
+
+        talent_dir = os.path.join(self.gamedata_dir, "Talent")
+        count = sum(
+            1 for entry in iter_files(talent_dir, ".rcd", recursive=False)
+            if os.path.splitext(entry.name)[0] != "Dialog"
+        )
+        return {"": count}, "filesystem"
+
+    def vehicle_counts(self) -> Tuple[Dict[str, int], str]:
+        """
+        Count vehicles (.veh files) per mod directory.
+
+        Returns:
+            Tuple of (mod name -> count, source)
+        """
+        live = self._live_counts("vehicles")
+        if live is not None:
+            return live, "catalog"
+        return count_files_by_top_level(os.path.join(self.gamedata_dir, "Vehicles"), ".veh"), "filesystem"
+
+    def location_counts(self) -> Tuple[Dict[str, int], str]:
+        """
+        Count locations (.gdb files) per track directory.
+
+        Returns:
+            Tuple of (track folder -> count, source)
+        """
+        live = self._live_counts("locations")
+        if live is not None:
+            return live, "catalog"
+        return count_files_by_top_level(os.path.join(self.gamedata_dir, "Locations"), ".gdb"), "filesystem"
+
+    def collect(self) -> dict:
+        """
+        Collect all counts with per-mod breakdowns.
+
+        Returns:
+            Dictionary with talent_count, vehicle_count, location_count,
+            vehicles_by_mod, locations_by_mod and the source of each count
+        """
+        talents, talent_source = self.talent_counts()
+        vehicles, vehicle_source = self.vehicle_counts()
+        locations, location_source = self.location_counts()
+
+        return {
+            "talent_count": sum(talents.values()),
+            "vehicle_count": sum(vehicles.values()),
+            "location_count": sum(locations.values()),
+            "vehicles_by_mod": dict(sorted(vehicles.items())),
+            "locations_by_mod": dict(sorted(locations.items())),
+            "count_sources": {
+                "talents": talent_source,
+                "vehicles": vehicle_source,
+                "locations": location_source,
+            },
+        }
@@ -0,0 +1,386 @@
+"""
+In-process metrics: counters, latency histograms and timed spans.
+
+Metrics are kept in a process-wide registry and exposed at /api/metrics in
+the Prometheus text format. Timed spans wrap the hot paths (directory scans,
+parsing, vehicle isolation); slow spans are also written to the application
+log configured in src/main.py.
+
+Example:
+    >>> with span("rfm.parse"):
+    ...     parse()
+    >>> FILES_PARSED.inc(kind="veh")
+"""
+
+import functools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Histogram buckets in seconds, from fast API calls to whole-mod isolation
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# Spans slower than this are logged at INFO level (DEBUG otherwise)
+SLOW_SPAN_SECONDS = 0.5
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the Prometheus text format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    """Format labels as {name="value",...} (empty string without labels)."""
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value (integers without a trailing .0)."""
+    if value == int(value):
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """Base class for metrics with optional labels."""
+
+    TYPE = ""
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        """
+        Initialize the metric.
+
+        Args:
+            name: Metric name (e.g., "rfactor_files_parsed_total")
+            help_text: Description shown in the # HELP line
+            labelnames: Names of the labels, given as keyword arguments on update
+        """
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        """Get the label values in labelnames order."""
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def render(self) -> List[str]:
+        """Render the metric in the Prometheus text format."""
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.TYPE}"]
+        lines.extend(self._samples())
+        return lines
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def reset(self) -> None:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+
+    TYPE = "counter"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help_text, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        """
+        Increase the counter.
+
+        Args:
+            amount: Amount to add (must be >= 0)
+            **labels: Label values
+        """
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        """Get the current value for a set of labels (0 if never incremented)."""
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(v)}" for key, v in values]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Histogram(_Metric):
+    """Distribution of observed values (e.g., durations) in cumulative buckets."""
+
+    TYPE = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # label values -> [count per bucket (+Inf last), sum]
+        self._values: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """
+        Record one observation.
+
+        Args:
+            value: Observed value (seconds for durations)
+            **labels: Label values
+        """
+        key = self._key(labels)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = ([0] * (len(self.buckets) + 1), [0.0])
+            counts, total = entry
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            else:
+                counts[-1] += 1
+            total[0] += value
+
+    def stats(self, **labels: str) -> Tuple[int, float]:
+        """
+        Get the number and sum of observations for a set of labels.
+
+        Returns:
+            Tuple of (count, sum)
+        """
+        with self._lock:
+            entry = self._values.get(self._key(labels))
+            if entry is None:
+                return 0, 0.0
+            return sum(entry[0]), entry[1][0]
+
+    def series(self) -> Dict[LabelValues, Tuple[int, float]]:
+        """
+        Get the count and sum of observations of every label set.
+
+        Returns:
+            Dictionary of label values -> (count, sum)
+        """
+        with self._lock:
+            return {key: (sum(counts), total[0]) for key, (counts, total) in self._values.items()}
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            values = sorted((key, (list(counts), total[0])) for key, (counts, total) in self._values.items())
+
+        lines = []
+        for key, (counts, total) in values:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else _format_value(bound)
+                labels = _format_labels(self.labelnames, key, 'le="' + le + '"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {cumulative}")
+        return lines
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class MetricsRegistry:
+    """Named collection of metrics rendered together."""
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, _Metric] = {}
+
+    def _get_or_create(self, cls, name: str, help_text: str, labelnames: Sequence[str], **kwargs) -> _Metric:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, help_text, labelnames, **kwargs)
+            elif not isinstance(metric, cls) or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"Metric {name} already registered with another type or labels")
+            return metric
+
+    def counter(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Counter:
+        """
+        Get or create a counter.
+
+        Args:
+            name: Metric name (should end with _total)
+            help_text: Description of the metric
+            labelnames: Label names
+
+        Returns:
+            Counter registered under this name
+        """
+        return self._get_or_create(Counter, name, help_text, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """
+        Get or create a histogram.
+
+        Args:
+            name: Metric name (e.g., "..._duration_seconds")
+            help_text: Description of the metric
+            labelnames: Label names
+            buckets: Upper bounds of the buckets
+
+        Returns:
+            Histogram registered under this name
+        """
+        return self._get_or_create(Histogram, name, help_text, labelnames, buckets=buckets)
+
+    def render(self) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format (0.0.4).
+
+        Returns:
+            Metrics text, ending with a newline
+        """
+        with self._lock:
+            metrics = [self._metrics[name] for name in sorted(self._metrics)]
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Clear all recorded values (metrics stay registered)."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.reset()
+
+
+# Global registry instance
+_registry_instance: Optional[MetricsRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_metrics() -> MetricsRegistry:
+    """
+    Get the global metrics registry.
+
+    Returns:
+        MetricsRegistry instance
+    """
+    global _registry_instance
+
+    if _registry_instance is None:
+        with _registry_lock:
+            if _registry_instance is None:
+                _registry_instance = MetricsRegistry()
+
+    return _registry_instance
+
+
+# ----- Application metrics -----
+
+HTTP_REQUEST_DURATION = get_metrics().histogram(
+    "rfactor_http_request_duration_seconds", "Time to serve HTTP requests", ("method", "route"),
+)
+HTTP_REQUESTS = get_metrics().counter(
+    "rfactor_http_requests_total", "HTTP requests served", ("method", "route", "status"),
+)
+SPAN_DURATION = get_metrics().histogram(
+    "rfactor_span_duration_seconds", "Duration of instrumented operations", ("span",),
+)
+FILES_PARSED = get_metrics().counter(
+    "rfactor_files_parsed_total", "rFactor files parsed", ("kind",),
+)
+FILES_COPIED = get_metrics().counter(
+    "rfactor_files_copied_total", "Files copied into isolated championship folders",
+)
+BYTES_COPIED = get_metrics().counter(
+    "rfactor_bytes_copied_total", "Bytes copied into isolated championship folders",
+)
+CATALOG_REQUESTS = get_metrics().counter(
+    "rfactor_catalog_requests_total",
+    "Catalog accesses served from memory (hit) or requiring a directory scan (miss)",
+    ("catalog", "result"),
+)
+CATALOG_FILES = get_metrics().counter(
+    "rfactor_catalog_files_total",
+    "Files seen by catalog scans, reused from memory or the index (hit) or parsed (miss)",
+    ("catalog", "result"),
+)
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """
+    Time a block of code.
+
+    The duration is recorded in rfactor_span_duration_seconds{span=name}
+    (also when the block raises) and logged, at INFO level when slower than
+    SLOW_SPAN_SECONDS.
+
+    Args:
+        name: Span name (e.g., "rfm.parse")
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        duration = time.perf_counter() - start
+        SPAN_DURATION.observe(duration, span=name)
+        level = logging.INFO if duration >= SLOW_SPAN_SECONDS else logging.DEBUG
+        logger.log(level, f"{name} took {duration * 1000:.1f} ms")
+
+
+def timed(name: str) -> Callable:
+    """
+    Decorator timing every call of a function with span(name).
+
+    Args:
+        name: Span name
+
+    Returns:
+        Decorator
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def log_summary() -> None:
+    """Write request and span statistics to the application log."""
+    for (method, route), (count, total) in sorted(HTTP_REQUEST_DURATION.series().items()):
+        logger.info(f"{method} {route}: {count} requests, {total / count * 1000:.1f} ms average")
+    for (name,), (count, total) in sorted(SPAN_DURATION.series().items()):
+        logger.info(f"{name}: {count} calls, {total:.2f} s total, {total / count * 1000:.1f} ms average")
@@ -0,0 +1,39 @@
+"""
+Deferred imports of optional, heavy dependencies.
+
+NumPy alone adds about 90ms to startup, which the packaged executable pays
+on every launch. Modules that only need it for bulk operations import it on
+first use through optional_import instead of at import time.
+"""
+
+import importlib
+import threading
+from types import ModuleType
+from typing import Dict, Optional
+
+_modules: Dict[str, Optional[ModuleType]] = {}
+_lock = threading.Lock()
+
+
+def optional_import(name: str) -> Optional[ModuleType]:
+    """
+    Import an optional module on first use.
+
+    Args:
+        name: Module name (e.g., "numpy")
+
+    Returns:
+        The module, or None if it isn't installed
+    """
+    try:
+        return _modules[name]
+    except KeyError:
+        pass
+
+    with _lock:
+        if name not in _modules:
+            try:
+                _modules[name] = importlib.import_module(name)
+            except ImportError:
+                _modules[name] = None
+        return _modules[name]
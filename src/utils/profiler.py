@@ -0,0 +1,133 @@
+"""
+Profiling helpers for diagnosing slow installations.
+
+SamplingProfiler periodically captures the stacks of all running threads
+(request handlers, thread pools, catalog scans) with negligible overhead on
+the profiled code, and reports them in the collapsed-stack format read by
+flamegraph.pl, speedscope and most flame graph viewers:
+
+    thread;outer (module.py:12);inner (other.py:40) 17
+
+profile_to_file runs a function under cProfile and writes a pstats file,
+used by `python -m src.main --profile` to profile the startup.
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Tuple
+
+DEFAULT_INTERVAL = 0.005
+
+# Maximum number of frames kept per stack (innermost frames are kept)
+MAX_DEPTH = 128
+
+
+class ProfilerBusyError(RuntimeError):
+    """Raised when a profile is requested while another one is running."""
+    pass
+
+
+class SamplingProfiler:
+    """Samples the stacks of all threads at a fixed interval."""
+
+    _running = threading.Lock()
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL):
+        """
+        Initialize the profiler.
+
+        Args:
+            interval: Seconds between two samples
+        """
+        self.interval = interval
+        self.samples = 0
+        self.stacks: Counter = Counter()
+
+    def run(self, seconds: float) -> "SamplingProfiler":
+        """
+        Sample all threads (except the calling one) for a duration.
+
+        Blocks the calling thread; only one profile runs at a time per
+        process.
+
+        Args:
+            seconds: Duration of the capture
+
+        Returns:
+            self, with samples and stacks filled in
+
+        Raises:
+            ProfilerBusyError: If another profile is running
+        """
+        if not self._running.acquire(blocking=False):
+            raise ProfilerBusyError("A profile is already running")
+
+        try:
+            own_thread = threading.get_ident()
+            deadline = time.monotonic() + seconds
+            while time.monotonic() < deadline:
+                self._sample(own_thread)
+                time.sleep(self.interval)
+        finally:
+            self._running.release()
+        return self
+
+    def _sample(self, own_thread: int) -> None:
+        """Record the current stack of every other thread."""
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == own_thread:
+                continue
+            stack = []
+            while frame is not None and len(stack) < MAX_DEPTH:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            stack.append(names.get(ident, f"thread-{ident}"))
+            self.stacks[";".join(reversed(stack))] += 1
+        self.samples += 1
+
+    def collapsed(self) -> str:
+        """
+        Format the captured stacks in the collapsed-stack format.
+
+        Returns:
+            One "frame;frame;... count" line per distinct stack, most
+            frequent first
+        """
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+def profile_to_file(func: Callable[[], Any], output_path: str | Path, top: int = 30) -> Tuple[Any, str]:
+    """
+    Run a function under cProfile and save the statistics.
+
+    Only the calling thread is profiled.
+
+    Args:
+        func: Function to profile (called without arguments)
+        output_path: Path of the pstats file to write (open it with
+                     `python -m pstats` or snakeviz)
+        top: Number of functions in the returned summary
+
+    Returns:
+        Tuple of (result of func, summary of the slowest functions by
+        cumulative time)
+    """
+    profiler = cProfile.Profile()
+    result = profiler.runcall(func)
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    profiler.dump_stats(str(output_path))
+
+    summary = io.StringIO()
+    pstats.Stats(profiler, stream=summary).sort_stats("cumulative").print_stats(top)
+    return result, summary.getvalue()
@@ -7,6 +7,8 @@ This module provides functions to verify that a directory is a valid rFactor ins
 from pathlib import Path
 from typing import Tuple, List
 
+from .installation_stats import InstallationStats
+
 
 class RFactorValidationError(Exception):
     """Exception raised when rFactor validation fails."""
@@ -98,6 +100,9 @@ class RFactorValidator:
         """
         Get version information from rFactor installation.
 
+        Includes talent/vehicle/location counts and per-mod breakdowns
+        (vehicles_by_mod, locations_by_mod) when the installation is valid.
+
         Args:
             path: Path to rFactor installation
 
@@ -115,25 +120,9 @@ class RFactorValidator:
         info["is_valid"] = is_valid
 
         if is_valid:
-            # Count talents, vehicles, locations
-            gamedata = rfactor_path / "GameData"
-
-            talent_dir = gamedata / "Talent"
-            if talent_dir.exists():
-                rcd_files = list(talent_dir.glob("*.rcd"))
-                # Exclude Dialog.ini if present
-                rcd_files = [f for f in rcd_files if f.stem != "Dialog"]
-                info["talent_count"] = len(rcd_files)
-
-            vehicles_dir = gamedata / "Vehicles"
-            if vehicles_dir.exists():
-                veh_files = list(vehicles_dir.glob("**/*.veh"))
-                info["vehicle_count"] = len(veh_files)
-
-            locations_dir = gamedata / "Locations"
-            if locations_dir.exists():
-                gdb_files = list(locations_dir.glob("**/*.gdb"))
-                info["location_count"] = len(gdb_files)
+            # Count talents, vehicles, locations (from the live catalogs when
+            # loaded, otherwise with a streaming directory walk)
+            info.update(InstallationStats(path).collect())
 
         return info
 
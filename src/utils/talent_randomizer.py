@@ -6,33 +6,125 @@ for talent creation and CSV import.
 """
 
 import random
-from typing import Dict, Any, Optional
+from dataclasses import dataclass
+from typing import Dict, Any, Iterator, List, Mapping, Optional, Sequence
 
-# Import config for bounds (delayed import to avoid circular dependency)
-def _get_bounds() -> Dict[str, Any]:
-    """Get randomizer bounds from config."""
+from .config import Config, get_config
+from .optional_imports import optional_import
+
+# NumPy is slow to import, so it is loaded on first use by _numpy();
+# generate_batch falls back to pure Python on installs without it
+_UNSET = object()
+np: Any = _UNSET
+
+
+def _numpy():
+    """Get NumPy, importing it on first use (None if not installed)."""
+    global np
+    if np is _UNSET:
+        np = optional_import("numpy")
+    return np
+
+
+def _get_bounds() -> Mapping[str, Any]:
+    """
+    Get randomizer bounds from the current config snapshot.
+
+    Reads the immutable snapshot, so this never blocks or copies. Callers
+    generating many drivers should still read it once per batch.
+    """
     try:
-        from .config import get_config
-        config = get_config()
-        return config.get_randomizer_bounds()
+        return get_config().snapshot().randomizer_bounds
     except Exception:
         # Fallback to default bounds if config unavailable
-        return {
-            "overall_skill": {"min": 40, "max": 95},
-            "speed_variance": 8,
-            "composure_variance": 10,
-            "crash_base": 50,
-            "crash_variance": 15,
-            "completed_laps_base": 95,
-            "completed_laps_variance": 8,
-            "completed_laps_min": 75,
-            "completed_laps_max": 99,
-            "recovery_variance": 12,
-            "aggression": {"min": 30, "max": 90},
-            "courtesy": {"min": 40, "max": 85},
-            "min_racing_skill_variance": 5,
-            "reputation_variance": 10,
-        }
+        return Config.default_randomizer_bounds()
+
+
+RACING_STAT_FIELDS = [
+    "speed", "crash", "aggression", "reputation", "courtesy",
+    "composure", "recovery", "completed_laps", "min_racing_skill",
+]
+
+CAREER_FIELDS = ["starts", "poles", "wins", "drivers_championships"]
+
+
+@dataclass
+class TalentBatch:
+    """
+    Columnar output of TalentRandomizer.generate_batch.
+
+    Each column holds one value per driver: NumPy arrays when NumPy is
+    installed, plain lists otherwise.
+    """
+
+    columns: Dict[str, Sequence]
+    size: int
+
+    def __len__(self) -> int:
+        return self.size
+
+    def column(self, name: str) -> List:
+        """
+        Get a column as a list of Python values.
+
+        Args:
+            name: Column name (e.g., "speed", "nationality")
+
+        Returns:
+            List of values
+        """
+        values = self.columns[name]
+        return values.tolist() if hasattr(values, "tolist") else list(values)
+
+    def rows(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over drivers as dictionaries.
+
+        Yields:
+            Dictionary of column name -> value for each driver
+        """
+        names = list(self.columns)
+        for values in zip(*(self.column(n) for n in names)):
+            yield dict(zip(names, values))
+
+
+class _GeneratorAdapter:
+    """Exposes a numpy.random.Generator through the random.Random methods used here."""
+
+    def __init__(self, generator):
+        self.generator = generator
+
+    def random(self) -> float:
+        return float(self.generator.random())
+
+    def uniform(self, a: float, b: float) -> float:
+        return float(self.generator.uniform(a, b))
+
+    def randint(self, a: int, b: int) -> int:
+        return int(self.generator.integers(a, b + 1))
+
+    def choice(self, seq):
+        return seq[int(self.generator.integers(0, len(seq)))]
+
+
+def make_rng(seed: Optional[int] = None, rng=None):
+    """
+    Get the random number generator to use for one operation.
+
+    Args:
+        seed: Seed for a new generator (ignored if rng is given)
+        rng: Existing random.Random or numpy.random.Generator
+
+    Returns:
+        Object with the random.Random methods (random, uniform, randint, choice).
+        Without rng or seed, a new independently seeded random.Random is
+        returned, so concurrent callers never share state.
+    """
+    if rng is None:
+        return random.Random(seed)
+    if not isinstance(rng, random.Random) and _numpy() is not None and isinstance(rng, np.random.Generator):
+        return _GeneratorAdapter(rng)
+    return rng
 
 
 class TalentRandomizer:
@@ -47,44 +139,52 @@ class TalentRandomizer:
     ]
 
     @staticmethod
-    def random_racing_stats() -> Dict[str, float]:
+    def random_racing_stats(rng=None, bounds: Optional[Dict[str, Any]] = None) -> Dict[str, float]:
         """
         Generate ONLY random racing statistics (for UI randomizer).
 
         Does NOT generate personal info (name, nationality, date, career stats).
         Only generates the 9 racing performance stats.
 
+        Args:
+            rng: random.Random or numpy.random.Generator (default: new generator)
+            bounds: Randomizer bounds (default: read from config)
+
         Returns:
             Dictionary with 9 racing stats
         """
+        rng = make_rng(rng=rng)
+
         # Get bounds from config
-        bounds = _get_bounds()
+        bounds = bounds or _get_bounds()
 
         # Génération du niveau général (depuis config)
         overall_min = bounds["overall_skill"]["min"]
         overall_max = bounds["overall_skill"]["max"]
-        overall_skill = random.uniform(overall_min, overall_max)
+        overall_skill = rng.uniform(overall_min, overall_max)
 
         # Stats principales (corrélées avec overall_skill)
         speed = TalentRandomizer._generate_correlated(
-            overall_skill, variance=bounds["speed_variance"]
+            overall_skill, variance=bounds["speed_variance"], rng=rng
         )
         composure = TalentRandomizer._generate_correlated(
-            overall_skill, variance=bounds["composure_variance"]
+            overall_skill, variance=bounds["composure_variance"], rng=rng
         )
 
         # Crash inversement proportionnel (meilleur pilote = moins de crash)
         crash = TalentRandomizer._generate_inverse(
             overall_skill,
             base=bounds["crash_base"],
-            variance=bounds["crash_variance"]
+            variance=bounds["crash_variance"],
+            rng=rng,
         )
 
         # CompletedLaps élevé si crash bas
         completed_laps = TalentRandomizer._generate_inverse(
             crash,
             base=bounds["completed_laps_base"],
-            variance=bounds["completed_laps_variance"]
+            variance=bounds["completed_laps_variance"],
+            rng=rng,
         )
         completed_laps = max(
             float(bounds["completed_laps_min"]),
@@ -93,25 +193,25 @@ class TalentRandomizer:
 
         # Recovery aide à gérer les erreurs
         recovery = TalentRandomizer._generate_correlated(
-            overall_skill, variance=bounds["recovery_variance"]
+            overall_skill, variance=bounds["recovery_variance"], rng=rng
         )
 
         # Aggression et Courtesy sont plus indépendantes (depuis config)
-        aggression = random.uniform(
+        aggression = rng.uniform(
             bounds["aggression"]["min"], bounds["aggression"]["max"]
         )
-        courtesy = random.uniform(
+        courtesy = rng.uniform(
             bounds["courtesy"]["min"], bounds["courtesy"]["max"]
         )
 
         # MinRacingSkill proche de l'overall
         min_racing_skill = TalentRandomizer._generate_correlated(
-            overall_skill, variance=bounds["min_racing_skill_variance"]
+            overall_skill, variance=bounds["min_racing_skill_variance"], rng=rng
         )
 
         # Reputation basée sur le niveau (sans victoires/championnats)
         reputation = TalentRandomizer._generate_correlated(
-            overall_skill, variance=bounds["reputation_variance"]
+            overall_skill, variance=bounds["reputation_variance"], rng=rng
         )
 
         return {
@@ -127,10 +227,13 @@ class TalentRandomizer:
         }
 
     @staticmethod
-    def random_stats() -> Dict[str, Any]:
+    def random_stats(rng=None) -> Dict[str, Any]:
         """
         Generate random talent statistics with coherent relationships.
 
+        Args:
+            rng: random.Random or numpy.random.Generator (default: new generator)
+
         Returns:
             Dictionary with random personal_info and stats
 
@@ -141,30 +244,32 @@ class TalentRandomizer:
         - CompletedLaps est élevé si crash est bas
         - Recovery aide à compenser les erreurs
         """
+        rng = make_rng(rng=rng)
+
         # Génération du niveau général (40-95)
         # Cela définit le "tier" du pilote
-        overall_skill = random.uniform(40, 95)
+        overall_skill = rng.uniform(40, 95)
 
         # Stats principales (corrélées avec overall_skill)
-        speed = TalentRandomizer._generate_correlated(overall_skill, variance=8)
-        composure = TalentRandomizer._generate_correlated(overall_skill, variance=10)
+        speed = TalentRandomizer._generate_correlated(overall_skill, variance=8, rng=rng)
+        composure = TalentRandomizer._generate_correlated(overall_skill, variance=10, rng=rng)
 
         # Crash inversement proportionnel (meilleur pilote = moins de crash)
-        crash = TalentRandomizer._generate_inverse(overall_skill, base=50, variance=15)
+        crash = TalentRandomizer._generate_inverse(overall_skill, base=50, variance=15, rng=rng)
 
         # CompletedLaps élevé si crash bas
-        completed_laps = TalentRandomizer._generate_inverse(crash, base=95, variance=8)
+        completed_laps = TalentRandomizer._generate_inverse(crash, base=95, variance=8, rng=rng)
         completed_laps = max(75.0, min(99.0, completed_laps))  # Entre 75-99%
 
         # Recovery aide à gérer les erreurs
-        recovery = TalentRandomizer._generate_correlated(overall_skill, variance=12)
+        recovery = TalentRandomizer._generate_correlated(overall_skill, variance=12, rng=rng)
 
         # Aggression et Courtesy sont plus indépendantes
-        aggression = random.uniform(30, 90)
-        courtesy = random.uniform(40, 85)
+        aggression = rng.uniform(30, 90)
+        courtesy = rng.uniform(40, 85)
 
         # MinRacingSkill proche de l'overall
-        min_racing_skill = TalentRandomizer._generate_correlated(overall_skill, variance=5)
+        min_racing_skill = TalentRandomizer._generate_correlated(overall_skill, variance=5, rng=rng)
 
         # Génération des informations personnelles
         # Victoires, poles, championnats basés sur le niveau
@@ -174,39 +279,39 @@ class TalentRandomizer:
         championships = 0
 
         # 70% de chances d'avoir de l'expérience
-        if random.random() < 0.7:
+        if rng.random() < 0.7:
             # Nombre de départs basé sur le niveau (plus haut = plus d'expérience)
-            starts = int(random.uniform(10, 300) * (overall_skill / 80))
+            starts = int(rng.uniform(10, 300) * (overall_skill / 80))
 
             # Poles proportionnels aux départs et à la vitesse
             if starts > 0:
-                pole_rate = (speed / 100) * random.uniform(0.05, 0.25)
+                pole_rate = (speed / 100) * rng.uniform(0.05, 0.25)
                 poles = int(starts * pole_rate)
 
             # Victoires proportionnelles aux poles et au niveau général
             if poles > 0:
-                win_rate = (overall_skill / 100) * random.uniform(0.3, 0.8)
+                win_rate = (overall_skill / 100) * rng.uniform(0.3, 0.8)
                 wins = int(poles * win_rate)
 
             # Championnats pour les meilleurs pilotes
             if overall_skill > 85 and wins > 20:
-                championships = random.randint(1, 5)
+                championships = rng.randint(1, 5)
             elif overall_skill > 75 and wins > 10:
-                if random.random() < 0.3:
-                    championships = random.randint(1, 2)
+                if rng.random() < 0.3:
+                    championships = rng.randint(1, 2)
 
         # Reputation basée sur les résultats
         reputation = TalentRandomizer._calculate_reputation(
-            overall_skill, wins, championships
+            overall_skill, wins, championships, rng=rng
         )
 
         # Génération date de naissance (18-45 ans)
-        birth_year = random.randint(1979, 2007)
-        birth_month = random.randint(1, 12)
-        birth_day = random.randint(1, 28)  # Évite les problèmes de jours invalides
+        birth_year = rng.randint(1979, 2007)
+        birth_month = rng.randint(1, 12)
+        birth_day = rng.randint(1, 28)  # Évite les problèmes de jours invalides
 
         # Nationalité aléatoire
-        nationality = random.choice(TalentRandomizer.NATIONALITIES)
+        nationality = rng.choice(TalentRandomizer.NATIONALITIES)
 
         return {
             "personal_info": {
@@ -231,22 +336,24 @@ class TalentRandomizer:
         }
 
     @staticmethod
-    def _generate_correlated(base: float, variance: float) -> float:
+    def _generate_correlated(base: float, variance: float, rng=None) -> float:
         """
         Generate a value correlated with the base value.
 
         Args:
             base: Base value (0-100)
             variance: Maximum variance from base
+            rng: Random generator (default: new generator)
 
         Returns:
             Float value between 0 and 100
         """
-        value = base + random.uniform(-variance, variance)
+        rng = make_rng(rng=rng)
+        value = base + rng.uniform(-variance, variance)
         return max(0.0, min(100.0, value))
 
     @staticmethod
-    def _generate_inverse(value: float, base: float, variance: float) -> float:
+    def _generate_inverse(value: float, base: float, variance: float, rng=None) -> float:
         """
         Generate a value inversely correlated with the input.
 
@@ -254,10 +361,13 @@ class TalentRandomizer:
             value: Input value (0-100)
             base: Base value for the result
             variance: Maximum variance from base
+            rng: Random generator (default: new generator)
 
         Returns:
             Float value between 0 and 100
         """
+        rng = make_rng(rng=rng)
+
         # Inverse: high value → low result
         # Instead of base - value (which can go negative for high values),
         # use 100 - value to get the inverse, then scale it
@@ -266,12 +376,12 @@ class TalentRandomizer:
         # Apply base and variance
         # Map inverse_normalized (0-100) to around base with variance
         scaling_factor = base / 50.0  # Scale relative to middle point
-        result = (inverse_normalized * scaling_factor) + random.uniform(-variance, variance)
+        result = (inverse_normalized * scaling_factor) + rng.uniform(-variance, variance)
 
         return max(0.0, min(100.0, result))
 
     @staticmethod
-    def _calculate_reputation(skill: float, wins: int, championships: int) -> float:
+    def _calculate_reputation(skill: float, wins: int, championships: int, rng=None) -> float:
         """
         Calculate reputation based on skill and achievements.
 
@@ -279,10 +389,13 @@ class TalentRandomizer:
             skill: Overall skill level (0-100)
             wins: Number of wins
             championships: Number of championships
+            rng: Random generator (default: new generator)
 
         Returns:
             Reputation value (0-100)
         """
+        rng = make_rng(rng=rng)
+
         # Base sur le skill
         reputation = skill
 
@@ -295,12 +408,12 @@ class TalentRandomizer:
         reputation += championship_bonus
 
         # Petit facteur aléatoire
-        reputation += random.uniform(-5, 5)
+        reputation += rng.uniform(-5, 5)
 
         return max(0.0, min(100.0, reputation))
 
     @staticmethod
-    def random_field(field_name: str, context: Optional[Dict[str, Any]] = None) -> Any:
+    def random_field(field_name: str, context: Optional[Dict[str, Any]] = None, rng=None) -> Any:
         """
         Generate a random value for a specific field.
 
@@ -309,6 +422,7 @@ class TalentRandomizer:
         Args:
             field_name: Name of the field to generate
             context: Optional context (e.g., other field values for coherence)
+            rng: random.Random or numpy.random.Generator (default: new generator)
 
         Returns:
             Random value for the field
@@ -321,45 +435,46 @@ class TalentRandomizer:
           recovery, completed_laps, min_racing_skill
         """
         context = context or {}
+        rng = make_rng(rng=rng)
 
         # Nationalité
         if field_name == "nationality":
-            return random.choice(TalentRandomizer.NATIONALITIES)
+            return rng.choice(TalentRandomizer.NATIONALITIES)
 
         # Date de naissance (18-45 ans)
         if field_name == "date_of_birth":
-            birth_year = random.randint(1979, 2007)
-            birth_month = random.randint(1, 12)
-            birth_day = random.randint(1, 28)
+            birth_year = rng.randint(1979, 2007)
+            birth_month = rng.randint(1, 12)
+            birth_day = rng.randint(1, 28)
             return f"{birth_day}-{birth_month}-{birth_year}"
 
         # Stats de carrière (basées sur un niveau estimé)
         if field_name in ["starts", "poles", "wins", "drivers_championships"]:
             # Estimer un niveau depuis le contexte ou générer aléatoirement
-            estimated_skill = context.get("speed", random.uniform(40, 95))
+            estimated_skill = context.get("speed", rng.uniform(40, 95))
 
             # 70% de chances d'avoir de l'expérience
-            if random.random() < 0.7:
+            if rng.random() < 0.7:
                 if field_name == "starts":
-                    return int(random.uniform(10, 300) * (estimated_skill / 80))
+                    return int(rng.uniform(10, 300) * (estimated_skill / 80))
                 elif field_name == "poles":
                     starts = context.get("starts", 50)
                     if starts > 0:
-                        pole_rate = (estimated_skill / 100) * random.uniform(0.05, 0.25)
+                        pole_rate = (estimated_skill / 100) * rng.uniform(0.05, 0.25)
                         return int(starts * pole_rate)
                     return 0
                 elif field_name == "wins":
                     poles = context.get("poles", 5)
                     if poles > 0:
-                        win_rate = (estimated_skill / 100) * random.uniform(0.3, 0.8)
+                        win_rate = (estimated_skill / 100) * rng.uniform(0.3, 0.8)
                         return int(poles * win_rate)
                     return 0
                 elif field_name == "drivers_championships":
                     wins = context.get("wins", 0)
                     if estimated_skill > 85 and wins > 20:
-                        return random.randint(1, 5)
+                        return rng.randint(1, 5)
                     elif estimated_skill > 75 and wins > 10:
-                        return random.randint(1, 2) if random.random() < 0.3 else 0
+                        return rng.randint(1, 2) if rng.random() < 0.3 else 0
                     return 0
             return 0
 
@@ -367,14 +482,14 @@ class TalentRandomizer:
         if field_name in ["speed", "crash", "aggression", "reputation", "courtesy",
                           "composure", "recovery", "completed_laps", "min_racing_skill"]:
             # Générer toutes les stats cohérentes, puis retourner celle demandée
-            racing_stats = TalentRandomizer.random_racing_stats()
+            racing_stats = TalentRandomizer.random_racing_stats(rng=rng)
             return racing_stats.get(field_name, 50.0)
 
         # Champ non reconnu
         raise ValueError(f"Unknown field: {field_name}")
 
     @staticmethod
-    def fill_missing_fields(data: Dict[str, Any]) -> Dict[str, Any]:
+    def fill_missing_fields(data: Dict[str, Any], rng=None) -> Dict[str, Any]:
         """
         Fill missing fields in a talent data dictionary.
 
@@ -382,6 +497,8 @@ class TalentRandomizer:
 
         Args:
             data: Partial talent data (e.g., from CSV row)
+            rng: random.Random or numpy.random.Generator (default: new generator).
+                 Pass a seeded generator to get reproducible values.
 
         Returns:
             Complete talent data with all missing fields filled
@@ -400,6 +517,8 @@ class TalentRandomizer:
             ... other racing stats ...
         }
         """
+        rng = make_rng(rng=rng)
+
         # Créer une copie pour ne pas modifier l'original
         result = data.copy()
 
@@ -415,20 +534,198 @@ class TalentRandomizer:
         missing_racing = [f for f in racing_fields if f not in result or result[f] is None or result[f] == ""]
         if len(missing_racing) == len(racing_fields):
             # Toutes les stats manquent, générer un set cohérent
-            racing_stats = TalentRandomizer.random_racing_stats()
+            racing_stats = TalentRandomizer.random_racing_stats(rng=rng)
             for field in racing_fields:
                 result[field] = racing_stats[field]
                 context[field] = racing_stats[field]
         else:
             # Certaines stats existent, remplir individuellement
             for field in missing_racing:
-                result[field] = TalentRandomizer.random_field(field, context)
+                result[field] = TalentRandomizer.random_field(field, context, rng=rng)
                 context[field] = result[field]
 
         # Remplir les champs personnels
         for field in personal_fields:
             if field not in result or result[field] is None or result[field] == "":
-                result[field] = TalentRandomizer.random_field(field, context)
+                result[field] = TalentRandomizer.random_field(field, context, rng=rng)
                 context[field] = result[field]
 
         return result
+
+    @staticmethod
+    def generate_batch(
+        n: int,
+        seed: Optional[int] = None,
+        include_career: bool = True,
+        bounds: Optional[Dict[str, Any]] = None,
+        rng=None,
+    ) -> TalentBatch:
+        """
+        Generate random data for many drivers at once.
+
+        Applies the same rules as random_racing_stats (config bounds,
+        correlated/inverse stats, clamping) to whole columns. With
+        include_career, career results and reputation follow random_stats,
+        and nationality and date of birth are drawn too.
+
+        Uses NumPy when installed, otherwise a pure-Python loop. A given
+        seed always gives the same batch with the same backend.
+
+        Args:
+            n: Number of drivers
+            seed: Random seed (None = non-reproducible, ignored if rng is given)
+            include_career: Also generate nationality, date of birth and career stats
+            bounds: Randomizer bounds (default: read once from config)
+            rng: random.Random or numpy.random.Generator to draw from
+
+        Returns:
+            TalentBatch with one column per field
+        """
+        if n < 0:
+            raise ValueError(f"n must be >= 0, got {n}")
+
+        bounds = bounds or _get_bounds()
+        if _numpy() is not None:
+            if not isinstance(rng, np.random.Generator):
+                rng = np.random.default_rng(seed if rng is None else rng.getrandbits(64))
+            columns = TalentRandomizer._generate_batch_numpy(n, rng, include_career, bounds)
+        else:
+            columns = TalentRandomizer._generate_batch_python(n, make_rng(seed, rng), include_career, bounds)
+        return TalentBatch(columns=columns, size=n)
+
+    @staticmethod
+    def _generate_batch_numpy(n: int, rng, include_career: bool, bounds: Dict[str, Any]) -> Dict[str, Any]:
+        """Vectorized generate_batch using numpy.random.Generator."""
+
+        def correlated(base, variance):
+            return np.clip(base + rng.uniform(-variance, variance, n), 0.0, 100.0)
+
+        def inverse(value, base, variance):
+            result = (100.0 - value) * (base / 50.0) + rng.uniform(-variance, variance, n)
+            return np.clip(result, 0.0, 100.0)
+
+        overall = rng.uniform(bounds["overall_skill"]["min"], bounds["overall_skill"]["max"], n)
+        speed = correlated(overall, bounds["speed_variance"])
+        composure = correlated(overall, bounds["composure_variance"])
+        crash = inverse(overall, bounds["crash_base"], bounds["crash_variance"])
+        completed_laps = np.clip(
+            inverse(crash, bounds["completed_laps_base"], bounds["completed_laps_variance"]),
+            float(bounds["completed_laps_min"]),
+            float(bounds["completed_laps_max"]),
+        )
+        recovery = correlated(overall, bounds["recovery_variance"])
+        aggression = rng.uniform(bounds["aggression"]["min"], bounds["aggression"]["max"], n)
+        courtesy = rng.uniform(bounds["courtesy"]["min"], bounds["courtesy"]["max"], n)
+        min_racing_skill = correlated(overall, bounds["min_racing_skill_variance"])
+
+        columns: Dict[str, Any] = {}
+
+        if include_career:
+            nationalities = np.array(TalentRandomizer.NATIONALITIES)
+            columns["nationality"] = nationalities[rng.integers(0, len(nationalities), n)]
+            years = rng.integers(1979, 2008, n)
+            months = rng.integers(1, 13, n)
+            days = rng.integers(1, 29, n)
+            columns["date_of_birth"] = [f"{d}-{m}-{y}" for d, m, y in zip(days.tolist(), months.tolist(), years.tolist())]
+
+            # 70% of drivers have experience
+            experienced = rng.random(n) < 0.7
+            starts = np.where(experienced, np.floor(rng.uniform(10, 300, n) * (overall / 80)), 0).astype(np.int64)
+            poles = np.floor(starts * (speed / 100) * rng.uniform(0.05, 0.25, n)).astype(np.int64)
+            wins = np.floor(poles * (overall / 100) * rng.uniform(0.3, 0.8, n)).astype(np.int64)
+
+            top = experienced & (overall > 85) & (wins > 20)
+            mid = experienced & ~top & (overall > 75) & (wins > 10) & (rng.random(n) < 0.3)
+            championships = np.where(top, rng.integers(1, 6, n), np.where(mid, rng.integers(1, 3, n), 0))
+
+            reputation = np.clip(
+                overall + np.minimum(15, wins * 0.5) + np.minimum(20, championships * 4) + rng.uniform(-5, 5, n),
+                0.0, 100.0,
+            )
+
+            columns["starts"] = starts
+            columns["poles"] = poles
+            columns["wins"] = wins
+            columns["drivers_championships"] = championships.astype(np.int64)
+        else:
+            reputation = correlated(overall, bounds["reputation_variance"])
+
+        stats = {
+            "speed": speed,
+            "crash": crash,
+            "aggression": aggression,
+            "reputation": reputation,
+            "courtesy": courtesy,
+            "composure": composure,
+            "recovery": recovery,
+            "completed_laps": completed_laps,
+            "min_racing_skill": min_racing_skill,
+        }
+        for field_name in RACING_STAT_FIELDS:
+            columns[field_name] = np.round(stats[field_name], 1)
+        return columns
+
+    @staticmethod
+    def _generate_batch_python(n: int, rng, include_career: bool, bounds: Dict[str, Any]) -> Dict[str, List]:
+        """Pure-Python generate_batch, used when NumPy isn't installed."""
+        names = (["nationality", "date_of_birth"] + CAREER_FIELDS if include_career else []) + RACING_STAT_FIELDS
+        columns: Dict[str, List] = {name: [] for name in names}
+
+        def correlated(base, variance):
+            return max(0.0, min(100.0, base + rng.uniform(-variance, variance)))
+
+        def inverse(value, base, variance):
+            return max(0.0, min(100.0, (100.0 - value) * (base / 50.0) + rng.uniform(-variance, variance)))
+
+        for _ in range(n):
+            overall = rng.uniform(bounds["overall_skill"]["min"], bounds["overall_skill"]["max"])
+            speed = correlated(overall, bounds["speed_variance"])
+            composure = correlated(overall, bounds["composure_variance"])
+            crash = inverse(overall, bounds["crash_base"], bounds["crash_variance"])
+            completed_laps = max(
+                float(bounds["completed_laps_min"]),
+                min(float(bounds["completed_laps_max"]),
+                    inverse(crash, bounds["completed_laps_base"], bounds["completed_laps_variance"])),
+            )
+            recovery = correlated(overall, bounds["recovery_variance"])
+            aggression = rng.uniform(bounds["aggression"]["min"], bounds["aggression"]["max"])
+            courtesy = rng.uniform(bounds["courtesy"]["min"], bounds["courtesy"]["max"])
+            min_racing_skill = correlated(overall, bounds["min_racing_skill_variance"])
+
+            if include_career:
+                columns["nationality"].append(rng.choice(TalentRandomizer.NATIONALITIES))
+                columns["date_of_birth"].append(
+                    f"{rng.randint(1, 28)}-{rng.randint(1, 12)}-{rng.randint(1979, 2007)}"
+                )
+
+                starts = poles = wins = championships = 0
+                if rng.random() < 0.7:
+                    starts = int(rng.uniform(10, 300) * (overall / 80))
+                    poles = int(starts * (speed / 100) * rng.uniform(0.05, 0.25))
+                    wins = int(poles * (overall / 100) * rng.uniform(0.3, 0.8))
+                    if overall > 85 and wins > 20:
+                        championships = rng.randint(1, 5)
+                    elif overall > 75 and wins > 10 and rng.random() < 0.3:
+                        championships = rng.randint(1, 2)
+
+                reputation = max(0.0, min(100.0, overall + min(15, wins * 0.5)
+                                          + min(20, championships * 4) + rng.uniform(-5, 5)))
+
+                columns["starts"].append(starts)
+                columns["poles"].append(poles)
+                columns["wins"].append(wins)
+                columns["drivers_championships"].append(championships)
+            else:
+                reputation = correlated(overall, bounds["reputation_variance"])
+
+            columns["speed"].append(round(speed, 1))
+            columns["crash"].append(round(crash, 1))
+            columns["aggression"].append(round(aggression, 1))
+            columns["reputation"].append(round(reputation, 1))
+            columns["courtesy"].append(round(courtesy, 1))
+            columns["composure"].append(round(composure, 1))
+            columns["recovery"].append(round(recovery, 1))
+            columns["completed_laps"].append(round(completed_laps, 1))
+            columns["min_racing_skill"].append(round(min_racing_skill, 1))
+
+        return columns
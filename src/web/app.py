@@ -4,16 +4,37 @@ FastAPI web application for rFactor Championship Creator.
 Main application file that sets up routes, middleware, and static files.
 """
 
+from contextlib import asynccontextmanager
+from functools import lru_cache
+
 from fastapi import FastAPI, Request
-from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, JSONResponse, PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pathlib import Path
 
-from .routes import talents, championships, championship_creator, import_export, config as config_routes, vehicles, tracks
+from .routes import talents, championships, championship_creator, import_export, config as config_routes, vehicles, tracks, debug, events
+from .middleware import CompressionMiddleware, MetricsMiddleware
+from .static_files import IMMUTABLE_CACHE_CONTROL, REVALIDATE_CACHE_CONTROL, CachedStaticFiles
+from ..services.catalog_warmup import get_catalog_warmup
+from ..services.catalog_watcher import get_catalog_watcher
+from ..utils.metrics import get_metrics, log_summary
 from ..__version__ import __version__
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Start loading the catalogs in the background (requests are served
+    meanwhile) and watching them for /api/events, and log the request and
+    span statistics at shutdown.
+    """
+    get_catalog_warmup().start()
+    get_catalog_watcher().start()
+    yield
+    get_catalog_watcher().stop()
+    log_summary()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="rFactor Championship Creator",
@@ -21,6 +42,7 @@ app = FastAPI(
     version=__version__,
     docs_url="/api/docs",
     redoc_url="/api/redoc",
+    lifespan=lifespan,
 )
 
 # Configure CORS for React frontend
@@ -32,6 +54,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress responses larger than 1 KB (large JSON listings) for clients
+# accepting gzip; precompressed static files and event streams are sent as
+# is. Level 6: most of the size reduction of level 9 for a fraction of its
+# CPU time
+app.add_middleware(CompressionMiddleware, minimum_size=1024, compresslevel=6)
+
+# Request latency and status metrics (see /api/metrics)
+app.add_middleware(MetricsMiddleware)
+
 # Setup paths
 BASE_DIR = Path(__file__).resolve().parent
 STATIC_DIR = BASE_DIR / "static"
@@ -41,15 +72,30 @@ TEMPLATES_DIR = BASE_DIR / "templates"
 REACT_BUILD_DIR = BASE_DIR.parent.parent / "frontend" / "dist"
 
 # Mount static files (old templates - keeping for backward compatibility)
-app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
+app.mount("/static", CachedStaticFiles(directory=str(STATIC_DIR)), name="static")
 
 # Serve React build in production
 if REACT_BUILD_DIR.exists():
-    # Mount React static assets
-    app.mount("/assets", StaticFiles(directory=str(REACT_BUILD_DIR / "assets")), name="react-assets")
+    # Mount React static assets (Vite names them with a content hash)
+    app.mount(
+        "/assets",
+        CachedStaticFiles(directory=str(REACT_BUILD_DIR / "assets"), cache_control=IMMUTABLE_CACHE_CONTROL),
+        name="react-assets",
+    )
+
+
+@lru_cache(maxsize=1)
+def get_templates():
+    """
+    Get the Jinja2 templates of the legacy pages (kept for backward compatibility).
+
+    Jinja2 is only loaded when a legacy page is first requested; the React
+    frontend doesn't use it.
+    """
+    from fastapi.templating import Jinja2Templates
+
+    return Jinja2Templates(directory=str(TEMPLATES_DIR))
 
-# Setup templates (old Jinja2 templates - keeping for backward compatibility)
-templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
 
 # Include routers
 app.include_router(talents.router, prefix="/api/talents", tags=["Talents"])
@@ -59,6 +105,8 @@ app.include_router(vehicles.router, prefix="/api/vehicles", tags=["Vehicles"])
 app.include_router(import_export.router, prefix="/api", tags=["Import/Export"])
 app.include_router(config_routes.router, prefix="/api/config", tags=["Configuration"])
 app.include_router(tracks.router, prefix="/api/tracks", tags=["Tracks"]) 
+app.include_router(debug.router, prefix="/api/debug", tags=["Diagnostics"])
+app.include_router(events.router, prefix="/api/events", tags=["Events"])
 
 
 @app.get("/", response_class=HTMLResponse)
@@ -70,9 +118,9 @@ async def root(request: Request):
     react_index = BASE_DIR.parent.parent / "frontend" / "dist" / "index.html"
 
     if react_index.exists():
-        # Production: Serve React build
+        # Production: Serve React build (revalidated, so a new build's assets are picked up)
         with open(react_index, 'r', encoding='utf-8') as f:
-            return HTMLResponse(content=f.read())
+            return HTMLResponse(content=f.read(), headers={"Cache-Control": REVALIDATE_CACHE_CONTROL})
     else:
         # Development: Redirect to React dev server or show message
         return HTMLResponse(content="""
@@ -136,19 +184,19 @@ async def root(request: Request):
 @app.get("/talents", response_class=HTMLResponse)
 async def talents_page(request: Request):
     """Talents list page."""
-    return templates.TemplateResponse("talents/list.html", {"request": request})
+    return get_templates().TemplateResponse("talents/list.html", {"request": request})
 
 
 @app.get("/talents/new", response_class=HTMLResponse)
 async def talent_new_page(request: Request):
     """Talent creation page."""
-    return templates.TemplateResponse("talents/form.html", {"request": request, "mode": "create"})
+    return get_templates().TemplateResponse("talents/form.html", {"request": request, "mode": "create"})
 
 
 @app.get("/talents/{name}/edit", response_class=HTMLResponse)
 async def talent_edit_page(request: Request, name: str):
     """Talent edit page."""
-    return templates.TemplateResponse("talents/form.html", {"request": request, "mode": "edit", "talent_name": name})
+    return get_templates().TemplateResponse("talents/form.html", {"request": request, "mode": "edit", "talent_name": name})
 
 
 @app.get("/talents/{name:path}", response_class=HTMLResponse)
@@ -160,67 +208,92 @@ async def talent_detail_page(request: Request, name: str):
     if name.endswith("/edit"):
         talent_name = name.replace("/edit", "")
         return await talent_edit_page(request, talent_name)
-    return templates.TemplateResponse("talents/detail.html", {"request": request, "talent_name": name})
+    return get_templates().TemplateResponse("talents/detail.html", {"request": request, "talent_name": name})
 
 
 @app.get("/championships", response_class=HTMLResponse)
 async def championships_page(request: Request):
     """Championships list page."""
-    return templates.TemplateResponse("championships/list.html", {"request": request})
+    return get_templates().TemplateResponse("championships/list.html", {"request": request})
 
 
 @app.get("/championships/create/new", response_class=HTMLResponse)
 async def championship_create_page(request: Request):
     """Custom championship creation page."""
-    return templates.TemplateResponse("championships/create.html", {"request": request})
+    return get_templates().TemplateResponse("championships/create.html", {"request": request})
 
 
 @app.get("/championships/{name}", response_class=HTMLResponse)
 async def championship_detail_page(request: Request, name: str):
     """Championship detail page."""
-    return templates.TemplateResponse("championships/detail.html", {"request": request, "championship_name": name})
+    return get_templates().TemplateResponse("championships/detail.html", {"request": request, "championship_name": name})
 
 
 @app.get("/vehicles", response_class=HTMLResponse)
 async def vehicles_page(request: Request):
     """Vehicles list page."""
-    return templates.TemplateResponse("vehicles/list.html", {"request": request})
+    return get_templates().TemplateResponse("vehicles/list.html", {"request": request})
 
 
 @app.get("/vehicles/{path:path}", response_class=HTMLResponse)
 async def vehicle_detail_page(request: Request, path: str):
     """Vehicle detail page."""
-    return templates.TemplateResponse("vehicles/detail.html", {"request": request, "vehicle_path": path})
+    return get_templates().TemplateResponse("vehicles/detail.html", {"request": request, "vehicle_path": path})
 
 
 @app.get("/tracks", response_class=HTMLResponse)
 async def tracks_page(request: Request):
     """Tracks list page."""
-    return templates.TemplateResponse("tracks/list.html", {"request": request})
+    return get_templates().TemplateResponse("tracks/list.html", {"request": request})
 
 
 @app.get("/tracks/{path:path}", response_class=HTMLResponse)
 async def track_detail_page(request: Request, path: str):
     """Track detail page."""
-    return templates.TemplateResponse("tracks/detail.html", {"request": request, "track_path": path})
+    return get_templates().TemplateResponse("tracks/detail.html", {"request": request, "track_path": path})
 
 
 @app.get("/import", response_class=HTMLResponse)
 async def import_page(request: Request):
     """CSV import page."""
-    return templates.TemplateResponse("import.html", {"request": request})
+    return get_templates().TemplateResponse("import.html", {"request": request})
 
 
 @app.get("/config", response_class=HTMLResponse)
 async def config_page(request: Request):
     """Configuration page."""
-    return templates.TemplateResponse("config.html", {"request": request})
+    return get_templates().TemplateResponse("config.html", {"request": request})
 
 
 @app.get("/health")
 async def health_check():
-    """Health check endpoint."""
-    return {"status": "ok", "service": "rFactor Championship Creator"}
+    """Health check endpoint, with the catalog warm-up progress."""
+    warmup = get_catalog_warmup().progress()
+    return {
+        "status": "ok",
+        "service": "rFactor Championship Creator",
+        "ready": warmup["ready"],
+        "warmup": warmup,
+    }
+
+
+@app.get("/ready")
+async def readiness_check():
+    """
+    Readiness endpoint: 200 once the catalogs are loaded, 503 while warming up.
+    """
+    warmup = get_catalog_warmup().progress()
+    status_code = 200 if warmup["ready"] else 503
+    return JSONResponse(status_code=status_code, content=warmup)
+
+
+@app.get("/api/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """
+    Metrics in the Prometheus text format: request latencies, timed spans,
+    files parsed, bytes copied and catalog hit/miss counts.
+    """
+    return PlainTextResponse(get_metrics().render(), media_type="text/plain; version=0.0.4")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,77 @@
+"""
+Fast JSON responses for large list and detail endpoints.
+
+By default FastAPI validates every item of a response against its
+response_model, converts it with jsonable_encoder and then serializes it
+with the json module. For lists of thousands of vehicles or talents, and
+for the nested championship details, that pipeline dominates the request
+time. Endpoints on the fast path build plain dicts from the catalog objects
+and return a FastJSONResponse, which FastAPI sends as is: the dicts are
+encoded straight to bytes with orjson and the
+response_model only documents the schema.
+
+Endpoints returning a FastJSONResponse are responsible for producing the
+fields and types of their response_model.
+"""
+
+import json
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import Response
+
+from ..utils.optional_imports import optional_import
+
+# orjson is loaded on first use by _orjson(), to keep it out of the
+# application startup; the json module is used on installs without it
+_UNSET = object()
+orjson: Any = _UNSET
+
+
+def _orjson():
+    """Get orjson, importing it on first use (None if not installed)."""
+    global orjson
+    if orjson is _UNSET:
+        orjson = optional_import("orjson")
+    return orjson
+
+
+def _default(obj: Any) -> Any:
+    """Convert objects the encoders don't support natively (Path, models...)."""
+    return jsonable_encoder(obj)
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Serialize content to compact UTF-8 JSON, like FastAPI's JSONResponse.
+
+    Dicts, lists, strings, numbers and dataclasses are encoded natively;
+    other objects (Pydantic models, paths, enums...) go through
+    jsonable_encoder.
+
+    Args:
+        content: Data to serialize
+
+    Returns:
+        JSON bytes
+    """
+    fast = _orjson()
+    if fast is not None:
+        return fast.dumps(content, default=_default, option=fast.OPT_NON_STR_KEYS)
+
+    return json.dumps(
+        content,
+        default=_default,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+class FastJSONResponse(Response):
+    """JSON response serialized with dumps, without response_model validation."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,108 @@
+"""
+ASGI middleware of the web application.
+"""
+
+import logging
+import time
+from typing import Dict
+
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.routing import Mount
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..utils.metrics import HTTP_REQUEST_DURATION, HTTP_REQUESTS
+
+logger = logging.getLogger(__name__)
+
+# Requests slower than this are logged at WARNING level
+SLOW_REQUEST_SECONDS = 1.0
+
+
+class MetricsMiddleware:
+    """
+    Record the latency and status of every HTTP request.
+
+    Requests are labelled with their route template (e.g.,
+    "/api/talents/{name}") rather than the raw path, so the number of series
+    stays bounded; requests that match no route are labelled "unmatched".
+    Written as a plain ASGI middleware so streamed responses are timed until
+    their last chunk is sent.
+    """
+
+    def __init__(self, app: ASGIApp):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application
+        """
+        self.app = app
+        self._templates: Dict[object, str] = {}
+        self._routes_seen = -1
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+        event_stream = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, event_stream
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                event_stream = Headers(raw=message["headers"]).get("content-type", "").startswith("text/event-stream")
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - start
+            # The router stores the matched endpoint in the (shared) scope
+            route = self._route_template(scope)
+            method = scope["method"]
+            HTTP_REQUESTS.inc(method=method, route=route, status=str(status_code))
+            # Event streams stay open as long as the page: not a latency
+            if not event_stream:
+                HTTP_REQUEST_DURATION.observe(duration, method=method, route=route)
+                if duration >= SLOW_REQUEST_SECONDS:
+                    logger.warning(f"Slow request: {method} {scope['path']} ({route}) took {duration:.2f}s")
+
+    def _route_template(self, scope: Scope) -> str:
+        """Get the route template of the endpoint that handled the request."""
+        endpoint = scope.get("endpoint")
+        app = scope.get("app")
+        if endpoint is None or app is None:
+            return "unmatched"
+
+        routes = getattr(app, "routes", [])
+        if len(routes) != self._routes_seen:
+            templates = {}
+            for route in routes:
+                if isinstance(route, Mount):
+                    templates[route.app] = route.path + "/{path}"
+                elif hasattr(route, "endpoint"):
+                    templates[route.endpoint] = route.path
+            self._templates = templates
+            self._routes_seen = len(routes)
+
+        return self._templates.get(endpoint, "unmatched")
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """
+    GZip compression of the responses, except for event streams.
+
+    Compressed chunks are held in the compressor's buffer, which would delay
+    server-sent events; EventSource requests (Accept: text/event-stream) are
+    passed through uncompressed.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and "text/event-stream" in Headers(scope=scope).get("accept", ""):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
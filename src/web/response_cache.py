@@ -0,0 +1,231 @@
+"""
+Cache of serialized JSON responses for read endpoints.
+
+Read endpoints that aggregate a catalog (vehicle classes, track lists,
+championship infos...) are wrapped with cached_response. The response body
+is cached as JSON bytes, keyed by the endpoint, its parameters, the
+configuration version and the state of the data it reads (e.g., the
+generation of the vehicle catalog). A hit skips both the computation and
+the serialization.
+
+Entries become unreachable as soon as the data changes (the state is part
+of the key); write endpoints also drop the entries of the data they modify
+with invalidates_response_cache, for changes the state doesn't capture.
+"""
+
+import functools
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
+
+from .fast_json import FastJSONResponse
+from ..services.event_bus import get_event_bus
+from ..utils.config import get_config
+from ..utils.metrics import get_metrics
+
+RESPONSE_CACHE_REQUESTS = get_metrics().counter(
+    "rfactor_response_cache_requests_total",
+    "Cached read endpoint calls served from the cache (hit) or computed (miss)",
+    ("endpoint", "result"),
+)
+
+
+class ResponseCache:
+    """LRU cache of response bodies, grouped by tag (e.g., "vehicles")."""
+
+    def __init__(self, max_entries: int = 512):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum number of cached responses
+        """
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[str, bytes]]" = OrderedDict()
+        self._versions: Dict[str, int] = {}
+        self._generation = 0
+
+    def version(self, tag: str) -> int:
+        """Get the invalidation counter of a tag (part of the cache keys)."""
+        with self._lock:
+            return self._generation + self._versions.get(tag, 0)
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        """
+        Get a cached body.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Body bytes, or None if not cached
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: Hashable, tag: str, body: bytes) -> None:
+        """
+        Cache a body, evicting the least recently used entries if needed.
+
+        Args:
+            key: Cache key
+            tag: Data the body was computed from
+            body: Serialized response body
+        """
+        with self._lock:
+            self._entries[key] = (tag, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, *tags: str) -> None:
+        """
+        Drop the cached responses of some tags (all responses without tags).
+
+        Args:
+            *tags: Tags to invalidate (e.g., "talents")
+        """
+        with self._lock:
+            if not tags:
+                self._generation += 1
+                self._entries.clear()
+                return
+            for tag in tags:
+                self._versions[tag] = self._versions.get(tag, 0) + 1
+            stale = [key for key, (tag, _) in self._entries.items() if tag in tags]
+            for key in stale:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Global cache instance
+_cache_instance: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    """
+    Get the global response cache.
+
+    Returns:
+        ResponseCache instance
+    """
+    global _cache_instance
+
+    if _cache_instance is None:
+        _cache_instance = ResponseCache()
+
+    return _cache_instance
+
+
+def cached_response(tag: str, state: Callable[[], Hashable]) -> Callable:
+    """
+    Decorator caching the JSON response of a read endpoint.
+
+    The endpoint result is serialized like FastAPI's JSONResponse (or taken
+    from the FastJSONResponse it returns) and the bytes are cached. Calls
+    with reload=True bypass the cache (and refresh it). If state() fails
+    (e.g., the app isn't configured), the endpoint is called uncached so its
+    own error handling applies.
+
+    Args:
+        tag: Data the endpoint reads, invalidated by write endpoints
+        state: Returns a cheap, hashable version of that data (e.g., a
+               catalog generation); called on every request
+
+    Returns:
+        Decorator for async endpoint functions (place it below @router.get)
+    """
+    def decorator(func: Callable) -> Callable:
+        endpoint = f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+
+        def cache_key(kwargs: dict) -> Hashable:
+            params = tuple(sorted((name, repr(value)) for name, value in kwargs.items()))
+            return endpoint, params, get_config().version, get_response_cache().version(tag), state()
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            cache = get_response_cache()
+            try:
+                key = cache_key(kwargs)
+            except Exception:
+                return await func(*args, **kwargs)
+
+            if not kwargs.get("reload"):
+                body = cache.get(key)
+                if body is not None:
+                    RESPONSE_CACHE_REQUESTS.inc(endpoint=endpoint, result="hit")
+                    return Response(content=body, media_type="application/json")
+
+            RESPONSE_CACHE_REQUESTS.inc(endpoint=endpoint, result="miss")
+            result = await func(*args, **kwargs)
+            if isinstance(result, FastJSONResponse) and result.status_code == 200:
+                # Already serialized by the endpoint
+                body = result.body
+            elif isinstance(result, Response):
+                return result
+            else:
+                body = JSONResponse(jsonable_encoder(result)).body
+            try:
+                # The endpoint may have reloaded the data: key on the new state
+                cache.put(cache_key(kwargs), tag, body)
+            except Exception:
+                pass
+            return Response(content=body, media_type="application/json")
+
+        return wrapper
+    return decorator
+
+
+def catalog_state(get_catalog: Callable) -> Callable[[], int]:
+    """
+    Build a state function for cached_response from a catalog.
+
+    Args:
+        get_catalog: Returns the catalog the endpoint reads
+
+    Returns:
+        Function returning the catalog generation, after refreshing the
+        catalog if its directory changed
+    """
+    def state() -> int:
+        catalog = get_catalog()
+        catalog.ensure_fresh()
+        return catalog.generation
+    return state
+
+
+def invalidates_response_cache(*tags: str) -> Callable:
+    """
+    Decorator invalidating cached responses after a write endpoint.
+
+    The cache is invalidated whether the endpoint succeeds or fails, since a
+    failed batch may still have written some files, and a "changed" event
+    with the tags is published to /api/events.
+
+    Args:
+        *tags: Tags of the data the endpoint modifies
+
+    Returns:
+        Decorator for async endpoint functions (place it below @router.post/put/delete)
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                get_response_cache().invalidate(*tags)
+                get_event_bus().publish("changed", {"tags": list(tags)})
+
+        return wrapper
+    return decorator
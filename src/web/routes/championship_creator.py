@@ -1,7 +1,7 @@
 """API routes for custom championship creation."""
 
 from fastapi import APIRouter, HTTPException, status
-from typing import List
+from typing import TYPE_CHECKING, List
 from pathlib import Path
 
 from ..schemas.championship_creator import (
@@ -9,14 +9,24 @@ from ..schemas.championship_creator import (
     CustomChampionshipCreateResponseSchema,
     CustomChampionshipListSchema,
 )
-from ...services.championship_creator import ChampionshipCreator
+from ..response_cache import invalidates_response_cache
 from ...utils.config import get_config
 
+if TYPE_CHECKING:
+    from ...services.championship_creator import ChampionshipCreator
+
 router = APIRouter()
 
 
-def get_championship_creator() -> ChampionshipCreator:
-    """Get ChampionshipCreator instance."""
+def get_championship_creator() -> "ChampionshipCreator":
+    """
+    Get ChampionshipCreator instance.
+
+    The creator (vehicle isolation, dependency collection, RFM generation)
+    is imported on first use to keep it out of the application startup.
+    """
+    from ...services.championship_creator import ChampionshipCreator
+
     config = get_config()
     if not config.is_configured():
         raise HTTPException(
@@ -52,6 +62,7 @@ async def list_custom_championships():
 
 
 @router.post("/custom", status_code=status.HTTP_201_CREATED, response_model=CustomChampionshipCreateResponseSchema)
+@invalidates_response_cache("championships", "vehicles")
 async def create_custom_championship(data: CustomChampionshipCreateSchema):
     """
     Create a new custom championship.
@@ -135,6 +146,7 @@ async def create_custom_championship(data: CustomChampionshipCreateSchema):
 
 
 @router.delete("/custom/{name}", status_code=status.HTTP_204_NO_CONTENT)
+@invalidates_response_cache("championships", "vehicles")
 async def delete_custom_championship(name: str):
     """
     Delete a custom championship.
@@ -1,19 +1,47 @@
 """API routes for championships management."""
 
+import os
+
 from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import Response
 from typing import List
 
 from ..schemas.championship import (
     ChampionshipCreateSchema,
     ChampionshipInfoSchema,
     ChampionshipDetailSchema,
+    ChampionshipBatchDuplicateSchema,
+    ChampionshipBatchNamesSchema,
+    BatchItemResultSchema,
+    BatchResultSchema,
 )
+from ..fast_json import FastJSONResponse
+from ..response_cache import cached_response, invalidates_response_cache
 from ...services.championship_service import ChampionshipService
+from ...services.batch_executor import BatchResult
 from ...utils.config import get_config
 
 router = APIRouter()
 
 
+def _sanitize_filename(name: str) -> str:
+    """Turn a championship name into a filename (no spaces or separators)."""
+    return name.replace(" ", "").replace("/", "").replace("\\", "")
+
+
+def _batch_result_to_schema(result: BatchResult) -> BatchResultSchema:
+    """Convert a BatchResult to its response schema."""
+    return BatchResultSchema(
+        success_count=result.success_count,
+        error_count=result.error_count,
+        total=result.total,
+        results=[
+            BatchItemResultSchema(name=r.item, success=r.success, message=r.message)
+            for r in result.results
+        ],
+    )
+
+
 def get_championship_service() -> ChampionshipService:
     """Get ChampionshipService instance."""
     config = get_config()
@@ -28,7 +56,33 @@ def get_championship_service() -> ChampionshipService:
     )
 
 
+def _championships_state() -> tuple:
+    """
+    State of the championship files for cached responses.
+
+    The listing reads the content of the .cch files (current race, player
+    points), which rFactor rewrites in place after each race, so the state
+    has the name, mtime and size of every .cch/.rfm file (one scandir per
+    folder) rather than only the folder mtimes.
+    """
+    service = get_championship_service()
+    state = []
+    for directory, extension in ((service.userdata_dir, ".cch"), (service.rfm_dir, ".rfm")):
+        files = []
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.name.lower().endswith(extension) and entry.is_file():
+                        stat = entry.stat()
+                        files.append((entry.name, stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            files = None
+        state.append((str(directory), tuple(sorted(files)) if files is not None else None))
+    return tuple(state)
+
+
 @router.get("/", response_model=List[ChampionshipInfoSchema])
+@cached_response("championships", _championships_state)
 async def list_championships():
     """
     List all championships.
@@ -44,6 +98,80 @@ async def list_championships():
     ]
 
 
+@router.post("/batch/duplicate", response_model=BatchResultSchema)
+@invalidates_response_cache("championships")
+async def batch_duplicate_championships(data: ChampionshipBatchDuplicateSchema):
+    """
+    Duplicate several championships in one request.
+
+    The rFactor installation is validated and the player resolved once for
+    the whole batch; the copies then run on a worker pool.
+
+    Args:
+        data: List of {name, new_name} pairs
+
+    Returns:
+        Per-item results (item name is the sanitized new name)
+    """
+    service = get_championship_service()
+    pairs = [(item.name, _sanitize_filename(item.new_name)) for item in data.items]
+    return _batch_result_to_schema(service.duplicate_many(pairs))
+
+
+@router.post("/batch/delete", response_model=BatchResultSchema)
+@invalidates_response_cache("championships")
+async def batch_delete_championships(data: ChampionshipBatchNamesSchema):
+    """
+    Delete several championships in one request.
+
+    Args:
+        data: Names of the championships to delete (without .cch)
+
+    Returns:
+        Per-item results
+    """
+    service = get_championship_service()
+    return _batch_result_to_schema(service.delete_many(data.names))
+
+
+@router.post("/batch/export")
+async def batch_export_championships(data: ChampionshipBatchNamesSchema):
+    """
+    Export several championships as a single zip archive.
+
+    Championships that can't be read are left out of the archive and listed
+    in an export_errors.txt file inside it. Counts are returned in the
+    X-Batch-Success-Count and X-Batch-Error-Count headers.
+
+    Args:
+        data: Names of the championships to export (without .cch)
+
+    Returns:
+        Zip file download
+
+    Raises:
+        404: None of the championships could be exported
+    """
+    service = get_championship_service()
+    content, result = service.export_many(data.names)
+
+    if result.success_count == 0:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="; ".join(r.message for r in result.results)
+        )
+
+    return Response(
+        content=content,
+        media_type='application/zip',
+        headers={
+            'Content-Disposition': 'attachment; filename=championships_export.zip',
+            'X-Batch-Success-Count': str(result.success_count),
+            'X-Batch-Error-Count': str(result.error_count),
+        }
+    )
+
+
 @router.get("/rfm/{name}")
 async def get_rfm_championship(name: str):
     """
@@ -111,8 +239,8 @@ async def get_championship(name: str):
             detail=f"Championship '{name}' not found"
         )
 
-    # Build comprehensive championship data
-    return {
+    # Build comprehensive championship data (serialized directly to bytes)
+    return FastJSONResponse({
         # Basic info
         "name": championship.season.name,
         "status": championship.season.season_status,
@@ -219,10 +347,11 @@ async def get_championship(name: str):
             "avg_start_position": championship.career.avg_start_position,
             "avg_finish_position": championship.career.avg_finish_position,
         } if championship.career else None,
-    }
+    })
 
 
 @router.post("/", status_code=status.HTTP_201_CREATED)
+@invalidates_response_cache("championships")
 async def create_championship(championship_data: ChampionshipCreateSchema):
     """
     Create a new championship.
@@ -239,7 +368,7 @@ async def create_championship(championship_data: ChampionshipCreateSchema):
     service = get_championship_service()
 
     # Extract filename from name (sanitize)
-    filename = championship_data.name.replace(" ", "").replace("/", "").replace("\\", "")
+    filename = _sanitize_filename(championship_data.name)
 
     # Check if championship already exists
     if service.exists(filename):
@@ -269,6 +398,7 @@ async def create_championship(championship_data: ChampionshipCreateSchema):
 
 
 @router.delete("/{name}", status_code=status.HTTP_204_NO_CONTENT)
+@invalidates_response_cache("championships")
 async def delete_championship(name: str):
     """
     Delete a championship.
@@ -297,6 +427,7 @@ async def delete_championship(name: str):
 
 
 @router.post("/{name}/duplicate", status_code=status.HTTP_201_CREATED)
+@invalidates_response_cache("championships")
 async def duplicate_championship(name: str, new_name: str):
     """
     Duplicate an existing championship.
@@ -321,7 +452,7 @@ async def duplicate_championship(name: str, new_name: str):
         )
 
     # Sanitize new name
-    new_filename = new_name.replace(" ", "").replace("/", "").replace("\\", "")
+    new_filename = _sanitize_filename(new_name)
 
     if service.exists(new_filename):
         raise HTTPException(
@@ -6,6 +6,8 @@ from typing import Dict, Any
 
 from ...utils.config import get_config
 from ...utils.rfactor_validator import RFactorValidator
+from ...utils.installation_cache import get_installation_cache
+from ...services.catalog_warmup import get_catalog_warmup
 
 router = APIRouter()
 
@@ -32,11 +34,12 @@ async def get_configuration():
         Current configuration
     """
     config = get_config()
+    is_configured = config.is_configured()
 
     return ConfigResponseSchema(
-        is_configured=config.is_configured(),
-        rfactor_path=config.get_rfactor_path() if config.is_configured() else None,
-        current_player=config.get_current_player() if config.is_configured() else None
+        is_configured=is_configured,
+        rfactor_path=config.get_rfactor_path() if is_configured else None,
+        current_player=config.get_current_player() if is_configured else None
     )
 
 
@@ -77,6 +80,9 @@ async def update_configuration(config_data: ConfigUpdateSchema):
         config.set_rfactor_path(config_data.rfactor_path, validate=True)
         config.set_current_player(config_data.current_player)
 
+        # Load the catalogs of the new installation in the background
+        get_catalog_warmup().start()
+
         return ConfigResponseSchema(
             is_configured=True,
             rfactor_path=config_data.rfactor_path,
@@ -90,6 +96,31 @@ async def update_configuration(config_data: ConfigUpdateSchema):
         )
 
 
+@router.get("/stats", response_model=Dict[str, Any])
+async def get_installation_stats():
+    """
+    Get talent, vehicle and location counts for the configured installation.
+
+    Counts come from the loaded catalogs when available and are cached, so
+    this doesn't walk the installation on every call. Includes per-mod
+    breakdowns (vehicles_by_mod, locations_by_mod).
+
+    Returns:
+        Installation info and counts
+
+    Raises:
+        503: Application not configured
+    """
+    config = get_config()
+    if not config.is_configured():
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Application not configured. Please configure rFactor path first."
+        )
+
+    return get_installation_cache().get_version_info(config.get_rfactor_path())
+
+
 @router.get("/players")
 async def list_players(rfactor_path: str):
     """
@@ -0,0 +1,55 @@
+"""API routes for production diagnostics (disabled unless enabled in config.json)."""
+
+from datetime import datetime
+
+from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
+
+from ...utils.config import get_config
+from ...utils.profiler import ProfilerBusyError, SamplingProfiler
+
+router = APIRouter()
+
+
+@router.get("/profile", response_class=PlainTextResponse)
+def profile(
+    seconds: float = Query(10, ge=0.1, le=120, description="Duration of the capture in seconds"),
+    interval_ms: float = Query(5, ge=1, le=1000, description="Milliseconds between two samples"),
+):
+    """
+    Sample the stacks of all server threads while live requests are served.
+
+    Trigger the slow page while the capture runs. The result is a
+    collapsed-stack file, to open with speedscope or flamegraph.pl.
+
+    Args:
+        seconds: Duration of the capture
+        interval_ms: Sampling interval
+
+    Returns:
+        Collapsed stacks ("frame;frame;... count" lines)
+
+    Raises:
+        403: Profiling is disabled in config.json
+        409: Another profile is running
+    """
+    if not get_config().is_debug_profiling_enabled():
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail='Profiling is disabled; set "debug_profiling": true in config.json',
+        )
+
+    # Sync endpoint: the capture blocks a thread pool worker, not the event loop
+    try:
+        profiler = SamplingProfiler(interval=interval_ms / 1000).run(seconds)
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+    filename = f"profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}.collapsed"
+    return PlainTextResponse(
+        profiler.collapsed(),
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "X-Profile-Samples": str(profiler.samples),
+        },
+    )
@@ -0,0 +1,125 @@
+"""API route streaming application events (server-sent events)."""
+
+import asyncio
+from typing import Optional
+
+from fastapi import APIRouter, Header, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+
+from ..fast_json import dumps
+from ...services.catalog_warmup import get_catalog_warmup
+from ...services.event_bus import Event, SubscriptionOverflow, get_event_bus
+
+router = APIRouter()
+
+# Event types published by the services
+EVENT_TYPES = {"catalog", "isolation", "import", "changed"}
+
+# Seconds without events before a keep-alive comment is sent (proxies and
+# browsers close idle connections)
+HEARTBEAT_SECONDS = 15
+
+# Reconnection delay suggested to EventSource, in milliseconds
+RETRY_MS = 3000
+
+
+def _format_event(event_type: str, data: dict, event_id: Optional[int] = None) -> str:
+    """Format one event in the text/event-stream format."""
+    lines = [] if event_id is None else [f"id: {event_id}"]
+    lines.append(f"event: {event_type}")
+    lines.append(f"data: {dumps(data).decode('utf-8')}")
+    return "\n".join(lines) + "\n\n"
+
+
+def _snapshot() -> dict:
+    """Current generation of each loaded catalog, sent on connection."""
+    return {
+        name: {"generation": catalog.generation, "loaded": catalog.is_loaded}
+        for name, catalog in get_catalog_warmup().catalogs().items()
+    }
+
+
+@router.get("")
+async def stream_events(
+    types: Optional[str] = Query(None, description="Comma-separated event types (default: all)"),
+    last_event_id: Optional[str] = Header(None, description="Id of the last event received (sent by EventSource on reconnection)"),
+):
+    """
+    Stream application events as server-sent events.
+
+    Open it with `new EventSource("/api/events")`. Event types:
+    - catalog: a catalog (talents, vehicles, locations) changed; data has
+      its generation and the changed/removed relative paths
+    - isolation: progress of a vehicle isolation (championship creation)
+    - import: progress of a CSV talent import
+    - changed: data modified through the API (tags such as "talents")
+
+    The first event, "snapshot", has the generation of each catalog. On
+    reconnection, events missed since Last-Event-ID are replayed; if they
+    are no longer available, a "resync" event tells the client to reload
+    its data.
+
+    Args:
+        types: Event types to receive
+        last_event_id: Last event id received by the client
+
+    Returns:
+        text/event-stream response
+
+    Raises:
+        400: Unknown event type
+    """
+    selected = None
+    if types:
+        selected = {item.strip() for item in types.split(",") if item.strip()}
+        unknown = selected - EVENT_TYPES
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown event types: {', '.join(sorted(unknown))} (available: {', '.join(sorted(EVENT_TYPES))})",
+            )
+
+    try:
+        resume_from = int(last_event_id) if last_event_id else None
+    except ValueError:
+        resume_from = None
+
+    bus = get_event_bus()
+
+    async def stream():
+        # Subscribed here, so the subscription is closed with the stream
+        try:
+            subscription = bus.subscribe(selected, resume_from)
+            resync = False
+        except SubscriptionOverflow:
+            subscription = bus.subscribe(selected)
+            resync = True
+
+        try:
+            yield f"retry: {RETRY_MS}\n\n"
+            if resync:
+                yield _format_event("resync", _snapshot(), bus.last_event_id)
+            elif resume_from is None:
+                yield _format_event("snapshot", _snapshot(), bus.last_event_id)
+
+            while True:
+                try:
+                    event: Event = await asyncio.wait_for(subscription.get(), HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                except SubscriptionOverflow:
+                    yield _format_event("resync", _snapshot(), bus.last_event_id)
+                else:
+                    yield _format_event(event.type, {**event.data, "timestamp": event.timestamp}, event.id)
+        finally:
+            subscription.close()
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            # Disable the response buffering of reverse proxies (nginx)
+            "X-Accel-Buffering": "no",
+        },
+    )
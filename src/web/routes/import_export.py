@@ -1,12 +1,15 @@
 """API routes for import/export functionality."""
 
-from fastapi import APIRouter, HTTPException, UploadFile, File, status
+from fastapi import APIRouter, HTTPException, Query, UploadFile, File, status
 from fastapi.responses import FileResponse, StreamingResponse
-from typing import List
+from typing import AsyncIterator, Iterable, Iterator, List, Optional
+import csv
 import tempfile
 import io
+import zlib
 from pathlib import Path
 
+from ..response_cache import invalidates_response_cache
 from ...services.talent_service import TalentService
 from ...services.import_service import ImportService
 from ...utils.config import get_config
@@ -26,12 +29,27 @@ def get_import_service() -> ImportService:
     return ImportService(talent_service)
 
 
+# Size of the chunks read from uploaded files
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+async def _iter_upload(file: UploadFile, chunk_size: int = UPLOAD_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """Read an uploaded file chunk by chunk."""
+    while True:
+        chunk = await file.read(chunk_size)
+        if not chunk:
+            break
+        yield chunk
+
+
 @router.post("/import/talents")
+@invalidates_response_cache("talents")
 async def import_talents_csv(
     file: UploadFile = File(...),
     overwrite_existing: bool = True,
     fill_missing: bool = True,
-    validate_only: bool = False
+    validate_only: bool = False,
+    seed: Optional[int] = None
 ):
     """
     Import talents from CSV file.
@@ -41,6 +59,7 @@ async def import_talents_csv(
         overwrite_existing: Overwrite talents that already exist (default: True)
         fill_missing: Use randomizer to fill missing/empty fields (default: True)
         validate_only: Only validate without creating files
+        seed: Random seed for filled fields (same CSV + seed = same talents)
 
     Returns:
         Import result with success/error/warning counts
@@ -53,6 +72,17 @@ async def import_talents_csv(
         - If fill_missing=True, empty/missing fields will be randomly generated
         - Warnings are issued for overwritten talents
     """
+    return await _import_csv(file, overwrite_existing, fill_missing, validate_only, seed)
+
+
+async def _import_csv(
+    file: UploadFile,
+    overwrite_existing: bool,
+    fill_missing: bool,
+    validate_only: bool,
+    seed: Optional[int],
+) -> dict:
+    """Import or validate an uploaded CSV (shared by the import and validate routes)."""
     # Validate file type
     if not file.filename.endswith('.csv'):
         raise HTTPException(
@@ -61,24 +91,18 @@ async def import_talents_csv(
         )
 
     try:
-        # Save uploaded file to temp location
-        with tempfile.NamedTemporaryFile(mode='wb', suffix='.csv', delete=False) as temp_file:
-            content = await file.read()
-            temp_file.write(content)
-            temp_path = temp_file.name
-
-        # Import from CSV
         import_service = get_import_service()
-        result = import_service.import_from_csv(
-            temp_path,
+
+        # Feed the upload straight through in chunks (no temp file)
+        await file.seek(0)
+        result = await import_service.import_from_chunks(
+            _iter_upload(file),
             overwrite_existing=overwrite_existing,
             fill_missing=fill_missing,
-            validate_only=validate_only
+            validate_only=validate_only,
+            seed=seed
         )
 
-        # Clean up temp file
-        Path(temp_path).unlink()
-
         # Format errors for response
         errors = [
             {
@@ -108,7 +132,9 @@ async def import_talents_csv(
             "warnings": warnings
         }
 
-    except ValueError as e:
+    except HTTPException:
+        raise
+    except (ValueError, csv.Error) as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
@@ -121,12 +147,13 @@ async def import_talents_csv(
 
 
 @router.post("/import/validate")
-async def validate_talents_csv(file: UploadFile = File(...)):
+async def validate_talents_csv(file: UploadFile = File(...), seed: Optional[int] = None):
     """
     Validate a CSV file without importing.
 
     Args:
         file: CSV file to validate
+        seed: Random seed for filled fields
 
     Returns:
         Validation result
@@ -134,61 +161,70 @@ async def validate_talents_csv(file: UploadFile = File(...)):
     Raises:
         400: Invalid file
     """
-    return await import_talents_csv(file, overwrite_existing=True, fill_missing=True, validate_only=True)
+    # Not through import_talents_csv: nothing is written, so the talent
+    # responses stay cached and no "changed" event is published
+    return await _import_csv(file, overwrite_existing=True, fill_missing=True, validate_only=True, seed=seed)
 
 
 @router.get("/export/talents")
-async def export_talents_csv(talent_names: List[str] = None):
+async def export_talents_csv(
+    talent_names: Optional[List[str]] = Query(None, description="Talent names to export (all if not specified)"),
+    columns: Optional[str] = Query(None, description="Comma-separated columns to include (all if not specified)"),
+    gzip: bool = Query(False, description="Compress the CSV (talents_export.csv.gz)"),
+):
     """
     Export talents to CSV file.
 
+    Rows are streamed as they are read from the talent catalog, so the
+    download starts immediately and the file is never built in memory.
+
     Args:
         talent_names: Optional list of talent names to export (all if not specified)
+        columns: Optional comma-separated list of columns (e.g., "name,nationality,speed")
+        gzip: Return a gzip-compressed file
 
     Returns:
         CSV file download
 
     Raises:
-        400: Invalid talent names
+        400: Invalid talent names or columns
     """
-    try:
-        import_service = get_import_service()
-
-        # Create temp file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False, newline='', encoding='utf-8') as temp_file:
-            temp_path = temp_file.name
-
-        # Export to temp file
-        if talent_names:
-            import_service.export_to_csv(temp_path, talent_names=talent_names)
-        else:
-            import_service.export_to_csv(temp_path)
-
-        # Read file content
-        with open(temp_path, 'rb') as f:
-            content = f.read()
-
-        # Clean up
-        Path(temp_path).unlink()
-
-        # Return as download
-        return StreamingResponse(
-            io.BytesIO(content),
-            media_type='text/csv',
-            headers={'Content-Disposition': 'attachment; filename=talents_export.csv'}
-        )
+    import_service = get_import_service()
 
+    try:
+        selected_columns = ImportService.validate_export_columns(columns.split(',') if columns else None)
+        talents = import_service.select_talents(talent_names or None)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Export failed: {str(e)}"
+
+    chunks = (chunk.encode('utf-8') for chunk in ImportService.iter_csv(talents, selected_columns))
+
+    if gzip:
+        return StreamingResponse(
+            _gzip_chunks(chunks),
+            media_type='application/gzip',
+            headers={'Content-Disposition': 'attachment; filename=talents_export.csv.gz'}
         )
 
+    return StreamingResponse(
+        chunks,
+        media_type='text/csv',
+        headers={'Content-Disposition': 'attachment; filename=talents_export.csv'}
+    )
+
+
+def _gzip_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Compress a stream of bytes into gzip format, chunk by chunk."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits=31: gzip header
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
 
 @router.get("/template/talents")
 async def get_talents_template():
@@ -1,7 +1,8 @@
 """API routes for talents management."""
 
-from fastapi import APIRouter, HTTPException, status
-from typing import List, Dict, Any
+from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
+from typing import List, Dict, Any, Optional
 from dataclasses import asdict
 
 from ..schemas.talent import (
@@ -11,11 +12,18 @@ from ..schemas.talent import (
     TalentListItemSchema,
     TalentPersonalInfoSchema,
     TalentStatsSchema,
+    TalentGenerateSchema,
+    TalentGenerateResultSchema,
+    TalentGenerateItemSchema,
+    TalentStatsOverviewSchema,
 )
+from ..fast_json import FastJSONResponse
+from ..response_cache import cached_response, catalog_state, invalidates_response_cache
 from ...services.talent_service import TalentService
+from ...services.talent_stats_store import DEFAULT_PERCENTILES, STAT_FIELDS
 from ...models.talent import Talent, TalentPersonalInfo, TalentStats
 from ...utils.config import get_config
-from ...utils.talent_randomizer import TalentRandomizer
+from ...utils.talent_randomizer import RACING_STAT_FIELDS, TalentRandomizer, make_rng
 
 router = APIRouter()
 
@@ -31,7 +39,23 @@ def get_talent_service() -> TalentService:
     return TalentService(config.get_rfactor_path())
 
 
+def _talent_to_list_item(talent) -> dict:
+    """Convert Talent model to a list item (fields of TalentListItemSchema)."""
+    return {
+        "name": talent.name,
+        "nationality": talent.personal_info.nationality,
+        "speed": float(talent.stats.speed),
+        "crash": float(talent.stats.crash),
+        "aggression": float(talent.stats.aggression),
+    }
+
+
+# Cached responses are keyed on the talent catalog generation
+_talents_state = catalog_state(lambda: get_talent_service().get_catalog())
+
+
 @router.get("/", response_model=List[TalentListItemSchema])
+@cached_response("talents", _talents_state)
 async def list_talents():
     """
     List all talents.
@@ -41,16 +65,77 @@ async def list_talents():
     service = get_talent_service()
     talents = service.list_all_talents()
 
-    return [
-        TalentListItemSchema(
-            name=talent.name,
-            nationality=talent.personal_info.nationality,
-            speed=talent.stats.speed,
-            crash=talent.stats.crash,
-            aggression=talent.stats.aggression
+    return FastJSONResponse([_talent_to_list_item(talent) for talent in talents])
+
+
+@router.get("/stats", response_model=TalentStatsOverviewSchema)
+async def get_talents_stats(
+    fields: Optional[str] = None,
+    bins: int = Query(10, ge=1, le=100),
+    percentiles: Optional[str] = None,
+    nationality: Optional[str] = None,
+    by_nationality: bool = True,
+):
+    """
+    Aggregated stats over all talents (distribution overviews, dashboards).
+
+    Computed from a columnar store shared until the talents change, so
+    large pools are summarized without re-reading every talent.
+
+    Args:
+        fields: Comma-separated stats to summarize (default: all racing stats)
+        bins: Number of histogram bins per stat
+        percentiles: Comma-separated percentiles, 0-100 (default: 10,25,50,75,90)
+        nationality: Only include talents of this nationality
+        by_nationality: Include per-nationality means of the selected stats
+
+    Returns:
+        Count, per-stat summary (mean, std, min, max, percentiles, histogram)
+        and per-nationality means
+
+    Raises:
+        400: Unknown stat or invalid percentile
+    """
+    selected = _parse_list(fields) or list(RACING_STAT_FIELDS)
+    unknown = [f for f in selected if f not in STAT_FIELDS]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown stats: {', '.join(unknown)}. Available: {', '.join(STAT_FIELDS)}"
+        )
+
+    try:
+        quantiles = [float(p) for p in _parse_list(percentiles)] if percentiles else list(DEFAULT_PERCENTILES)
+    except ValueError:
+        quantiles = None
+    if quantiles is None or any(not 0 <= q <= 100 for q in quantiles):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Percentiles must be numbers between 0 and 100"
         )
-        for talent in talents
-    ]
+
+    service = get_talent_service()
+    store = service.get_stats_store().select(nationality=nationality)
+
+    summaries = {}
+    for field_name in selected:
+        summary = store.summary(field_name, quantiles)
+        summary["histogram"] = store.histogram(field_name, bins=bins)
+        summaries[field_name] = summary
+
+    return {
+        "count": len(store),
+        "nationality": nationality,
+        "fields": summaries,
+        "by_nationality": store.by_nationality(selected) if by_nationality else [],
+    }
+
+
+def _parse_list(value: Optional[str]) -> List[str]:
+    """Split a comma-separated query parameter."""
+    if not value:
+        return []
+    return [item.strip() for item in value.split(",") if item.strip()]
 
 
 @router.get("/{name}", response_model=TalentResponseSchema)
@@ -86,6 +171,7 @@ async def get_talent(name: str):
 
 
 @router.post("/", response_model=TalentResponseSchema, status_code=status.HTTP_201_CREATED)
+@invalidates_response_cache("talents")
 async def create_talent(talent_data: TalentCreateSchema):
     """
     Create a new talent.
@@ -141,7 +227,64 @@ async def create_talent(talent_data: TalentCreateSchema):
         )
 
 
+@router.post("/generate", response_model=TalentGenerateResultSchema, status_code=status.HTTP_201_CREATED)
+@invalidates_response_cache("talents")
+async def generate_talents(request: TalentGenerateSchema):
+    """
+    Generate many random talents at once.
+
+    Stats are generated in bulk by TalentRandomizer and the .rcd files are
+    written in parallel. Names are checked against the Talent directory in
+    a single pass: listed names that already exist are skipped, pattern
+    numbers that are taken are passed over.
+
+    Args:
+        request: Count, names or name pattern, nationality mix and seed
+
+    Returns:
+        Summary of created, skipped and failed talents
+
+    Raises:
+        400: Invalid parameters
+    """
+    service = get_talent_service()
+
+    try:
+        result, skipped = await run_in_threadpool(
+            service.generate_many,
+            count=request.count,
+            names=request.names,
+            name_pattern=request.name_pattern,
+            nationality_mix=request.nationality_mix,
+            seed=request.seed,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to generate talents: {str(e)}"
+        )
+
+    return TalentGenerateResultSchema(
+        requested=request.count if request.count is not None else len(request.names or []),
+        created_count=result.success_count,
+        skipped_count=len(skipped),
+        error_count=result.error_count,
+        created=[r.item for r in result.results if r.success],
+        skipped=skipped,
+        errors=[
+            TalentGenerateItemSchema(name=r.item, message=r.message)
+            for r in result.results if not r.success
+        ],
+    )
+
+
 @router.put("/{name}", response_model=TalentResponseSchema)
+@invalidates_response_cache("talents")
 async def update_talent(name: str, talent_data: TalentUpdateSchema):
     """
     Update an existing talent.
@@ -201,6 +344,7 @@ async def update_talent(name: str, talent_data: TalentUpdateSchema):
 
 
 @router.delete("/{name}", status_code=status.HTTP_204_NO_CONTENT)
+@invalidates_response_cache("talents")
 async def delete_talent(name: str):
     """
     Delete a talent.
@@ -283,23 +427,17 @@ async def search_talents(
 
         matching_talents.append(talent)
 
-    return [
-        TalentListItemSchema(
-            name=talent.name,
-            nationality=talent.personal_info.nationality,
-            speed=talent.stats.speed,
-            crash=talent.stats.crash,
-            aggression=talent.stats.aggression
-        )
-        for talent in matching_talents
-    ]
+    return FastJSONResponse([_talent_to_list_item(talent) for talent in matching_talents])
 
 
 @router.get("/random-stats/", response_model=Dict[str, Any])
-async def get_random_stats():
+async def get_random_stats(seed: Optional[int] = None):
     """
     Generate random RACING statistics only (for UI randomizer).
 
+    Args:
+        seed: Optional random seed; the same seed always returns the same stats
+
     Returns:
         Dictionary with ONLY racing stats (9 performance stats)
 
@@ -310,10 +448,11 @@ async def get_random_stats():
     Does NOT generate personal info (name, nationality, date, career stats).
     Those fields should be preserved when using the "Régénérer" button.
     """
-    return {"stats": TalentRandomizer.random_racing_stats()}
+    return {"stats": TalentRandomizer.random_racing_stats(rng=make_rng(seed))}
 
 
 @router.get("/nationalities/", response_model=List[str])
+@cached_response("talents", _talents_state)
 async def get_nationalities(from_existing: bool = False):
     """
     Get list of available nationalities.
@@ -3,12 +3,16 @@
 from fastapi import APIRouter, HTTPException, Query, status
 from typing import List, Optional
 
-from ..schemas.track import TrackListItemSchema, TrackResponseSchema
+from ..schemas.track import TrackListItemSchema, TrackResponseSchema, TrackVenueSchema
+from ..response_cache import cached_response, catalog_state
 from ...services.track_service import TrackService
 
 
 router = APIRouter()
 
+# Cached responses are keyed on the track catalog generation
+_tracks_state = catalog_state(lambda: TrackService().get_catalog())
+
 
 def _track_to_list_item(track) -> TrackListItemSchema:
     return TrackListItemSchema(
@@ -34,6 +38,7 @@ def _track_to_response(track) -> TrackResponseSchema:
 
 
 @router.get("/", response_model=List[TrackListItemSchema])
+@cached_response("tracks", _tracks_state)
 async def list_tracks(
     search: Optional[str] = Query(None, description="Search query"),
     search_track_name: bool = Query(True, description="Search in track name"),
@@ -73,6 +78,32 @@ async def list_tracks(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
 
+@router.get("/venues", response_model=List[TrackVenueSchema])
+@cached_response("tracks", _tracks_state)
+async def list_venues(
+    venue: Optional[str] = Query(None, description="Only return this venue"),
+    reload: bool = Query(False, description="Force reload from disk"),
+):
+    """
+    List venues with their available layouts.
+
+    Query parameters:
+    - venue: Only return this venue (case-insensitive)
+    - reload: Force reload from disk (default: false, uses cache)
+    """
+    service = TrackService()
+    try:
+        venues = service.list_venues(force_reload=reload)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    if venue:
+        venues = [v for v in venues if v["venue_name"].lower() == venue.strip().lower()]
+    return [TrackVenueSchema(**v) for v in venues]
+
+
 @router.get("/{path:path}", response_model=TrackResponseSchema)
 async def get_track(path: str):
     service = TrackService()
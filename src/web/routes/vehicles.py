@@ -14,10 +14,15 @@ from ..schemas.vehicle import (
     VehicleManufacturerSchema,
     VehicleUpdateSchema,
 )
+from ..fast_json import FastJSONResponse
+from ..response_cache import cached_response, catalog_state, invalidates_response_cache
 from ...services.vehicle_service import VehicleService
 
 router = APIRouter()
 
+# Cached responses are keyed on the vehicle catalog generation
+_vehicles_state = catalog_state(lambda: VehicleService().get_catalog())
+
 
 def _vehicle_to_response(vehicle) -> VehicleResponseSchema:
     """Convert Vehicle model to response schema."""
@@ -38,21 +43,22 @@ def _vehicle_to_response(vehicle) -> VehicleResponseSchema:
     )
 
 
-def _vehicle_to_list_item(vehicle) -> VehicleListItemSchema:
-    """Convert Vehicle model to list item schema."""
-    return VehicleListItemSchema(
-        file_name=vehicle.file_name,
-        relative_path=vehicle.relative_path,
-        display_name=vehicle.display_name,
-        number=vehicle.number,
-        driver=vehicle.team_info.driver,
-        team=vehicle.team_info.team,
-        manufacturer=vehicle.manufacturer,
-        classes=vehicle.classes,
-    )
+def _vehicle_to_list_item(vehicle) -> dict:
+    """Convert Vehicle model to a list item (fields of VehicleListItemSchema)."""
+    return {
+        "file_name": vehicle.file_name,
+        "relative_path": vehicle.relative_path,
+        "display_name": vehicle.display_name,
+        "number": vehicle.number,
+        "driver": vehicle.team_info.driver,
+        "team": vehicle.team_info.team,
+        "manufacturer": vehicle.manufacturer,
+        "classes": vehicle.classes,
+    }
 
 
 @router.get("/", response_model=List[VehicleListItemSchema])
+@cached_response("vehicles", _vehicles_state)
 async def list_vehicles(
     vehicle_class: Optional[str] = Query(None, description="Filter by vehicle class"),
     manufacturer: Optional[str] = Query(None, description="Filter by manufacturer"),
@@ -93,8 +99,8 @@ async def list_vehicles(
         else:
             vehicles = service.list_all(force_reload=reload)
 
-        # Convert to list items
-        return [_vehicle_to_list_item(v) for v in vehicles]
+        # Convert to list items (serialized directly, without per-item validation)
+        return FastJSONResponse([_vehicle_to_list_item(v) for v in vehicles])
     except ValueError as e:
         # Configuration problem
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -104,6 +110,7 @@ async def list_vehicles(
 
 
 @router.get("/classes", response_model=List[VehicleClassSchema])
+@cached_response("vehicles", _vehicles_state)
 async def list_classes(reload: bool = Query(False, description="Force reload from disk")):
     """
     Get all vehicle classes with counts.
@@ -135,6 +142,7 @@ async def list_classes(reload: bool = Query(False, description="Force reload fro
 
 
 @router.get("/manufacturers", response_model=List[VehicleManufacturerSchema])
+@cached_response("vehicles", _vehicles_state)
 async def list_manufacturers(reload: bool = Query(False, description="Force reload from disk")):
     """
     Get all manufacturers with counts.
@@ -166,6 +174,7 @@ async def list_manufacturers(reload: bool = Query(False, description="Force relo
 
 
 @router.get("/stats")
+@cached_response("vehicles", _vehicles_state)
 async def get_vehicle_stats(reload: bool = Query(False, description="Force reload from disk")):
     """
     Get vehicle statistics.
@@ -218,6 +227,7 @@ async def get_vehicle(file_name: str):
 
 
 @router.post("/reload")
+@invalidates_response_cache("vehicles")
 async def reload_vehicles():
     """
     Force reload all vehicles from disk (clear cache).
@@ -235,6 +245,7 @@ async def reload_vehicles():
 
 
 @router.put("/{file_name:path}", response_model=VehicleResponseSchema)
+@invalidates_response_cache("vehicles")
 async def update_vehicle(file_name: str, update_data: VehicleUpdateSchema):
     """
     Update a vehicle.
@@ -122,3 +122,69 @@ class ChampionshipDetailSchema(BaseModel):
                 "current_race": 3
             }
         }
+
+
+class ChampionshipDuplicateItemSchema(BaseModel):
+    """Schema for one duplicate operation in a batch."""
+
+    name: str = Field(..., min_length=1, max_length=200)
+    new_name: str = Field(..., min_length=1, max_length=200)
+
+
+class ChampionshipBatchDuplicateSchema(BaseModel):
+    """Schema for duplicating several championships at once."""
+
+    items: List[ChampionshipDuplicateItemSchema] = Field(..., min_length=1)
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "items": [
+                    {"name": "MyChampionship", "new_name": "MyChampionship2"},
+                    {"name": "GTSeason", "new_name": "GTSeasonCopy"}
+                ]
+            }
+        }
+
+
+class ChampionshipBatchNamesSchema(BaseModel):
+    """Schema for batch operations on a list of championships."""
+
+    names: List[str] = Field(..., min_length=1)
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "names": ["MyChampionship", "GTSeason"]
+            }
+        }
+
+
+class BatchItemResultSchema(BaseModel):
+    """Schema for the result of one item in a batch operation."""
+
+    name: str
+    success: bool
+    message: str = ""
+
+
+class BatchResultSchema(BaseModel):
+    """Schema for the result of a batch operation."""
+
+    success_count: int
+    error_count: int
+    total: int
+    results: List[BatchItemResultSchema]
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "success_count": 1,
+                "error_count": 1,
+                "total": 2,
+                "results": [
+                    {"name": "MyChampionship2", "success": True, "message": ""},
+                    {"name": "GTSeasonCopy", "success": False, "message": "Championship not found: GTSeason.cch"}
+                ]
+            }
+        }
@@ -1,7 +1,7 @@
 """Pydantic schemas for Talent API."""
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Optional
+from typing import Dict, List, Optional
 
 
 class TalentPersonalInfoSchema(BaseModel):
@@ -164,3 +164,78 @@ class TalentListItemSchema(BaseModel):
                 "aggression": 75.0
             }
         }
+
+
+class TalentGenerateSchema(BaseModel):
+    """Schema for bulk generation of random talents."""
+
+    count: Optional[int] = Field(default=None, ge=1, le=10000, description="Number of talents (default: number of names)")
+    names: Optional[List[str]] = Field(default=None, max_length=10000, description="Explicit driver names")
+    name_pattern: str = Field(default="AI Driver {n}", min_length=3, max_length=200, description="Used when no names are given; {n} is a number")
+    nationality_mix: Optional[Dict[str, float]] = Field(default=None, description="Nationality -> weight")
+    seed: Optional[int] = Field(default=None, description="Random seed for reproducible results")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "count": 40,
+                "name_pattern": "AI Driver {n}",
+                "nationality_mix": {"French": 3, "German": 2, "Italian": 1},
+                "seed": 2024
+            }
+        }
+
+
+class TalentGenerateItemSchema(BaseModel):
+    """Schema for a talent that could not be generated."""
+
+    name: str
+    message: str
+
+
+class TalentGenerateResultSchema(BaseModel):
+    """Schema for the summary of a bulk generation."""
+
+    requested: int
+    created_count: int
+    skipped_count: int
+    error_count: int
+    created: List[str]
+    skipped: List[str]
+    errors: List[TalentGenerateItemSchema]
+
+
+class TalentHistogramSchema(BaseModel):
+    """Schema for the histogram of a stat."""
+
+    edges: List[float]
+    counts: List[int]
+
+
+class TalentStatSummarySchema(BaseModel):
+    """Schema for the distribution of one stat across talents."""
+
+    count: int
+    mean: Optional[float] = None
+    std: Optional[float] = None
+    min: Optional[float] = None
+    max: Optional[float] = None
+    percentiles: Dict[str, Optional[float]]
+    histogram: TalentHistogramSchema
+
+
+class TalentNationalityStatsSchema(BaseModel):
+    """Schema for the mean stats of one nationality."""
+
+    nationality: str
+    count: int
+    means: Dict[str, float]
+
+
+class TalentStatsOverviewSchema(BaseModel):
+    """Schema for aggregated stats over the talent pool."""
+
+    count: int
+    nationality: Optional[str] = None
+    fields: Dict[str, TalentStatSummarySchema]
+    by_nationality: List[TalentNationalityStatsSchema]
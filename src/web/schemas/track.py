@@ -22,3 +22,9 @@ class TrackResponseSchema(BaseModel):
     relative_path: str = Field(description="Path relative to GameData/Locations")
     display_name: str = Field(description="Display-friendly track name")
     gdb_info: dict[str, str] | None = Field(default=None, description="All key=value pairs parsed from GDB")
+
+
+class TrackVenueSchema(BaseModel):
+    venue_name: str = Field(description="Venue/Location")
+    layouts: list[str] = Field(description="Layouts available at this venue")
+    track_count: int = Field(ge=0, description="Number of .gdb files for this venue")
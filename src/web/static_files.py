@@ -0,0 +1,134 @@
+"""
+Static files with precompressed variants and cache headers.
+
+scripts/precompress_assets.py writes .br and .gz files next to the frontend
+build files (e.g., assets/index-3f2a1b.js.br). CachedStaticFiles serves
+them, with the Content-Encoding and type of the original file, to clients
+accepting the encoding, so the assets are compressed once at build time
+rather than on every request. Files without a precompressed variant are
+compressed on the fly by the GZip middleware.
+"""
+
+import mimetypes
+import os
+import stat
+from typing import Optional
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+# Cache-Control of the Vite build assets, whose names contain a content hash:
+# a changed file gets a new URL, so browsers never need to revalidate
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Cache-Control of files with stable names: reused, but revalidated
+# with their ETag (a 304 response when unchanged)
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+# Precompressed variants, in order of preference: (encoding, file suffix)
+PRECOMPRESSED_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+def accepted_encodings(scope: Scope) -> set:
+    """
+    Get the content encodings accepted by the client.
+
+    Args:
+        scope: ASGI scope of the request
+
+    Returns:
+        Encodings of the Accept-Encoding header, without those refused with q=0
+    """
+    encodings = set()
+    for item in Headers(scope=scope).get("accept-encoding", "").split(","):
+        name, *params = item.split(";")
+        quality = 1.0
+        for param in params:
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if name.strip() and quality > 0:
+            encodings.add(name.strip().lower())
+    return encodings
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles serving precompressed variants, with a Cache-Control header."""
+
+    def __init__(self, *args, cache_control: str = REVALIDATE_CACHE_CONTROL, **kwargs):
+        """
+        Initialize the static files app.
+
+        Args:
+            *args: Arguments of StaticFiles (e.g., directory)
+            cache_control: Cache-Control header of the served files
+            **kwargs: Keyword arguments of StaticFiles
+        """
+        super().__init__(*args, **kwargs)
+        self.cache_control = cache_control
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        response = await self._precompressed_response(path, scope)
+        if response is None:
+            response = await super().get_response(path, scope)
+
+        if response.status_code in (200, 304):
+            response.headers["Cache-Control"] = self.cache_control
+            # The body depends on Accept-Encoding (precompressed or GZip)
+            response.headers.add_vary_header("Accept-Encoding")
+        return response
+
+    async def _precompressed_response(self, path: str, scope: Scope) -> Optional[Response]:
+        """
+        Get the response of a precompressed variant of a file, if any.
+
+        Args:
+            path: Path of the requested file
+            scope: ASGI scope of the request
+
+        Returns:
+            Response serving the variant, or None to serve the file itself
+        """
+        if scope["method"] not in ("GET", "HEAD"):
+            return None
+
+        encodings = accepted_encodings(scope)
+        if not encodings:
+            return None
+
+        full_path, stat_result = await anyio.to_thread.run_sync(self.lookup_path, path)
+        if not stat_result or not stat.S_ISREG(stat_result.st_mode):
+            return None
+
+        for encoding, suffix in PRECOMPRESSED_ENCODINGS:
+            if encoding not in encodings:
+                continue
+
+            variant_path, variant_stat = await anyio.to_thread.run_sync(self.lookup_path, path + suffix)
+            # A variant older than its file is left over from a previous build
+            if (
+                not variant_stat
+                or not stat.S_ISREG(variant_stat.st_mode)
+                or variant_stat.st_mtime < stat_result.st_mtime
+            ):
+                continue
+
+            media_type, _ = mimetypes.guess_type(os.path.basename(full_path))
+            response = FileResponse(
+                variant_path,
+                stat_result=variant_stat,
+                method=scope["method"],
+                media_type=media_type or "text/plain",
+                headers={"Content-Encoding": encoding},
+            )
+            if self.is_not_modified(response.headers, Headers(scope=scope)):
+                return NotModifiedResponse(response.headers)
+            return response
+
+        return None
@@ -0,0 +1,65 @@
+"""Tests for GDB Parser."""
+
+from src.parsers.gdb_parser import GdbParser
+
+
+GDB_CONTENT = """Toban
+{
+  Filter Properties = StockV8 SRGrandPrix
+  TrackName = "Toban Long"   // displayed name
+  VenueName = Toban
+  Layout = Long
+  Location = Toban, Japan
+  Length = 4.6 km
+}
+"""
+
+
+class TestGdbParser:
+    """Test suite for GdbParser."""
+
+    def test_parse_content_full(self):
+        """Test that a full parse keeps every key in gdb_info."""
+        track = GdbParser().parse_content(GDB_CONTENT, "Toban.gdb")
+
+        assert track.track_name == "Toban Long"
+        assert track.venue_name == "Toban"
+        assert track.layout == "Long"
+        assert track.gdb_info["Location"] == "Toban, Japan"
+
+    def test_parse_header_matches_full_parse(self, tmp_path):
+        """Test that header-only mode reads the same listing fields."""
+        gdb = tmp_path / "Toban.gdb"
+        gdb.write_text(GDB_CONTENT)
+        parser = GdbParser()
+
+        full = parser.parse_file(gdb)
+        header = parser.parse_file(gdb, header_only=True)
+
+        assert (header.track_name, header.venue_name, header.layout) == (
+            full.track_name, full.venue_name, full.layout
+        )
+        assert header.file_name == "Toban.gdb"
+        assert header.gdb_info == {}
+
+    def test_parse_header_stops_early(self):
+        """Test that header-only mode stops once all fields are found."""
+        consumed = []
+
+        def lines():
+            for line in GDB_CONTENT.splitlines():
+                consumed.append(line)
+                yield line
+
+        GdbParser().parse_header(lines())
+
+        assert consumed[-1].strip() == "Layout = Long"
+
+    def test_parse_header_line_limit(self):
+        """Test that header-only mode gives up after HEADER_MAX_LINES."""
+        parser = GdbParser()
+        filler = ["Setting = 1"] * parser.HEADER_MAX_LINES
+        track = parser.parse_header(["TrackName = A"] + filler + ["VenueName = Late"])
+
+        assert track.track_name == "A"
+        assert track.venue_name == ""
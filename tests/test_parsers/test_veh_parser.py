@@ -0,0 +1,42 @@
+"""Tests for VEH Parser."""
+
+from src.parsers.veh_parser import VehParser
+
+
+def _veh_content(number: int) -> str:
+    return (
+        f'Number={number}\n'
+        f'Team="Team {number}"\n'
+        'Manufacturer="Ferrari"\n'
+        'Classes="F1_1976 SRGP"\n'
+        'HDVehicle="F1_1976.hdv"\n'
+    )
+
+
+class TestVehParser:
+    """Test suite for VehParser."""
+
+    def test_repeated_values_are_shared(self, tmp_path):
+        """Test that values repeated across vehicles are stored once."""
+        mod_dir = tmp_path / "GameData" / "Vehicles" / "F1_1976"
+        (mod_dir / "Team1").mkdir(parents=True)
+        (mod_dir / "F1_1976.hdv").write_text("")
+        parser = VehParser()
+
+        first = parser.parse_content(_veh_content(1), str(mod_dir / "Team1" / "Car1.veh"))
+        second = parser.parse_content(_veh_content(2), str(mod_dir / "Team1" / "Car2.veh"))
+
+        assert first.manufacturer == "Ferrari"
+        assert first.manufacturer is second.manufacturer
+        assert first.classes is second.classes
+        assert first.config.hdvehicle_exists
+        assert first.config.hdvehicle_resolved is second.config.hdvehicle_resolved
+
+    def test_vehicles_have_no_instance_dict(self):
+        """Test that parsed vehicles use slots instead of a per-instance __dict__."""
+        vehicle = VehParser().parse_content(_veh_content(7))
+
+        assert vehicle.number == 7
+        assert not hasattr(vehicle, "__dict__")
+        assert not hasattr(vehicle.config, "__dict__")
+        assert not hasattr(vehicle.team_info, "__dict__")
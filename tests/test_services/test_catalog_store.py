@@ -0,0 +1,201 @@
+"""Tests for the shared catalog store of the multi-worker server mode."""
+
+import pytest
+
+import src.services.catalog_store as catalog_store
+from src.services.catalog_coordinator import CatalogCoordinator
+from src.services.catalog_store import COORDINATOR, WORKER, CatalogStore
+from src.services.track_catalog import TrackCatalog
+
+
+GDB_TEMPLATE = """{name}
+{{
+  TrackName = {track}
+  VenueName = {venue}
+  Layout = {layout}
+}}
+"""
+
+
+def _write_gdb(path, track, venue, layout):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(GDB_TEMPLATE.format(name=path.stem, track=track, venue=venue, layout=layout))
+
+
+class TestCatalogStore:
+    """Test suite for CatalogStore."""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        return CatalogStore(tmp_path / "catalogs.sqlite")
+
+    def test_publish_and_read_changes(self, store):
+        """Test that readers get only the items changed since their generation."""
+        assert store.generation("talents", "/root") is None
+
+        generation = store.publish("talents", "/root", [
+            ("a.rcd", (1, 10), {"name": "A"}),
+            ("b.rcd", (1, 20), {"name": "B"}),
+        ], [], replace=True)
+        assert generation == 1
+
+        generation, changes, present = store.read_changes("talents", "/root", 0)
+        assert generation == 1
+        assert sorted(rel for rel, _, _ in changes) == ["a.rcd", "b.rcd"]
+        assert present == {"a.rcd", "b.rcd"}
+
+        store.publish("talents", "/root", [("c.rcd", (2, 30), {"name": "C"})], ["a.rcd"])
+        generation, changes, present = store.read_changes("talents", "/root", 1)
+        assert generation == 2
+        assert changes == [("c.rcd", (2, 30), {"name": "C"})]
+        assert present == {"b.rcd", "c.rcd"}
+
+        # Other catalogs are independent
+        assert store.generation("talents", "/other") is None
+
+    def test_replace_discards_previous_items(self, store):
+        """Test that a replacing publication keeps only its items."""
+        store.publish("talents", "/root", [("a.rcd", (1, 10), {})], [], replace=True)
+        store.publish("talents", "/root", [("b.rcd", (1, 10), {})], [], replace=True)
+
+        generation, _, present = store.read_changes("talents", "/root", 0)
+        assert generation == 2
+        assert present == {"b.rcd"}
+
+    def test_refresh_requests(self, store):
+        """Test the refresh request queue between workers and coordinator."""
+        first = store.request_refresh("locations", "/root")
+        second = store.request_refresh("locations", "/root", "Toban/Toban.gdb", invalidate=True)
+
+        assert store.pending_requests() == [
+            (first, "locations", "/root", None, False),
+            (second, "locations", "/root", "Toban/Toban.gdb", True),
+        ]
+        assert not store.wait_for_requests("locations", "/root", second, timeout=0)
+
+        store.complete_requests([first, second])
+        assert store.pending_requests() == []
+        assert store.wait_for_requests("locations", "/root", second, timeout=0)
+
+
+class TestWorkerCatalog:
+    """Test suite for catalogs read from the store by worker processes."""
+
+    @pytest.fixture
+    def locations(self, tmp_path):
+        locations = tmp_path / "GameData" / "Locations"
+        _write_gdb(locations / "Toban" / "Toban_Long.gdb", "Toban Long", "Toban", "Long")
+        _write_gdb(locations / "Joesville" / "Joesville.gdb", "Joesville Speedway", "Joesville", "Oval")
+        return locations
+
+    @pytest.fixture
+    def store(self, tmp_path, monkeypatch):
+        """Shared store, with the coordinator processing requests in-line."""
+        import src.services.track_catalog as track_catalog
+
+        store = CatalogStore(tmp_path / "catalogs.sqlite")
+        monkeypatch.setattr(catalog_store, "_store_instance", store)
+        monkeypatch.setattr(catalog_store, "_role", WORKER)
+        monkeypatch.setattr(track_catalog, "_catalogs", {})
+
+        coordinator = CatalogCoordinator()
+        wait_for_requests = store.wait_for_requests
+
+        def process_then_wait(kind, root, up_to, timeout):
+            # Both roles live in this process: switch while the coordinator runs
+            catalog_store._role = COORDINATOR
+            try:
+                coordinator.process_requests()
+            finally:
+                catalog_store._role = WORKER
+            return wait_for_requests(kind, root, up_to, timeout)
+
+        monkeypatch.setattr(store, "wait_for_requests", process_then_wait)
+        return store
+
+    def test_worker_reads_coordinator_scan(self, locations, store):
+        """Test that a worker gets its items from the coordinator's scan."""
+        worker = TrackCatalog(locations)
+
+        tracks = worker.items()
+
+        assert [t.relative_path for t in tracks] == ["Joesville/Joesville.gdb", "Toban/Toban_Long.gdb"]
+        assert worker.generation == store.generation("locations", str(locations))
+        assert worker.progress()["to_parse"] == 0
+        assert len(worker.by_venue("toban")) == 1
+        assert not worker.is_stale()
+
+    def test_worker_force_reload(self, locations, store):
+        """Test that a forced reload rescans in the coordinator."""
+        worker = TrackCatalog(locations)
+        worker.items()
+        generation = worker.generation
+
+        (locations / "Joesville" / "Joesville.gdb").unlink()
+        _write_gdb(locations / "Nowhere" / "Nowhere.gdb", "Nowhere", "Nowhere", "Full")
+        tracks = worker.items(force_reload=True)
+
+        assert [t.relative_path for t in tracks] == ["Nowhere/Nowhere.gdb", "Toban/Toban_Long.gdb"]
+        assert worker.generation > generation
+        assert worker.get("Joesville/Joesville.gdb") is None
+
+    def test_worker_invalidate(self, locations, store):
+        """Test that an invalidation is re-parsed by the coordinator before the next read."""
+        worker = TrackCatalog(locations)
+        worker.items()
+
+        _write_gdb(locations / "Toban" / "Toban_Long.gdb", "Toban Long", "Toban Park", "Long")
+        worker.invalidate("Toban/Toban_Long.gdb")
+        assert store.pending_requests()
+
+        assert worker.get("Toban/Toban_Long.gdb").venue_name == "Toban Park"
+        assert store.pending_requests() == []
+
+    def test_other_worker_sees_changes(self, locations, store):
+        """Test that a worker notices a generation published for another worker."""
+        first = TrackCatalog(locations)
+        second = TrackCatalog(locations)
+        first.items()
+        second.items()
+
+        _write_gdb(locations / "Nowhere" / "Nowhere.gdb", "Nowhere", "Nowhere", "Full")
+        first.refresh()
+
+        assert second.is_stale()
+        assert second.get("Nowhere/Nowhere.gdb") is not None
+        assert not second.is_stale()
+
+
+class TestCoordinatorCatalog:
+    """Test suite for catalogs published by the coordinator."""
+
+    def test_failed_publish_is_retried_in_full(self, tmp_path, monkeypatch):
+        """Test that the changes of a failed publication reach the store later."""
+        locations = tmp_path / "GameData" / "Locations"
+        _write_gdb(locations / "Toban" / "Toban_Long.gdb", "Toban Long", "Toban", "Long")
+        store = CatalogStore(tmp_path / "catalogs.sqlite")
+        monkeypatch.setattr(catalog_store, "_store_instance", store)
+        monkeypatch.setattr(catalog_store, "_role", COORDINATOR)
+
+        catalog = TrackCatalog(locations)
+        catalog.items()
+        assert catalog.is_published
+
+        publish = store.publish
+
+        def failing_publish(*args, **kwargs):
+            raise RuntimeError("database is locked")
+
+        monkeypatch.setattr(store, "publish", failing_publish)
+        _write_gdb(locations / "Nowhere" / "Nowhere.gdb", "Nowhere", "Nowhere", "Full")
+        catalog.refresh()
+        assert not catalog.is_published
+
+        monkeypatch.setattr(store, "publish", publish)
+        coordinator = CatalogCoordinator()
+        coordinator._track(catalog)
+        assert coordinator.check() == 1
+
+        assert catalog.is_published
+        _, _, present = store.read_changes("locations", str(locations), 0)
+        assert present == {"Nowhere/Nowhere.gdb", "Toban/Toban_Long.gdb"}
@@ -0,0 +1,93 @@
+"""Tests for the vehicle catalog and the startup catalog warm-up."""
+
+import pytest
+
+from src.services import catalog_warmup
+from src.services.catalog_warmup import CatalogWarmup
+from src.services.track_catalog import TrackCatalog
+from src.services.vehicle_catalog import VehicleCatalog
+
+
+VEH_TEMPLATE = """Number={number}
+Team="{team}"
+Driver="Driver {number}"
+Classes="F1_1976"
+HDVehicle="F1_1976.hdv"
+"""
+
+
+class _Config:
+    """Minimal configuration object for the warm-up."""
+
+    def __init__(self, rfactor_path):
+        self.rfactor_path = rfactor_path
+
+    def get_rfactor_path(self):
+        return self.rfactor_path
+
+    def is_configured(self):
+        return self.rfactor_path is not None
+
+
+@pytest.fixture
+def installation(tmp_path):
+    """Create an installation with two vehicles and one track."""
+    vehicles = tmp_path / "GameData" / "Vehicles" / "F1_1976"
+    (vehicles / "Team1").mkdir(parents=True)
+    (vehicles / "F1_1976.hdv").write_text("")
+    for number in (1, 2):
+        (vehicles / "Team1" / f"Car{number}.veh").write_text(VEH_TEMPLATE.format(number=number, team="Team1"))
+
+    locations = tmp_path / "GameData" / "Locations" / "Toban"
+    locations.mkdir(parents=True)
+    (locations / "Toban.gdb").write_text("Toban\n{\n  TrackName = Toban\n  VenueName = Toban\n}\n")
+    return tmp_path
+
+
+class TestVehicleCatalog:
+    """Test suite for VehicleCatalog."""
+
+    def test_index_is_reused(self, installation, tmp_path, monkeypatch):
+        """Test that vehicles rebuilt from the index match the parsed ones."""
+        vehicles_dir = installation / "GameData" / "Vehicles"
+        index_path = tmp_path / "cache" / "vehicles_index.json"
+        parsed = VehicleCatalog(vehicles_dir, index_path).items()
+
+        catalog = VehicleCatalog(vehicles_dir, index_path)
+        monkeypatch.setattr(catalog, "parse", lambda *args: pytest.fail("unchanged file re-parsed"))
+        loaded = catalog.items()
+
+        assert loaded == parsed
+        assert loaded[0].config.hdvehicle_exists
+        assert catalog.counts_by_top_level() == {"F1_1976": 2}
+
+
+class TestCatalogWarmup:
+    """Test suite for CatalogWarmup."""
+
+    def test_warmup_loads_catalogs(self, installation, monkeypatch):
+        """Test that all catalogs are loaded and reported as ready."""
+        monkeypatch.setattr(catalog_warmup, "get_config", lambda: _Config(str(installation)))
+        monkeypatch.setattr(catalog_warmup, "CATALOGS", [
+            ("vehicles", lambda root: VehicleCatalog(root / "GameData" / "Vehicles")),
+            ("tracks", lambda root: TrackCatalog(root / "GameData" / "Locations")),
+        ])
+        warmup = CatalogWarmup()
+
+        assert warmup.start()
+        assert warmup.wait(timeout=10)
+
+        progress = warmup.progress()
+        assert progress["ready"]
+        assert progress["catalogs"]["vehicles"]["status"] == "ready"
+        assert progress["catalogs"]["vehicles"]["items"] == 2
+        assert progress["catalogs"]["tracks"]["items"] == 1
+
+    def test_unconfigured_is_ready(self, monkeypatch):
+        """Test that an unconfigured app is ready immediately."""
+        monkeypatch.setattr(catalog_warmup, "get_config", lambda: _Config(None))
+        warmup = CatalogWarmup()
+
+        assert not warmup.start()
+        assert warmup.is_ready
+        assert warmup.progress()["catalogs"] == {}
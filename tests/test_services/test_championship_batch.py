@@ -0,0 +1,85 @@
+"""Tests for batch operations on championships."""
+
+import io
+import shutil
+import zipfile
+import pytest
+from pathlib import Path
+
+from src.services.championship_service import ChampionshipService
+from src.services.batch_executor import BatchExecutor
+
+
+FIXTURE_CCH = Path(__file__).parent.parent / "fixtures" / "SRGrandPrix05.cch"
+
+
+class TestChampionshipBatch:
+    """Test suite for ChampionshipService batch operations."""
+
+    @pytest.fixture
+    def service(self, tmp_path):
+        """Create a ChampionshipService with two championships."""
+        player_dir = tmp_path / "UserData" / "Player"
+        player_dir.mkdir(parents=True)
+        shutil.copy(FIXTURE_CCH, player_dir / "ChampA.cch")
+        shutil.copy(FIXTURE_CCH, player_dir / "ChampB.cch")
+        return ChampionshipService(str(tmp_path), "Player", validate=False)
+
+    def test_batch_executor_keeps_order_and_isolates_errors(self):
+        """Test that results keep input order and one failure doesn't stop the batch."""
+        def _work(n):
+            if n == 3:
+                raise ValueError("bad item")
+            return n * 2
+
+        result = BatchExecutor(max_workers=4).run(_work, [1, 2, 3, 4])
+
+        assert [r.item for r in result.results] == ["1", "2", "3", "4"]
+        assert [r.data for r in result.results if r.success] == [2, 4, 8]
+        assert result.success_count == 3
+        assert result.error_count == 1
+        assert result.results[2].message == "bad item"
+
+    def test_duplicate_many(self, service):
+        """Test duplicating several championships at once."""
+        result = service.duplicate_many([
+            ("ChampA", "ChampA2"),
+            ("ChampB", "ChampB2"),
+            ("Missing", "Missing2"),
+        ])
+
+        assert result.success_count == 2
+        assert result.error_count == 1
+        assert (service.userdata_dir / "ChampA2.cch").exists()
+        assert (service.userdata_dir / "ChampB2.cch").exists()
+        assert not result.results[2].success
+
+    def test_duplicate_many_rejects_same_target(self, service):
+        """Test that two items targeting the same file both fail."""
+        result = service.duplicate_many([
+            ("ChampA", "Copy"),
+            ("ChampB", "copy"),
+        ])
+
+        assert result.error_count == 2
+        assert not (service.userdata_dir / "Copy.cch").exists()
+
+    def test_delete_many(self, service):
+        """Test deleting several championships at once."""
+        result = service.delete_many(["ChampA", "ChampB", "Missing"])
+
+        assert result.success_count == 2
+        assert result.error_count == 1
+        assert service.list_all() == []
+
+    def test_export_many(self, service):
+        """Test exporting several championships to a zip archive."""
+        content, result = service.export_many(["ChampA", "ChampB", "Missing"])
+
+        assert result.success_count == 2
+        with zipfile.ZipFile(io.BytesIO(content)) as archive:
+            names = archive.namelist()
+            assert "ChampA.cch" in names
+            assert "ChampB.cch" in names
+            assert "export_errors.txt" in names
+            assert archive.read("ChampA.cch") == FIXTURE_CCH.read_bytes()
@@ -0,0 +1,89 @@
+"""Tests for the application event bus."""
+
+import asyncio
+import threading
+
+import pytest
+
+from src.services import event_bus as event_bus_module
+from src.services.event_bus import EventBus, SubscriptionOverflow
+
+
+def _run(coroutine):
+    return asyncio.run(asyncio.wait_for(coroutine, timeout=5))
+
+
+class TestEventBus:
+    """Test suite for EventBus."""
+
+    def test_publish_from_threads(self):
+        """Test that events published by worker threads reach the subscriber in order."""
+        bus = EventBus()
+
+        async def scenario():
+            subscription = bus.subscribe()
+            thread = threading.Thread(target=lambda: [bus.publish("import", {"rows": n}) for n in range(3)])
+            thread.start()
+            events = [await subscription.get() for _ in range(3)]
+            thread.join()
+            subscription.close()
+            return events
+
+        events = _run(scenario())
+
+        assert [event.data["rows"] for event in events] == [0, 1, 2]
+        assert [event.id for event in events] == [1, 2, 3]
+        assert bus.subscriber_count == 0
+
+    def test_type_filter(self):
+        """Test that subscribers only receive the requested event types."""
+        bus = EventBus()
+
+        async def scenario():
+            subscription = bus.subscribe(types={"catalog"})
+            bus.publish("import", {})
+            bus.publish("catalog", {"catalog": "talents"})
+            return await subscription.get()
+
+        assert _run(scenario()).data == {"catalog": "talents"}
+
+    def test_replay_after_reconnection(self):
+        """Test that events after Last-Event-ID are replayed, and too old ids refused."""
+        bus = EventBus(history_size=3)
+        for n in range(5):
+            bus.publish("catalog", {"generation": n})
+
+        async def scenario():
+            subscription = bus.subscribe(last_event_id=3)
+            return [await subscription.get() for _ in range(2)]
+
+        assert [event.id for event in _run(scenario())] == [4, 5]
+
+        async def too_old():
+            bus.subscribe(last_event_id=1)
+
+        with pytest.raises(SubscriptionOverflow):
+            _run(too_old())
+
+        async def from_other_server():
+            bus.subscribe(last_event_id=99)
+
+        with pytest.raises(SubscriptionOverflow):
+            _run(from_other_server())
+
+    def test_slow_subscriber_overflow(self, monkeypatch):
+        """Test that a subscriber missing events is told to resync."""
+        monkeypatch.setattr(event_bus_module, "QUEUE_SIZE", 2)
+        bus = EventBus()
+
+        async def scenario():
+            subscription = bus.subscribe()
+            for n in range(3):
+                bus.publish("import", {"rows": n})
+            await asyncio.sleep(0)
+            with pytest.raises(SubscriptionOverflow):
+                await subscription.get()
+            bus.publish("import", {"rows": 3})
+            return await subscription.get()
+
+        assert _run(scenario()).data == {"rows": 3}
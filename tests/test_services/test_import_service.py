@@ -2,7 +2,9 @@
 
 import pytest
 import tempfile
+import asyncio
 import csv
+import io
 from pathlib import Path
 
 from src.services.import_service import ImportService, ImportResult
@@ -76,7 +78,7 @@ class TestImportService:
         assert talent.personal_info.nationality == 'France'
         assert talent.personal_info.date_of_birth == '15-03-1990'
         assert talent.personal_info.starts == 0
-        assert talent.stats.speed == 50.0  # Default value
+        assert 0.0 <= talent.stats.speed <= 100.0  # Filled by the randomizer
 
     def test_parse_csv_row_full(self, import_service):
         """Test parsing a CSV row with all fields."""
@@ -197,7 +199,7 @@ class TestImportService:
             })
 
         try:
-            result = import_service.import_from_csv(temp_file, skip_existing=False)
+            result = import_service.import_from_csv(temp_file, overwrite_existing=True)
 
             assert result.success_count == 2
             assert result.error_count == 0
@@ -240,7 +242,7 @@ class TestImportService:
             })
 
         try:
-            result = import_service.import_from_csv(temp_file, skip_existing=True)
+            result = import_service.import_from_csv(temp_file, overwrite_existing=False)
 
             assert result.success_count == 0
             assert result.error_count == 1
@@ -447,3 +449,151 @@ class TestImportService:
         assert result.total == 3
         assert len(result.errors) == 1
         assert result.errors[0] == (3, 'Test', 'Error message')
+
+    def test_import_from_stream(self, import_service, talent_service):
+        """Test importing from an open text stream."""
+        stream = io.StringIO(
+            "name,nationality,date_of_birth,speed\n"
+            "Stream Driver,Italy,10-10-1988,85.0\n"
+        )
+
+        result = import_service.import_from_csv(stream)
+
+        assert result.success_count == 1
+        assert talent_service.get('Stream Driver').stats.speed == 85.0
+
+    def test_import_does_not_parse_existing_talents(self, import_service, talent_service, monkeypatch):
+        """Test that existing talents are detected without parsing them."""
+        talent_service.create(Talent(
+            name='Existing Driver',
+            personal_info=TalentPersonalInfo(nationality='France', date_of_birth='01-01-1990'),
+            stats=TalentStats(),
+        ))
+        monkeypatch.setattr(talent_service, 'get', lambda name: pytest.fail("talent parsed"))
+
+        stream = io.StringIO(
+            "name,nationality,date_of_birth\n"
+            "Existing Driver,Germany,02-02-1992\n"
+            "New Driver,Spain,03-03-1993\n"
+        )
+        result = import_service.import_from_csv(stream, overwrite_existing=False)
+
+        assert result.success_count == 1
+        assert result.error_count == 1
+        assert result.errors[0][1] == 'Existing Driver'
+
+    def test_import_duplicate_rows_across_batches(self, import_service, talent_service, monkeypatch):
+        """Test that a name repeated in the CSV is written in row order."""
+        monkeypatch.setattr(ImportService, 'WRITE_BATCH_SIZE', 2)
+        stream = io.StringIO(
+            "name,nationality,date_of_birth\n"
+            "Twice,France,01-01-1990\n"
+            "Other 1,France,01-01-1990\n"
+            "Other 2,France,01-01-1990\n"
+            "Twice,Germany,01-01-1990\n"
+            "Twice,Italy,01-01-1990\n"
+        )
+
+        result = import_service.import_from_csv(stream)
+
+        assert result.success_count == 5
+        assert result.overwrite_count == 2
+        assert [w[0] for w in result.warnings] == [5, 6]
+        assert talent_service.get('Twice').personal_info.nationality == 'Italy'
+
+    def test_import_from_chunks_matches_stream(self, import_service, talent_service):
+        """Test that chunked import splits records like csv.DictReader."""
+        content = (
+            '﻿name,nationality,date_of_birth,speed\r\n'
+            '"Quoted, Driver",France,01-01-1990,80.0\r\n'
+            '\r\n'
+            '"Multi\nLine",Germany,02-02-1992,999.0\r\n'
+            'Last Driver,Italy,03-03-1993,70.0'
+        ).encode('utf-8')
+
+        async def chunks():
+            # Tiny chunks split records, quotes and multi-byte characters
+            for i in range(0, len(content), 3):
+                yield content[i:i + 3]
+
+        result = asyncio.run(import_service.import_from_chunks(chunks(), validate_only=True))
+        expected = import_service.import_from_csv(
+            io.StringIO(content.decode('utf-8-sig'), newline=''), validate_only=True
+        )
+
+        assert result.success_count == expected.success_count == 2
+        assert result.errors == expected.errors
+        assert result.errors[0][0] == 3
+
+    def test_import_from_chunks_stray_quote(self, import_service):
+        """Test that a quote inside an unquoted field doesn't swallow the next rows."""
+        content = (
+            'name,nationality,date_of_birth\n'
+            'Bob 5\'10" Smith,USA,01-01-1990\n'
+            'Next Driver,France,02-02-1992\n'
+            'Last Driver,Italy,03-03-1993\n'
+        ).encode('utf-8')
+
+        async def chunks():
+            for i in range(0, len(content), 7):
+                yield content[i:i + 7]
+
+        result = asyncio.run(import_service.import_from_chunks(chunks(), validate_only=True))
+        expected = import_service.import_from_csv(
+            io.StringIO(content.decode('utf-8'), newline=''), validate_only=True
+        )
+
+        assert result.success_count == expected.success_count == 3
+        assert result.errors == expected.errors == []
+
+    def test_import_from_chunks_empty(self, import_service):
+        """Test that an empty upload is rejected."""
+        async def chunks():
+            return
+            yield
+
+        with pytest.raises(ValueError, match="empty"):
+            asyncio.run(import_service.import_from_chunks(chunks()))
+
+    def test_iter_csv_columns(self, import_service, talent_service):
+        """Test streaming export with a column selection."""
+        talent_service.create(Talent(
+            name='Column Driver',
+            personal_info=TalentPersonalInfo(nationality='France', date_of_birth='01-01-1990'),
+            stats=TalentStats(speed=88.0),
+        ))
+
+        chunks = list(ImportService.iter_csv(import_service.select_talents(), ['name', 'SPEED']))
+
+        assert chunks[0] == 'name,speed\r\n'
+        assert ''.join(chunks[1:]) == 'Column Driver,88.0\r\n'
+
+    def test_select_talents_reads_lazily(self, import_service, monkeypatch):
+        """Test that exporting all talents only reads the catalog when iterated."""
+        catalog = import_service.talent_service.get_catalog()
+        calls = []
+        monkeypatch.setattr(catalog, 'items', lambda: calls.append(1) or [])
+
+        talents = import_service.select_talents()
+        assert calls == []
+
+        assert list(talents) == []
+        assert calls == [1]
+
+    def test_iter_csv_unknown_column(self, import_service):
+        """Test that unknown export columns are rejected."""
+        with pytest.raises(ValueError, match="Unknown columns"):
+            ImportService.validate_export_columns(['name', 'helmet'])
+
+    def test_import_seed_is_reproducible(self, import_service, talent_service):
+        """Test that a seed reproduces the randomly filled fields."""
+        content = "name,nationality,date_of_birth\nSeed A,,\nSeed B,France,\n"
+
+        import_service.import_from_csv(io.StringIO(content), seed=1)
+        first = [t.to_dict() for t in talent_service.list_all_talents()]
+
+        import_service.import_from_csv(io.StringIO(content), seed=1)
+        second = [t.to_dict() for t in talent_service.list_all_talents()]
+
+        assert len(first) == 2
+        assert first == second
@@ -0,0 +1,46 @@
+"""Tests for the .rcd batch writer."""
+
+from src.generators.rcd_generator import RCDGenerator
+from src.models.talent import Talent, TalentPersonalInfo, TalentStats
+from src.parsers.rcd_parser import RCDParser
+from src.services.rcd_batch_writer import RCDBatchWriter
+
+
+def _talent(name):
+    return Talent(
+        name=name,
+        personal_info=TalentPersonalInfo(nationality='French', date_of_birth='01-01-1990', starts=3),
+        stats=TalentStats(speed=71.5),
+    )
+
+
+class TestRCDBatchWriter:
+    """Test suite for RCDBatchWriter."""
+
+    def test_output_matches_generator(self, tmp_path):
+        """Test that batch-written files are identical to RCDGenerator.generate."""
+        talent = _talent('Same Bytes')
+        RCDGenerator.generate(talent, str(tmp_path / 'expected.rcd'))
+
+        RCDBatchWriter(tmp_path / 'Talent').write_many([talent])
+
+        written = (tmp_path / 'Talent' / 'SameBytes.rcd').read_bytes()
+        assert written == (tmp_path / 'expected.rcd').read_bytes()
+        assert b'\r\n' in written and b'\r\r' not in written
+
+    def test_write_many(self, tmp_path):
+        """Test writing many files leaves only complete .rcd files."""
+        talents = [_talent(f'Driver {i}') for i in range(50)]
+
+        result = RCDBatchWriter(tmp_path).write_many(talents)
+
+        assert result.success_count == 50
+        assert sorted(p.name for p in tmp_path.iterdir()) == sorted(t.filename for t in talents)
+        assert RCDParser.parse_file(str(tmp_path / 'Driver7.rcd')).stats.speed == 71.5
+
+    def test_unencodable_talent_fails_alone(self, tmp_path):
+        """Test that a talent cp1252 can't encode is reported without a leftover file."""
+        result = RCDBatchWriter(tmp_path).write_many([_talent('Good One'), _talent('Bad 中')])
+
+        assert [r.success for r in result.results] == [True, False]
+        assert [p.name for p in tmp_path.iterdir()] == ['GoodOne.rcd']
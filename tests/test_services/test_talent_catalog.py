@@ -0,0 +1,43 @@
+"""Tests for the shared talent catalog."""
+
+import pytest
+
+from src.models.talent import Talent, TalentPersonalInfo, TalentStats
+from src.services.talent_service import TalentService
+
+
+def _talent(name, nationality='France', speed=50.0):
+    return Talent(
+        name=name,
+        personal_info=TalentPersonalInfo(nationality=nationality, date_of_birth='01-01-1990'),
+        stats=TalentStats(speed=speed),
+    )
+
+
+class TestTalentCatalog:
+    """Test suite for TalentCatalog through TalentService."""
+
+    @pytest.fixture
+    def talent_service(self, tmp_path):
+        """Create a TalentService on an empty Talent directory."""
+        (tmp_path / "GameData" / "Talent").mkdir(parents=True)
+        (tmp_path / "GameData" / "Talent" / "Dialog.rcd").write_text("Dialog\n{\n}\n")
+        return TalentService(str(tmp_path), validate=False)
+
+    def test_list_excludes_dialog(self, talent_service):
+        """Test that Dialog.rcd is not listed as a talent."""
+        talent_service.create(_talent('Alpha Driver'))
+
+        assert [t.name for t in talent_service.list_all_talents()] == ['Alpha Driver']
+        assert talent_service.get_catalog().by_filename('alphadriver.rcd').name == 'Alpha Driver'
+
+    def test_writes_invalidate_catalog(self, talent_service):
+        """Test that create, update and delete are visible immediately."""
+        talent_service.create(_talent('Beta Driver', speed=60.0))
+        assert talent_service.list_all_talents()[0].stats.speed == 60.0
+
+        talent_service.update(_talent('Beta Driver', speed=75.0))
+        assert talent_service.list_all_talents()[0].stats.speed == 75.0
+
+        talent_service.delete('Beta Driver')
+        assert talent_service.list_all_talents() == []
@@ -0,0 +1,56 @@
+"""Tests for bulk talent generation."""
+
+import pytest
+
+from src.services.talent_service import TalentService
+
+
+class TestGenerateMany:
+    """Test suite for TalentService.generate_many."""
+
+    @pytest.fixture
+    def talent_service(self, tmp_path):
+        """Create a TalentService on an empty Talent directory."""
+        (tmp_path / "GameData" / "Talent").mkdir(parents=True)
+        return TalentService(str(tmp_path), validate=False)
+
+    def test_pattern_skips_taken_numbers(self, talent_service):
+        """Test that pattern names skip numbers already in use."""
+        talent_service.generate_many(names=["AI Driver 2"])
+
+        result, skipped = talent_service.generate_many(count=3, seed=1)
+
+        assert [r.item for r in result.results] == ["AI Driver 1", "AI Driver 3", "AI Driver 4"]
+        assert skipped == []
+        assert len(talent_service.list_all_talents()) == 4
+
+    def test_names_collisions_are_skipped(self, talent_service):
+        """Test that existing and repeated names are reported as skipped."""
+        talent_service.generate_many(names=["Known Driver"])
+
+        result, skipped = talent_service.generate_many(names=["knowndriver", "Fresh", "Fresh"])
+
+        assert result.success_count == 1
+        assert skipped == ["knowndriver", "Fresh"]
+
+    def test_nationality_mix_and_seed(self, talent_service, tmp_path):
+        """Test that the nationality mix is applied and seeds are reproducible."""
+        result, _ = talent_service.generate_many(
+            count=20, name_pattern="Seeded {n}", nationality_mix={"French": 1}, seed=9
+        )
+        first = {t.name: t.stats.speed for t in talent_service.list_all_talents()}
+        assert {t.personal_info.nationality for t in talent_service.list_all_talents()} == {"French"}
+
+        other = TalentService(str(tmp_path), validate=False)
+        for name in first:
+            other.delete(name)
+        other.generate_many(count=20, name_pattern="Seeded {n}", nationality_mix={"French": 1}, seed=9)
+
+        assert {t.name: t.stats.speed for t in other.list_all_talents()} == first
+
+    def test_invalid_arguments(self, talent_service):
+        """Test argument validation."""
+        with pytest.raises(ValueError, match="{n}"):
+            talent_service.generate_many(count=2, name_pattern="No number")
+        with pytest.raises(ValueError, match="count"):
+            talent_service.generate_many()
@@ -0,0 +1,80 @@
+"""Tests for the columnar talent stats store."""
+
+import pytest
+
+from src.models.talent import Talent, TalentPersonalInfo, TalentStats
+from src.services import talent_stats_store
+from src.services.talent_service import TalentService
+from src.services.talent_stats_store import TalentStatsStore
+
+
+def _talent(name, nationality, speed, wins=0):
+    return Talent(
+        name=name,
+        personal_info=TalentPersonalInfo(nationality=nationality, date_of_birth='01-01-1990', wins=wins),
+        stats=TalentStats(speed=speed),
+    )
+
+
+TALENTS = [
+    _talent('A', 'France', 10.0, wins=1),
+    _talent('B', 'France', 20.0, wins=3),
+    _talent('C', 'Germany', 40.0),
+    _talent('D', 'Italy', 100.0, wins=8),
+]
+
+
+@pytest.fixture(params=["numpy", "python"])
+def store(request, monkeypatch):
+    """Build the store with NumPy (when installed) and with the pure-Python fallback."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(talent_stats_store, "np", None)
+    return TalentStatsStore.from_talents(TALENTS)
+
+
+class TestTalentStatsStore:
+    """Test suite for TalentStatsStore."""
+
+    def test_summary(self, store):
+        """Test mean, bounds and interpolated percentiles."""
+        summary = store.summary('speed', [0, 50, 75])
+
+        assert summary['count'] == 4
+        assert summary['mean'] == pytest.approx(42.5)
+        assert (summary['min'], summary['max']) == (10.0, 100.0)
+        assert summary['percentiles'] == pytest.approx({'p0': 10.0, 'p50': 30.0, 'p75': 55.0})
+
+    def test_histogram_includes_upper_edge(self, store):
+        """Test that the last bin includes 100."""
+        histogram = store.histogram('speed', bins=4)
+
+        assert histogram['edges'] == [0.0, 25.0, 50.0, 75.0, 100.0]
+        assert histogram['counts'] == [2, 1, 0, 1]
+
+    def test_by_nationality_and_select(self, store):
+        """Test per-nationality means and nationality filtering."""
+        groups = store.by_nationality(['speed', 'wins'])
+
+        assert groups[0] == {'nationality': 'France', 'count': 2, 'means': {'speed': 15.0, 'wins': 2.0}}
+        assert [g['nationality'] for g in groups[1:]] == ['Germany', 'Italy']
+
+        french = store.select(nationality='france')
+        assert len(french) == 2
+        assert french.summary('speed')['max'] == 20.0
+        assert len(store.select(nationality='Martian')) == 0
+
+
+def test_catalog_store_follows_writes(tmp_path):
+    """Test that the shared store is rebuilt only when talents change."""
+    (tmp_path / "GameData" / "Talent").mkdir(parents=True)
+    service = TalentService(str(tmp_path), validate=False)
+    service.create(TALENTS[0])
+
+    first = service.get_stats_store()
+    assert len(first) == 1
+    assert service.get_stats_store() is first
+
+    service.create(TALENTS[1])
+    assert len(service.get_stats_store()) == 2
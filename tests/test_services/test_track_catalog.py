@@ -0,0 +1,133 @@
+"""Tests for the shared track catalog."""
+
+import os
+
+import pytest
+
+from src.services.track_catalog import TrackCatalog
+from src.utils.installation_stats import InstallationStats
+
+
+GDB_TEMPLATE = """{name}
+{{
+  TrackName = {track}
+  VenueName = {venue}
+  Layout = {layout}
+  Location = Somewhere
+}}
+"""
+
+
+def _write_gdb(path, track, venue, layout):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(GDB_TEMPLATE.format(name=path.stem, track=track, venue=venue, layout=layout))
+
+
+class TestTrackCatalog:
+    """Test suite for TrackCatalog."""
+
+    @pytest.fixture
+    def locations(self, tmp_path):
+        """Create a Locations tree with two venues."""
+        locations = tmp_path / "GameData" / "Locations"
+        _write_gdb(locations / "Toban" / "Toban_Long.gdb", "Toban Long", "Toban", "Long")
+        _write_gdb(locations / "Toban" / "Toban_Short.gdb", "Toban Short", "Toban", "Short")
+        _write_gdb(locations / "Joesville" / "Joesville.gdb", "Joesville Speedway", "Joesville", "Oval")
+        return locations
+
+    def test_items_and_venues(self, locations):
+        """Test listing tracks and grouping them by venue."""
+        catalog = TrackCatalog(locations)
+
+        tracks = catalog.items()
+        assert [t.relative_path for t in tracks] == [
+            "Joesville/Joesville.gdb",
+            "Toban/Toban_Long.gdb",
+            "Toban/Toban_Short.gdb",
+        ]
+
+        venues = catalog.venues()
+        assert [v["venue_name"] for v in venues] == ["Joesville", "Toban"]
+        assert venues[1]["layouts"] == ["Long", "Short"]
+        assert venues[1]["track_count"] == 2
+        assert len(catalog.by_venue("toban")) == 2
+
+    def test_index_is_reused(self, locations, tmp_path, monkeypatch):
+        """Test that a new catalog loads unchanged tracks from the index."""
+        index_path = tmp_path / "cache" / "tracks_index.json"
+        TrackCatalog(locations, index_path).items()
+        assert index_path.exists()
+
+        catalog = TrackCatalog(locations, index_path)
+        monkeypatch.setattr(catalog, "parse", lambda *args: pytest.fail("unchanged file re-parsed"))
+
+        assert len(catalog.items()) == 3
+        assert catalog.get("Toban/Toban_Short.gdb").layout == "Short"
+
+    def test_modified_file_is_reparsed(self, locations, tmp_path):
+        """Test that only files whose mtime changed are parsed again."""
+        index_path = tmp_path / "cache" / "tracks_index.json"
+        TrackCatalog(locations, index_path).items()
+
+        gdb = locations / "Toban" / "Toban_Short.gdb"
+        _write_gdb(gdb, "Toban Club", "Toban", "Club")
+        stat = gdb.stat()
+        os.utime(gdb, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        catalog = TrackCatalog(locations, index_path)
+        assert catalog.get("Toban/Toban_Short.gdb").layout == "Club"
+
+    def test_removed_file_is_dropped(self, locations):
+        """Test that a forced reload drops deleted tracks."""
+        catalog = TrackCatalog(locations)
+        catalog.items()
+        generation = catalog.generation
+
+        (locations / "Joesville" / "Joesville.gdb").unlink()
+
+        assert len(catalog.items(force_reload=True)) == 2
+        assert catalog.generation > generation
+        assert catalog.by_venue("Joesville") == []
+
+    def test_change_events(self, locations, monkeypatch):
+        """Test that each new generation publishes a "catalog" event."""
+        import src.services.catalog as catalog_module
+        from src.services.event_bus import EventBus
+
+        bus = EventBus()
+        published = []
+        monkeypatch.setattr(bus, "publish", lambda event_type, data: published.append((event_type, data)))
+        monkeypatch.setattr(catalog_module, "get_event_bus", lambda: bus)
+
+        catalog = TrackCatalog(locations)
+        catalog.items()
+        assert not catalog.is_stale()
+        catalog.items()
+        assert len(published) == 1
+
+        (locations / "Joesville" / "Joesville.gdb").unlink()
+        _write_gdb(locations / "Nowhere" / "Nowhere.gdb", "Nowhere", "Nowhere", "Full")
+        assert catalog.is_stale()
+        catalog.items()
+
+        event_type, data = published[-1]
+        assert event_type == "catalog"
+        assert data["catalog"] == "locations"
+        assert data["generation"] == catalog.generation
+        assert data["changed"] == ["Nowhere/Nowhere.gdb"]
+        assert data["removed"] == ["Joesville/Joesville.gdb"]
+        assert not data["truncated"]
+
+    def test_live_counts(self, locations, monkeypatch):
+        """Test that InstallationStats uses a loaded catalog."""
+        import src.services.track_catalog as track_catalog
+
+        catalog = TrackCatalog(locations)
+        catalog.items()
+        key = os.path.normcase(os.path.abspath(str(locations)))
+        monkeypatch.setitem(track_catalog._catalogs, key, catalog)
+
+        counts, source = InstallationStats(str(locations.parent.parent)).location_counts()
+
+        assert source == "catalog"
+        assert counts == {"Joesville": 1, "Toban": 2}
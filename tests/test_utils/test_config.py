@@ -0,0 +1,69 @@
+"""Tests for configuration snapshots."""
+
+import json
+
+import pytest
+
+from src.utils.config import Config
+
+
+class TestConfigSnapshot:
+    """Test suite for Config snapshots and saving."""
+
+    @pytest.fixture
+    def config(self, tmp_path):
+        """Create a Config backed by a temporary file."""
+        return Config(str(tmp_path / "config.json"))
+
+    def test_snapshot_is_read_only(self, config):
+        """Test that snapshots can't be modified in place."""
+        bounds = config.snapshot().randomizer_bounds
+
+        with pytest.raises(TypeError):
+            bounds["speed_variance"] = 1
+        with pytest.raises(TypeError):
+            bounds["overall_skill"]["min"] = 0
+
+    def test_writers_publish_new_snapshot(self, config):
+        """Test that updates publish a new version and keep old snapshots intact."""
+        before = config.snapshot()
+        bounds = config.get_randomizer_bounds()
+        bounds["speed_variance"] = 3
+
+        config.set_randomizer_bounds(bounds)
+
+        assert config.version > before.version
+        assert before.randomizer_bounds["speed_variance"] == 8
+        assert config.snapshot().randomizer_bounds["speed_variance"] == 3
+
+    def test_save_is_atomic(self, config, tmp_path):
+        """Test that saving replaces the file and leaves no temp file."""
+        config.set_current_player("Player One")
+
+        assert json.loads((tmp_path / "config.json").read_text())["current_player"] == "Player One"
+        assert [p.name for p in tmp_path.iterdir()] == ["config.json"]
+        assert Config(str(tmp_path / "config.json")).get_current_player() == "Player One"
+
+    def test_sees_changes_saved_by_another_process(self, tmp_path):
+        """Test that a Config reloads the file replaced by another Config (another worker)."""
+        first = Config(str(tmp_path / "config.json"))
+        second = Config(str(tmp_path / "config.json"))
+        version = second.version
+
+        first.set_current_player("Player One")
+
+        assert second.get_current_player() == "Player One"
+        assert second.version > version
+
+    def test_update_keeps_values_saved_by_another_process(self, tmp_path):
+        """Test that an update doesn't overwrite the other keys saved meanwhile."""
+        first = Config(str(tmp_path / "config.json"))
+        second = Config(str(tmp_path / "config.json"))
+
+        first.set_current_player("Player One")
+        second.add_recent_championship("Endurance")
+
+        saved = json.loads((tmp_path / "config.json").read_text())
+        assert saved["current_player"] == "Player One"
+        assert saved["recent_championships"] == ["Endurance"]
+        assert first.get_recent_championships() == ["Endurance"]
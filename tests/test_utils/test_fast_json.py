@@ -0,0 +1,66 @@
+"""Tests for the fast JSON serialization of large responses."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.models.vehicle import VehicleTeamInfo
+from src.web import fast_json
+from src.web.fast_json import FastJSONResponse, dumps
+from src.web.schemas.talent import TalentListItemSchema
+
+CONTENT = {
+    "name": "Séb Lëger",
+    "speed": 71.5,
+    "number": 27,
+    "flags": [True, False, None],
+    "nested": {"records": ["a", "b"], "empty": {}},
+}
+
+
+@pytest.fixture(params=["orjson", "json"])
+def encoder(request, monkeypatch):
+    """Run each test with orjson (when installed) and with the json fallback."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+        monkeypatch.setattr(fast_json, "orjson", fast_json._UNSET)
+    else:
+        monkeypatch.setattr(fast_json, "orjson", None)
+    return request.param
+
+
+class TestDumps:
+    """Test suite for dumps."""
+
+    def test_matches_json_response(self, encoder):
+        """Test that the output is the compact UTF-8 JSON of FastAPI's JSONResponse."""
+        expected = json.dumps(CONTENT, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+        assert dumps(CONTENT) == expected
+
+    def test_non_native_objects(self, encoder):
+        """Test that dataclasses, models and paths are encoded."""
+        content = {
+            "team": VehicleTeamInfo(team="Campana", driver="Test Driver"),
+            "talent": TalentListItemSchema(name="A", nationality="France", speed=60),
+            "path": Path("Vehicles") / "car.veh",
+        }
+
+        decoded = json.loads(dumps(content))
+
+        assert decoded["team"]["driver"] == "Test Driver"
+        assert decoded["talent"] == {"name": "A", "nationality": "France", "speed": 60.0, "crash": 50.0, "aggression": 50.0}
+        assert decoded["path"] == str(Path("Vehicles") / "car.veh")
+
+
+class TestFastJSONResponse:
+    """Test suite for FastJSONResponse."""
+
+    def test_response(self, encoder):
+        """Test the body and content type of the response."""
+        response = FastJSONResponse([CONTENT])
+
+        assert response.media_type == "application/json"
+        assert response.headers["content-type"] == "application/json"
+        assert json.loads(response.body) == [CONTENT]
@@ -0,0 +1,58 @@
+"""Tests for the installation cache."""
+
+import time
+import pytest
+from unittest.mock import patch
+
+from src.utils.installation_cache import InstallationCache
+from src.utils.rfactor_validator import RFactorValidator, RFactorValidationError
+
+
+class TestInstallationCache:
+    """Test suite for InstallationCache."""
+
+    @pytest.fixture
+    def rfactor_dir(self, tmp_path):
+        """Create a minimal valid rFactor installation."""
+        (tmp_path / "rFactor.exe").touch()
+        (tmp_path / "UserData").mkdir()
+        for item in ("Talent", "Vehicles", "Locations"):
+            (tmp_path / "GameData" / item).mkdir(parents=True)
+        (tmp_path / "GameData" / "Talent" / "A.rcd").touch()
+        return tmp_path
+
+    def test_validate_is_cached(self, rfactor_dir):
+        """Test that a second validation doesn't hit the filesystem checks."""
+        cache = InstallationCache()
+        assert cache.validate(str(rfactor_dir)) == (True, [])
+
+        with patch.object(RFactorValidator, "validate", side_effect=AssertionError("not cached")):
+            assert cache.validate(str(rfactor_dir)) == (True, [])
+
+    def test_validate_detects_changes(self, rfactor_dir):
+        """Test that removing a required directory invalidates the cached result."""
+        cache = InstallationCache()
+        assert cache.validate(str(rfactor_dir))[0] is True
+
+        (rfactor_dir / "UserData").rmdir()
+
+        is_valid, missing = cache.validate(str(rfactor_dir))
+        assert is_valid is False
+        assert "UserData" in missing
+        with pytest.raises(RFactorValidationError):
+            cache.validate_or_raise(str(rfactor_dir))
+
+    def test_version_info_refreshes_in_background(self, rfactor_dir):
+        """Test that counts are served from cache and refreshed after changes."""
+        cache = InstallationCache()
+        assert cache.get_version_info(str(rfactor_dir))["talent_count"] == 1
+
+        (rfactor_dir / "GameData" / "Talent" / "B.rcd").touch()
+
+        # Stale value is returned immediately, refresh happens in the background
+        assert cache.get_version_info(str(rfactor_dir))["talent_count"] == 1
+        for _ in range(100):
+            if cache.get_version_info(str(rfactor_dir))["talent_count"] == 2:
+                break
+            time.sleep(0.01)
+        assert cache.get_version_info(str(rfactor_dir))["talent_count"] == 2
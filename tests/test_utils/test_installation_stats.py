@@ -0,0 +1,73 @@
+"""Tests for installation statistics."""
+
+import pytest
+
+from src.utils.installation_stats import (
+    InstallationStats,
+    count_files_by_top_level,
+    register_live_counts,
+    unregister_live_counts,
+)
+
+
+class TestInstallationStats:
+    """Test suite for InstallationStats."""
+
+    @pytest.fixture
+    def gamedata(self, tmp_path):
+        """Create a GameData tree with a few mods and tracks."""
+        gamedata = tmp_path / "GameData"
+        for rel in (
+            "Vehicles/ModA/Team1/car1.veh",
+            "Vehicles/ModA/Team2/car2.VEH",
+            "Vehicles/ModB/All_Teams/T/car3.veh",
+            "Vehicles/ModB/shared.hdv",
+            "Locations/Toban/Toban.gdb",
+            "Locations/Toban/Toban_Short.gdb",
+            "Talent/A.rcd",
+            "Talent/B.rcd",
+            "Talent/Dialog.rcd",
+        ):
+            path = gamedata / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.touch()
+        (gamedata / "Vehicles" / "Empty").mkdir()
+        return tmp_path
+
+    def test_count_files_by_top_level(self, gamedata):
+        """Test per-mod counting is recursive and case-insensitive."""
+        counts = count_files_by_top_level(str(gamedata / "GameData" / "Vehicles"), ".veh")
+
+        assert counts == {"ModA": 2, "ModB": 1}
+
+    def test_collect_from_filesystem(self, gamedata):
+        """Test collecting counts without live catalogs."""
+        stats = InstallationStats(str(gamedata)).collect()
+
+        assert stats["talent_count"] == 2
+        assert stats["vehicle_count"] == 3
+        assert stats["location_count"] == 2
+        assert stats["locations_by_mod"] == {"Toban": 2}
+        assert stats["count_sources"]["vehicles"] == "filesystem"
+
+    def test_collect_prefers_live_catalog(self, gamedata):
+        """Test that a registered catalog is used instead of walking the tree."""
+        register_live_counts("vehicles", lambda path: {"FromCatalog": 42})
+        try:
+            stats = InstallationStats(str(gamedata)).collect()
+        finally:
+            unregister_live_counts("vehicles")
+
+        assert stats["vehicle_count"] == 42
+        assert stats["count_sources"]["vehicles"] == "catalog"
+
+    def test_live_catalog_without_data_falls_back(self, gamedata):
+        """Test that a provider returning None falls back to the filesystem."""
+        register_live_counts("locations", lambda path: None)
+        try:
+            stats = InstallationStats(str(gamedata)).collect()
+        finally:
+            unregister_live_counts("locations")
+
+        assert stats["location_count"] == 2
+        assert stats["count_sources"]["locations"] == "filesystem"
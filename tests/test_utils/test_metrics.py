@@ -0,0 +1,59 @@
+"""Tests for the metrics registry and timed spans."""
+
+import pytest
+
+from src.utils.metrics import MetricsRegistry, SPAN_DURATION, span
+
+
+class TestMetricsRegistry:
+    """Test suite for MetricsRegistry."""
+
+    def test_counter_render(self):
+        """Test that counters are rendered per label set with escaped values."""
+        registry = MetricsRegistry()
+        counter = registry.counter("files_total", "Files", ("kind",))
+        counter.inc(kind="veh")
+        counter.inc(2, kind='a"b')
+
+        text = registry.render()
+
+        assert "# TYPE files_total counter" in text
+        assert 'files_total{kind="veh"} 1' in text
+        assert 'files_total{kind="a\\"b"} 2' in text
+        assert registry.counter("files_total", "Files", ("kind",)) is counter
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Test that histogram buckets, sum and count follow the Prometheus format."""
+        registry = MetricsRegistry()
+        histogram = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 5.0):
+            histogram.observe(value)
+
+        lines = registry.render().splitlines()
+
+        assert 'latency_seconds_bucket{le="0.1"} 1' in lines
+        assert 'latency_seconds_bucket{le="1"} 2' in lines
+        assert 'latency_seconds_bucket{le="+Inf"} 3' in lines
+        assert "latency_seconds_sum 5.55" in lines
+        assert "latency_seconds_count 3" in lines
+
+    def test_labels_are_checked(self):
+        """Test that updates with the wrong labels are rejected."""
+        registry = MetricsRegistry()
+        counter = registry.counter("files_total", "Files", ("kind",))
+
+        with pytest.raises(ValueError):
+            counter.inc(type="veh")
+        with pytest.raises(ValueError):
+            registry.histogram("files_total", "Files", ("kind",))
+
+
+def test_span_records_failures():
+    """Test that a span is recorded even when the timed block raises."""
+    count, _ = SPAN_DURATION.stats(span="test.failing")
+
+    with pytest.raises(RuntimeError):
+        with span("test.failing"):
+            raise RuntimeError("boom")
+
+    assert SPAN_DURATION.stats(span="test.failing")[0] == count + 1
@@ -0,0 +1,43 @@
+"""Tests for the sampling profiler."""
+
+import threading
+
+import pytest
+
+from src.utils.profiler import ProfilerBusyError, SamplingProfiler
+
+
+def _busy_loop(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(range(1000))
+
+
+class TestSamplingProfiler:
+    """Test suite for SamplingProfiler."""
+
+    def test_collapsed_stacks(self):
+        """Test that stacks of other threads are captured in collapsed format."""
+        stop = threading.Event()
+        thread = threading.Thread(target=_busy_loop, args=(stop,), name="busy-worker")
+        thread.start()
+        try:
+            profiler = SamplingProfiler(interval=0.001).run(0.2)
+        finally:
+            stop.set()
+            thread.join()
+
+        lines = profiler.collapsed().splitlines()
+        busy = [line for line in lines if line.startswith("busy-worker;")]
+
+        assert profiler.samples > 0
+        assert busy and all("_busy_loop (test_profiler.py:" in line for line in busy)
+        assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+
+    def test_single_profile_at_a_time(self):
+        """Test that a second concurrent profile is refused."""
+        SamplingProfiler._running.acquire()
+        try:
+            with pytest.raises(ProfilerBusyError):
+                SamplingProfiler().run(0.01)
+        finally:
+            SamplingProfiler._running.release()
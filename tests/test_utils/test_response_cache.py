@@ -0,0 +1,141 @@
+"""Tests for the response cache of read endpoints."""
+
+import asyncio
+import json
+
+import pytest
+
+from src.utils import config as config_module
+from src.utils.config import Config
+from src.web import response_cache
+from src.web.response_cache import (
+    ResponseCache,
+    cached_response,
+    get_response_cache,
+    invalidates_response_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """Use a fresh cache and configuration for each test."""
+    monkeypatch.setattr(response_cache, "_cache_instance", ResponseCache())
+    monkeypatch.setattr(config_module, "_config_instance", Config(config_file=str(tmp_path / "config.json")))
+
+
+class TestResponseCache:
+    """Test suite for ResponseCache."""
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entries are evicted first."""
+        cache = ResponseCache(max_entries=2)
+        cache.put("a", "vehicles", b"1")
+        cache.put("b", "vehicles", b"2")
+        assert cache.get("a") == b"1"
+
+        cache.put("c", "tracks", b"3")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == b"1"
+        assert len(cache) == 2
+
+    def test_invalidate_tags(self):
+        """Test that invalidating a tag drops its entries and bumps its version."""
+        cache = ResponseCache()
+        cache.put("a", "vehicles", b"1")
+        cache.put("b", "tracks", b"2")
+
+        cache.invalidate("vehicles")
+
+        assert cache.get("a") is None
+        assert cache.get("b") == b"2"
+        assert cache.version("vehicles") == 1
+        assert cache.version("tracks") == 0
+
+        cache.invalidate()
+        assert len(cache) == 0
+        assert cache.version("tracks") == 1
+
+
+class TestCachedResponse:
+    """Test suite for the cached_response decorator."""
+
+    def _endpoint(self, state):
+        calls = []
+
+        @cached_response("vehicles", lambda: state["generation"])
+        async def endpoint(vehicle_class=None, reload: bool = False):
+            calls.append(vehicle_class)
+            return {"class": vehicle_class, "generation": state["generation"]}
+
+        return endpoint, calls
+
+    def test_hit_and_state_change(self):
+        """Test that results are reused until the data state changes."""
+        state = {"generation": 1}
+        endpoint, calls = self._endpoint(state)
+
+        first = asyncio.run(endpoint(vehicle_class="GT1"))
+        second = asyncio.run(endpoint(vehicle_class="GT1"))
+        other = asyncio.run(endpoint(vehicle_class="GT2"))
+        assert first.body == second.body
+        assert json.loads(other.body) == {"class": "GT2", "generation": 1}
+        assert calls == ["GT1", "GT2"]
+
+        state["generation"] = 2
+        third = asyncio.run(endpoint(vehicle_class="GT1"))
+        assert json.loads(third.body) == {"class": "GT1", "generation": 2}
+        assert calls == ["GT1", "GT2", "GT1"]
+
+    def test_reload_bypasses_cache(self):
+        """Test that reload=True always calls the endpoint."""
+        endpoint, calls = self._endpoint({"generation": 1})
+
+        asyncio.run(endpoint(vehicle_class="GT1"))
+        asyncio.run(endpoint(vehicle_class="GT1", reload=True))
+
+        assert calls == ["GT1", "GT1"]
+
+    def test_write_endpoint_invalidates(self):
+        """Test that a write endpoint invalidates the cached reads of its tag."""
+        endpoint, calls = self._endpoint({"generation": 1})
+
+        @invalidates_response_cache("vehicles")
+        async def update():
+            raise RuntimeError("partial write")
+
+        asyncio.run(endpoint())
+        with pytest.raises(RuntimeError):
+            asyncio.run(update())
+        asyncio.run(endpoint())
+
+        assert calls == [None, None]
+        assert get_response_cache().version("vehicles") == 1
+
+    def test_state_failure_calls_endpoint(self):
+        """Test that the endpoint runs uncached when the state is unavailable."""
+        def state():
+            raise RuntimeError("not configured")
+
+        @cached_response("vehicles", state)
+        async def endpoint():
+            return {"ok": True}
+
+        assert asyncio.run(endpoint()) == {"ok": True}
+        assert len(get_response_cache()) == 0
+
+    def test_championships_state_sees_in_place_rewrites(self, tmp_path, monkeypatch):
+        """Test that rewriting a .cch file in place changes the championship state."""
+        from src.services.championship_service import ChampionshipService
+        from src.web.routes import championships
+
+        service = ChampionshipService(str(tmp_path), "Player", validate=False)
+        monkeypatch.setattr(championships, "get_championship_service", lambda: service)
+        service.userdata_dir.mkdir(parents=True, exist_ok=True)
+        cch = service.userdata_dir / "Champ.cch"
+        cch.write_text("CurrentRace=0\n")
+
+        before = championships._championships_state()
+        cch.write_text("CurrentRace=17\n")
+
+        assert championships._championships_state() != before
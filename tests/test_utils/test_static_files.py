@@ -0,0 +1,84 @@
+"""Tests for the static files with precompressed variants."""
+
+import gzip
+import os
+
+import pytest
+from starlette.applications import Starlette
+from starlette.routing import Mount
+from starlette.testclient import TestClient
+
+from src.web.static_files import IMMUTABLE_CACHE_CONTROL, CachedStaticFiles
+
+SCRIPT = b"console.log('rFactor');\n" * 200
+
+
+@pytest.fixture
+def assets_dir(tmp_path):
+    """Build directory with a script, its .gz variant and a fake .br variant."""
+    (tmp_path / "index-abc123.js").write_bytes(SCRIPT)
+    (tmp_path / "index-abc123.js.gz").write_bytes(gzip.compress(SCRIPT))
+    (tmp_path / "index-abc123.js.br").write_bytes(b"brotli-bytes")
+    (tmp_path / "plain.css").write_bytes(b"body { color: red; }")
+    return tmp_path
+
+
+@pytest.fixture
+def client(assets_dir):
+    app = Starlette(routes=[
+        Mount("/assets", CachedStaticFiles(directory=str(assets_dir), cache_control=IMMUTABLE_CACHE_CONTROL)),
+    ])
+    return TestClient(app)
+
+
+def _raw_get(client, url, accept_encoding, **headers):
+    """GET without decoding the body (httpx would decompress it)."""
+    with client.stream("GET", url, headers={"Accept-Encoding": accept_encoding, **headers}) as response:
+        return response, b"".join(response.iter_raw())
+
+
+class TestCachedStaticFiles:
+    """Test suite for CachedStaticFiles."""
+
+    def test_serves_preferred_variant(self, client):
+        """Test that brotli is preferred, then gzip, with the original type."""
+        response, body = _raw_get(client, "/assets/index-abc123.js", "gzip, deflate, br")
+        assert response.headers["content-encoding"] == "br"
+        assert body == b"brotli-bytes"
+        assert response.headers["content-type"].startswith(("text/javascript", "application/javascript"))
+
+        response, body = _raw_get(client, "/assets/index-abc123.js", "gzip")
+        assert response.headers["content-encoding"] == "gzip"
+        assert gzip.decompress(body) == SCRIPT
+
+    def test_identity_and_refused_encodings(self, client):
+        """Test that the original file is served when no variant is accepted."""
+        for accept_encoding in ("identity", "br;q=0, gzip;q=0"):
+            response, body = _raw_get(client, "/assets/index-abc123.js", accept_encoding)
+            assert "content-encoding" not in response.headers
+            assert body == SCRIPT
+
+    def test_stale_variant_ignored(self, client, assets_dir):
+        """Test that variants older than their file are not served."""
+        original = assets_dir / "index-abc123.js"
+        for suffix in (".gz", ".br"):
+            os.utime(original.with_name(original.name + suffix), (0, 0))
+
+        response, body = _raw_get(client, "/assets/index-abc123.js", "gzip, br")
+
+        assert "content-encoding" not in response.headers
+        assert body == SCRIPT
+
+    def test_cache_headers(self, client):
+        """Test the Cache-Control, Vary and ETag revalidation of the variants."""
+        response, _ = _raw_get(client, "/assets/index-abc123.js", "gzip")
+        assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+        assert "Accept-Encoding" in response.headers["vary"]
+
+        revalidated, _ = _raw_get(client, "/assets/index-abc123.js", "gzip", **{"If-None-Match": response.headers["etag"]})
+        assert revalidated.status_code == 304
+        assert revalidated.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+
+        plain = client.get("/assets/plain.css")
+        assert plain.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+        assert client.get("/assets/missing.js").status_code == 404
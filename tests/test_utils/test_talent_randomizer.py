@@ -0,0 +1,87 @@
+"""Tests for the talent randomizer."""
+
+import random
+
+import pytest
+
+import src.utils.talent_randomizer as talent_randomizer
+from src.models.talent import TalentPersonalInfo, TalentStats
+from src.utils.talent_randomizer import CAREER_FIELDS, RACING_STAT_FIELDS, TalentRandomizer, make_rng
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    """Run a test with the NumPy backend (if installed) and the pure-Python one."""
+    if request.param == "numpy":
+        if talent_randomizer._numpy() is None:
+            pytest.skip("NumPy not installed")
+    else:
+        monkeypatch.setattr(talent_randomizer, "np", None)
+    return request.param
+
+
+class TestGenerateBatch:
+    """Test suite for TalentRandomizer.generate_batch."""
+
+    def test_batch_is_reproducible(self, backend):
+        """Test that the same seed gives the same batch."""
+        first = TalentRandomizer.generate_batch(50, seed=42)
+        second = TalentRandomizer.generate_batch(50, seed=42)
+
+        assert list(first.rows()) == list(second.rows())
+        assert first.column("speed") != TalentRandomizer.generate_batch(50, seed=43).column("speed")
+
+    def test_batch_rows_are_valid_talents(self, backend):
+        """Test that every generated row passes model validation."""
+        batch = TalentRandomizer.generate_batch(500, seed=1)
+
+        assert len(batch) == 500
+        for row in batch.rows():
+            TalentStats(**{f: row[f] for f in RACING_STAT_FIELDS})
+            TalentPersonalInfo(
+                nationality=row["nationality"],
+                date_of_birth=row["date_of_birth"],
+                **{f: row[f] for f in CAREER_FIELDS},
+            )
+            assert 75.0 <= row["completed_laps"] <= 99.0
+            assert row["wins"] <= row["poles"] <= row["starts"]
+
+    def test_batch_racing_stats_only(self, backend):
+        """Test generating racing stats only."""
+        batch = TalentRandomizer.generate_batch(3, seed=7, include_career=False)
+
+        assert list(batch.columns) == RACING_STAT_FIELDS
+        assert all(isinstance(v, float) for v in batch.column("speed"))
+
+
+class TestInjectableRng:
+    """Test suite for seeded/injected random generators."""
+
+    def test_seeded_generators_are_reproducible(self):
+        """Test that equal seeds give equal results for the scalar API."""
+        assert TalentRandomizer.random_stats(rng=random.Random(3)) == TalentRandomizer.random_stats(rng=random.Random(3))
+        assert (
+            TalentRandomizer.random_racing_stats(rng=make_rng(3))
+            == TalentRandomizer.random_racing_stats(rng=make_rng(3))
+        )
+
+    def test_fill_missing_fields_with_rng(self):
+        """Test that filled fields only depend on the injected generator."""
+        data = {"name": "Partial", "speed": 80.0, "nationality": None}
+
+        first = TalentRandomizer.fill_missing_fields(data, rng=random.Random(11))
+        second = TalentRandomizer.fill_missing_fields(data, rng=random.Random(11))
+
+        assert first == second
+        assert first["speed"] == 80.0
+        assert first["nationality"] in TalentRandomizer.NATIONALITIES
+
+    def test_numpy_generator_is_accepted(self):
+        """Test that a numpy.random.Generator can be injected."""
+        np = pytest.importorskip("numpy")
+
+        stats = TalentRandomizer.random_stats(rng=np.random.default_rng(5))
+        again = TalentRandomizer.random_stats(rng=np.random.default_rng(5))
+
+        assert stats == again
+        assert isinstance(stats["personal_info"]["starts"], int)